@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Sequence, cast
 
 import numpy as np
 import xarray as xr
@@ -87,6 +87,11 @@ class MyImage(ImageBase):
         """Unique identifier for the imaging device"""
         return self._meta["camera_id"]
 
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Data type of the stored values"""
+        return self._data.dtype
+
     # Required methods (all must be implemented)
 
     def to_display(self, equalize: bool = True) -> Image.Image:
@@ -107,9 +112,18 @@ class MyImage(ImageBase):
         rgb_uint8 = (rgb_data * 255).astype(np.uint8)
         return Image.fromarray(rgb_uint8)
 
-    def to_numpy(self, nan_value: float | None = None) -> NDArray[np.floating[Any]]:
+    def to_numpy(
+        self,
+        nan_value: float | None = None,
+        *,
+        copy: bool = True,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
         """Convert to numpy array"""
-        result = self._data.copy()
+        data = self._data if bands is None else self._data[:, :, list(bands)]
+        if not copy and nan_value is None:
+            return data
+        result = data.copy()
         if nan_value is not None:
             result[np.isnan(result)] = nan_value
         return result
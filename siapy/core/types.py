@@ -5,7 +5,7 @@ for spectral images, arrays, and data containers to ensure type safety
 and consistency across the codebase.
 """
 
-from typing import Any, Sequence
+from typing import Any, Literal, Sequence
 
 import numpy as np
 import pandas as pd
@@ -25,6 +25,7 @@ __all__ = [
     "ImageContainerType",
     "ArrayLike1dType",
     "ArrayLike2dType",
+    "ChunksType",
 ]
 
 SpectralLibType = sp.io.envi.BilFile | sp.io.envi.BipFile | sp.io.envi.BsqFile
@@ -47,3 +48,4 @@ ImageDataType = (
 ImageContainerType = SpectralImage[Any] | SpectralImageSet
 ArrayLike1dType = NDArray[np.floating[Any]] | pd.Series | Sequence[Any] | ArrayLike
 ArrayLike2dType = NDArray[np.floating[Any]] | pd.DataFrame | Sequence[Any] | ArrayLike
+ChunksType = int | tuple[int, ...] | dict[str, int] | Literal["auto"]
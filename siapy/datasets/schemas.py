@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Literal, Optional, Sequence, overload
 
+import numpy as np
 import pandas as pd
+from numpy.typing import NDArray
 from pydantic import BaseModel, ConfigDict
 
 from siapy.core.exceptions import InvalidInputError
@@ -348,6 +350,50 @@ class TabularDatasetData:
         """
         self._validate_lengths()
 
+    @overload
+    @classmethod
+    def concat(
+        cls, datasets: Sequence["TabularDatasetData"], *, return_source_ids: Literal[False] = ...
+    ) -> "TabularDatasetData": ...
+
+    @overload
+    @classmethod
+    def concat(
+        cls, datasets: Sequence["TabularDatasetData"], *, return_source_ids: Literal[True]
+    ) -> tuple["TabularDatasetData", NDArray[np.int32]]: ...
+
+    @classmethod
+    def concat(
+        cls, datasets: Sequence["TabularDatasetData"], *, return_source_ids: bool = False
+    ) -> "TabularDatasetData | tuple[TabularDatasetData, NDArray[np.int32]]":
+        """Concatenate datasets into one dataset with a default integer index.
+
+        The signatures are copied into arrays allocated once for the total length (see
+        `Signatures.concat`), and the metadata and targets are concatenated in a single step.
+
+        Args:
+            datasets: The datasets to concatenate, in order.
+            return_source_ids: If True, also return the position in `datasets` that each sample comes from.
+
+        Returns:
+            The concatenated dataset, and if requested an int32 array with the source of each sample.
+
+        Raises:
+            InvalidInputError: If no datasets are given, or their targets cannot be combined (only some
+                datasets have a target, targets of different types, or classification targets with
+                different encodings).
+        """
+        if not datasets:
+            raise InvalidInputError({"datasets": 0}, "Cannot concatenate an empty sequence of datasets.")
+        signatures, source_ids = Signatures.concat([data.signatures for data in datasets], return_source_ids=True)
+        metadata = pd.concat([data.metadata for data in datasets], ignore_index=True)
+        result = cls(
+            signatures=signatures, metadata=metadata, target=_concat_targets([data.target for data in datasets])
+        )
+        if not return_source_ids:
+            return result
+        return result, source_ids
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TabularDatasetData":
         """Create a TabularDatasetData instance from a dictionary.
@@ -556,3 +602,26 @@ class TabularDatasetData:
             metadata=self.metadata.copy(),
             target=self.target.model_copy() if self.target is not None else None,
         )
+
+
+def _concat_targets(targets: Sequence[Target | None]) -> Target | None:
+    """Concatenate the targets of several datasets, which must all be absent or of one kind."""
+    if all(target is None for target in targets):
+        return None
+    first = targets[0]
+    if isinstance(first, RegressionTarget) and all(isinstance(target, RegressionTarget) for target in targets):
+        values = [target.value for target in targets if isinstance(target, RegressionTarget)]
+        return RegressionTarget(value=pd.concat(values, ignore_index=True), name=first.name)
+    if isinstance(first, ClassificationTarget) and all(
+        isinstance(target, ClassificationTarget) and target.encoding.equals(first.encoding) for target in targets
+    ):
+        classification = [target for target in targets if isinstance(target, ClassificationTarget)]
+        return ClassificationTarget(
+            label=pd.concat([target.label for target in classification], ignore_index=True),
+            value=pd.concat([target.value for target in classification], ignore_index=True),
+            encoding=first.encoding,
+        )
+    raise InvalidInputError(
+        [type(target).__name__ for target in targets],
+        "Targets must be all absent, all regression targets, or classification targets with the same encoding.",
+    )
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ConfigDict
 
@@ -223,6 +224,9 @@ class TabularDataset:
             The metadata DataFrame columns correspond to MetaDataEntity fields:
             image_idx, image_filepath, camera_id, shape_idx, shape_type,
             shape_label, geometry_idx.
+            Signatures of pixels with a NaN value in any band are left out. They are looked up in the
+            validity mask of the image if one was already built (see `SpectralImage.valid_mask`), and
+            otherwise found in the extracted signals; no mask is built or written.
 
         Example:
             ```python
@@ -239,37 +243,41 @@ class TabularDataset:
             ```
         """
         self._check_data_entities()
-        signatures_dfs = []
-        metadata_dfs = []
+        # drop the signatures of pixels with NaN values, using the validity mask of the image if it exists;
+        # masks are looked up once per image, not once per shape
+        masks = {
+            image_idx: self.image_set[image_idx].stored_valid_mask()
+            for image_idx in {entity.image_idx for entity in self.data_entities}
+        }
+        selected = []
         for entity in self.data_entities:
-            signatures_df = entity.signatures.to_dataframe().dropna()
-            if mean_signatures:
-                signatures_df = signatures_df.mean().to_frame().T
-
-            signatures_len = len(signatures_df)
-            metadata_df = pd.DataFrame(
-                {
-                    "image_idx": [str(entity.image_idx)] * signatures_len,
-                    "image_filepath": [str(entity.image_filepath)] * signatures_len,
-                    "camera_id": [entity.camera_id] * signatures_len,
-                    "shape_idx": [str(entity.shape_idx)] * signatures_len,
-                    "shape_type": [entity.shape_type] * signatures_len,
-                    "shape_label": [entity.shape_label] * signatures_len,
-                    "geometry_idx": [str(entity.geometry_idx)] * signatures_len,
-                }
-            )
-
-            assert list(metadata_df.columns) == list(MetaDataEntity.model_fields.keys()), (
-                "Sanity check failed! The columns in metadata_df do not match MetaDataEntity fields."
-            )
-
-            signatures_dfs.append(signatures_df)
-            metadata_dfs.append(metadata_df)
-
-        signatures_concat = pd.concat(signatures_dfs, ignore_index=True)
-        metadata_concat = pd.concat(metadata_dfs, ignore_index=True)
-        signatures = Signatures.from_dataframe(signatures_concat)
-        return TabularDatasetData(signatures=signatures, metadata=metadata_concat)
+            mask = masks[entity.image_idx]
+            if mask is not None:
+                pixels = entity.signatures.pixels
+                valid = mask.at(pixels.y_array, pixels.x_array)
+            else:
+                valid = ~np.isnan(entity.signatures.signals.to_numpy()).any(axis=1)
+            signatures = entity.signatures[valid]
+            selected.append(signatures.mean() if mean_signatures else signatures)
+
+        signatures, source_ids = Signatures.concat(selected, return_source_ids=True)
+        # one metadata row per entity, repeated for each of its signatures through the source ids
+        entities_metadata = pd.DataFrame(
+            {
+                "image_idx": [str(entity.image_idx) for entity in self.data_entities],
+                "image_filepath": [str(entity.image_filepath) for entity in self.data_entities],
+                "camera_id": [entity.camera_id for entity in self.data_entities],
+                "shape_idx": [str(entity.shape_idx) for entity in self.data_entities],
+                "shape_type": [entity.shape_type for entity in self.data_entities],
+                "shape_label": [entity.shape_label for entity in self.data_entities],
+                "geometry_idx": [str(entity.geometry_idx) for entity in self.data_entities],
+            }
+        )
+        assert list(entities_metadata.columns) == list(MetaDataEntity.model_fields.keys()), (
+            "Sanity check failed! The columns in metadata_df do not match MetaDataEntity fields."
+        )
+        metadata = entities_metadata.take(source_ids).reset_index(drop=True)
+        return TabularDatasetData(signatures=signatures, metadata=metadata)
 
     def _check_data_entities(self) -> None:
         """Validate that data entities have been processed.
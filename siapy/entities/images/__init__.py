@@ -1,4 +1,6 @@
+from .chunked import ChunkedCubeImage
 from .interfaces import ImageBase
+from .lazy import LazyImage
 from .rasterio_lib import RasterioLibImage
 from .spectral_lib import SpectralLibImage
 from .spimage import SpectralImage
@@ -7,5 +9,7 @@ __all__ = [
     "ImageBase",
     "SpectralLibImage",
     "RasterioLibImage",
+    "ChunkedCubeImage",
+    "LazyImage",
     "SpectralImage",
 ]
@@ -0,0 +1,273 @@
+"""Process-wide, byte-budgeted LRU cache for decoded image arrays.
+
+Repeated reads of the same image (e.g. extracting signatures, cropping panels and computing
+averages in one workflow) otherwise decode the same data from disk every time. When enabled,
+`SpectralImage` stores decoded arrays in a single cache shared by all instances that point at
+the same file. Entries are keyed by the file path, its modification time and size, the band
+subset and the window, so a rewritten file is never served from stale entries.
+
+The cache is disabled by default and is enabled with `enable_array_cache`.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence, TypeAlias
+
+from numpy.typing import NDArray
+
+from siapy.core.exceptions import InvalidInputError
+
+__all__ = [
+    "ArrayCache",
+    "CacheKey",
+    "CacheStats",
+    "DEFAULT_CACHE_BYTES",
+    "array_cache_key",
+    "disable_array_cache",
+    "enable_array_cache",
+    "get_array_cache",
+]
+
+CacheKey: TypeAlias = tuple[Any, ...]
+
+DEFAULT_CACHE_BYTES = 2 * 1024**3
+
+_cache: "ArrayCache | None" = None
+_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the cache counters.
+
+    Attributes:
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that were not in the cache.
+        evictions: Number of entries dropped to stay within the byte budget.
+        entries: Number of arrays currently stored.
+        current_bytes: Total size of the stored arrays in bytes.
+        max_bytes: The byte budget of the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups served from the cache.
+
+        Returns:
+            The hit rate in the range [0, 1], or 0.0 if there were no lookups yet.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ArrayCache:
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """Initialize an empty least-recently-used cache of numpy arrays.
+
+        Args:
+            max_bytes: Upper bound on the total size of the stored arrays in bytes.
+
+        Raises:
+            InvalidInputError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise InvalidInputError(max_bytes, "Cache byte budget must be positive")
+        self._max_bytes = int(max_bytes)
+        self._entries: OrderedDict[CacheKey, NDArray[Any]] = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._entries
+
+    @property
+    def max_bytes(self) -> int:
+        """Get the byte budget of the cache.
+
+        Returns:
+            The upper bound on the total size of the stored arrays in bytes.
+        """
+        return self._max_bytes
+
+    def get(self, key: CacheKey) -> NDArray[Any] | None:
+        """Look up an array and mark it as most recently used.
+
+        Args:
+            key: The cache key, typically created with `array_cache_key`.
+
+        Returns:
+            The stored read-only array, or None if the key is not cached.
+        """
+        with self._lock:
+            array = self._entries.get(key)
+            if array is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return array
+
+    def put(self, key: CacheKey, array: NDArray[Any]) -> NDArray[Any]:
+        """Store an array, evicting the least recently used entries to stay within the budget.
+
+        The array is stored without copying and is marked read-only, so the caller must not keep
+        a writable reference to it. Arrays larger than the whole budget are not stored.
+
+        Args:
+            key: The cache key.
+            array: The array to store.
+
+        Returns:
+            The read-only array as stored in (or, if too large, passed through) the cache.
+        """
+        array.flags.writeable = False
+        nbytes = int(array.nbytes)
+        if nbytes > self._max_bytes:
+            return array
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous.nbytes
+            while self._entries and self._current_bytes + nbytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= evicted.nbytes
+                self._evictions += 1
+            self._entries[key] = array
+            self._current_bytes += nbytes
+        return array
+
+    def invalidate(self, filepath: str | Path) -> int:
+        """Drop all entries of a file.
+
+        Args:
+            filepath: Path of the image file.
+
+        Returns:
+            The number of dropped entries.
+        """
+        path = str(Path(filepath).resolve())
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == path]
+            for key in keys:
+                self._current_bytes -= self._entries.pop(key).nbytes
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters.
+
+        Returns:
+            The current hit, miss and eviction counts together with the cache occupancy.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+
+def enable_array_cache(max_bytes: int = DEFAULT_CACHE_BYTES) -> ArrayCache:
+    """Enable the process-wide array cache.
+
+    If the cache is already enabled with a different budget, it is replaced by an empty one.
+
+    Args:
+        max_bytes: Upper bound on the total size of the cached arrays in bytes.
+
+    Returns:
+        The active cache.
+
+    Example:
+        ```python
+        from siapy.entities.images.cache import enable_array_cache
+
+        cache = enable_array_cache(max_bytes=4 * 1024**3)
+        average = image.average_intensity(axis=(0, 1))
+        normalized = image.to_numpy() / average  # served from the cache
+        print(cache.stats())
+        ```
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None or _cache.max_bytes != max_bytes:
+            _cache = ArrayCache(max_bytes)
+        return _cache
+
+
+def disable_array_cache() -> None:
+    """Disable the process-wide array cache and release all cached arrays."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def get_array_cache() -> ArrayCache | None:
+    """Get the process-wide array cache.
+
+    Returns:
+        The active cache, or None if caching is disabled.
+    """
+    return _cache
+
+
+def array_cache_key(
+    filepath: str | Path,
+    bands: Sequence[int] | None = None,
+    window: tuple[slice, slice] | None = None,
+    shape: tuple[int, int] | None = None,
+) -> CacheKey | None:
+    """Create the cache key of a read.
+
+    Args:
+        filepath: Path of the image file.
+        bands: The 0-based band indices of the read, or None for all bands.
+        window: The (rows, cols) slices of the read, or None for the full image.
+        shape: The (rows, cols) image size, used to normalize the window slices. Required if a
+            window is given.
+
+    Returns:
+        The cache key, or None if the path does not point to a file (e.g. in-memory images).
+    """
+    try:
+        path = Path(filepath).resolve()
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not path.is_file():
+        return None
+
+    bands_key = None if bands is None else tuple(int(band) for band in bands)
+    window_key = None
+    if window is not None:
+        if shape is None:
+            raise InvalidInputError(window, "Image shape is required to create the key of a window read")
+        window_key = tuple(selection.indices(size) for selection, size in zip(window, shape))
+    return (str(path), stat.st_mtime_ns, stat.st_size, bands_key, window_key)
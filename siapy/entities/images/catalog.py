@@ -0,0 +1,222 @@
+"""Persistent catalog of image metadata.
+
+Opening an image parses its header (or opens the raster) just to learn its shape, data type,
+wavelengths and camera identifier, which dominates the time needed to set up a large image set. A
+catalog stores this metadata in a Parquet file, one row per image, together with the modification
+time and size of the files. Images are then created lazily from the catalog without touching their
+files; only entries whose files changed since the catalog was written are opened again.
+"""
+
+import hashlib
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Sequence, cast
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from siapy.core.exceptions import InvalidInputError
+
+from .interfaces import ImageBase
+from .lazy import LazyImage
+from .rasterio_lib import RasterioLibImage
+from .spectral_lib import SpectralLibImage
+
+__all__ = [
+    "CATALOG_COLUMNS",
+    "catalog_entry",
+    "catalog_entry_is_stale",
+    "lazy_image_from_entry",
+    "read_catalog",
+    "wavelengths_signature",
+    "write_catalog",
+]
+
+CATALOG_COLUMNS = (
+    "backend",
+    "filepath",
+    "header_path",
+    "mtime_ns",
+    "size",
+    "header_mtime_ns",
+    "rows",
+    "cols",
+    "bands",
+    "dtype",
+    "interleave",
+    "camera_id",
+    "wavelengths",
+    "wavelengths_hash",
+    "footprint",
+)
+
+
+def wavelengths_signature(wavelengths: Sequence[float] | NDArray[Any]) -> str:
+    """Hash the wavelengths of the bands.
+
+    Args:
+        wavelengths: The wavelengths of the bands.
+
+    Returns:
+        A short hexadecimal digest, equal for images with identical band sets.
+    """
+    return hashlib.sha1(np.ascontiguousarray(wavelengths, dtype=np.float64).tobytes()).hexdigest()[:16]
+
+
+def catalog_entry(image: ImageBase) -> dict[str, Any]:
+    """Collect the catalog row of an image.
+
+    Args:
+        image: The image backend. A LazyImage is opened to read its metadata.
+
+    Returns:
+        A dictionary with a value for each of `CATALOG_COLUMNS`.
+
+    Raises:
+        InvalidInputError: If the image is not backed by an ENVI header or a raster file.
+    """
+    if isinstance(image, LazyImage):
+        image = image.image
+    if isinstance(image, SpectralLibImage):
+        if image.header_path is None:
+            raise InvalidInputError(str(image.filepath), "ENVI images must be opened from a header to be cataloged.")
+        backend = "spectral"
+        header_path: Path | None = image.header_path.absolute()
+        interleave: str | None = image.interleave
+    elif isinstance(image, RasterioLibImage):
+        backend = "rasterio"
+        header_path = None
+        interleave = None
+    else:
+        raise InvalidInputError(type(image).__name__, "Only ENVI and raster images can be cataloged.")
+
+    filepath = image.filepath.absolute()
+    stat = filepath.stat()
+    rows, cols, bands = image.shape
+    wavelengths = np.asarray(image.wavelengths_array, dtype=np.float64)
+    return {
+        "backend": backend,
+        "filepath": str(filepath),
+        "header_path": str(header_path) if header_path is not None else None,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "header_mtime_ns": header_path.stat().st_mtime_ns if header_path is not None else None,
+        "rows": rows,
+        "cols": cols,
+        "bands": bands,
+        "dtype": image.dtype.str,
+        "interleave": interleave,
+        "camera_id": str(image.camera_id),
+        "wavelengths": wavelengths.tolist(),
+        "wavelengths_hash": wavelengths_signature(wavelengths),
+        "footprint": _footprint(image),
+    }
+
+
+def write_catalog(entries: Sequence[dict[str, Any]], path: str | Path) -> Path:
+    """Write catalog rows to a Parquet file.
+
+    Args:
+        entries: Rows as returned by `catalog_entry`.
+        path: Path of the Parquet file.
+
+    Returns:
+        The path of the written file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    catalog = pd.DataFrame(list(entries), columns=list(CATALOG_COLUMNS))
+    catalog = catalog.astype(
+        {"mtime_ns": "int64", "size": "int64", "rows": "int64", "cols": "int64", "bands": "int64"}
+    ).astype({"header_mtime_ns": "Int64"})
+    catalog.to_parquet(path, index=False)
+    return path
+
+
+def read_catalog(path: str | Path) -> list[dict[str, Any]]:
+    """Read the rows of a catalog file.
+
+    Args:
+        path: Path of the Parquet file written by `write_catalog`.
+
+    Returns:
+        The catalog rows, in the order they were written.
+
+    Raises:
+        InvalidInputError: If the file lacks any of `CATALOG_COLUMNS`.
+    """
+    catalog = pd.read_parquet(path)
+    missing = [column for column in CATALOG_COLUMNS if column not in catalog.columns]
+    if missing:
+        raise InvalidInputError({"missing_columns": missing}, f"Not an image catalog: {path}")
+    entries = cast(list[dict[str, Any]], catalog.to_dict("records"))
+    for entry in entries:
+        # missing values of the nullable integer column are read as pandas.NA
+        entry["header_mtime_ns"] = None if pd.isna(entry["header_mtime_ns"]) else int(entry["header_mtime_ns"])
+    return entries
+
+
+def catalog_entry_is_stale(entry: dict[str, Any]) -> bool:
+    """Check whether the files of a catalog row changed since it was written.
+
+    Args:
+        entry: A catalog row.
+
+    Returns:
+        True if the image (or its header) is missing, or its modification time or size differ from
+        the recorded ones.
+    """
+    try:
+        stat = Path(entry["filepath"]).stat()
+        if (stat.st_mtime_ns, stat.st_size) != (entry["mtime_ns"], entry["size"]):
+            return True
+        if entry["header_path"] is not None:
+            return bool(Path(entry["header_path"]).stat().st_mtime_ns != entry["header_mtime_ns"])
+    except OSError:
+        return True
+    return False
+
+
+def lazy_image_from_entry(entry: dict[str, Any]) -> LazyImage:
+    """Create a lazily opened image answering its metadata from a catalog row.
+
+    Args:
+        entry: A catalog row.
+
+    Returns:
+        A LazyImage that opens the file only when its data or further metadata is needed.
+    """
+    opener: Callable[[], ImageBase]
+    if entry["backend"] == "spectral":
+        opener = partial(SpectralLibImage.open, header_path=entry["header_path"], image_path=entry["filepath"])
+    else:
+        opener = partial(RasterioLibImage.open, entry["filepath"])
+    return LazyImage(
+        opener,
+        entry["filepath"],
+        shape=(entry["rows"], entry["cols"], entry["bands"]),
+        dtype=entry["dtype"],
+        wavelengths=entry["wavelengths"],
+        camera_id=entry["camera_id"],
+    )
+
+
+def _footprint(image: SpectralLibImage | RasterioLibImage) -> list[float] | None:
+    """Get the (minx, miny, maxx, maxy) bounds of an image in map coordinates, or None if it is not georeferenced."""
+    if isinstance(image, RasterioLibImage):
+        try:
+            return [float(bound) for bound in image.file.rio.bounds()]
+        except Exception:  # noqa: BLE001
+            return None
+    # ENVI "map info": projection, reference pixel (x, y, 1-based), its easting and northing, pixel sizes, ...
+    map_info = image.metadata.get("map info")
+    if not map_info or len(map_info) < 7:
+        return None
+    try:
+        ref_x, ref_y, easting, northing, size_x, size_y = (float(value) for value in map_info[1:7])
+    except ValueError:
+        return None
+    minx = easting - (ref_x - 1) * size_x
+    maxy = northing + (ref_y - 1) * size_y
+    return [minx, maxy - image.rows * size_y, minx + image.cols * size_x, maxy]
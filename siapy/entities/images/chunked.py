@@ -0,0 +1,748 @@
+"""Chunked, compressed storage of image cubes.
+
+ENVI files are uncompressed and GeoTIFFs are organized in strips or tiles of whole pixels, so neither
+gives compressed random access to blocks of rows x columns x bands. A chunked cube splits the image
+into independently compressed chunks stored in a directory; reads decode only the chunks they touch,
+in parallel.
+
+Cubes are stored as Zarr arrays if zarr is installed, and in a built-in store of zlib-compressed,
+byte-shuffled numpy chunks otherwise. Both layouts are recognized when a cube is opened; reading a
+Zarr cube requires zarr.
+"""
+
+import json
+import os
+import shutil
+import zlib
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, Sequence, TypeVar
+
+import dask.array as da
+import numpy as np
+import xarray as xr
+from numpy.typing import NDArray
+from PIL import Image
+
+from siapy.core import logger
+from siapy.core.exceptions import InvalidFilepathError, InvalidInputError
+
+from .interfaces import ImageBase
+
+try:
+    import zarr
+except ImportError:  # pragma: no cover - zarr is optional
+    zarr = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from siapy.core.types import XarrayType
+
+__all__ = [
+    "ChunkedCubeImage",
+    "ChunkStoreType",
+    "DEFAULT_CUBE_CHUNKS",
+]
+
+ChunkStoreType = Literal["auto", "zarr", "zlib"]
+
+# (rows, cols, bands) of a chunk: square spatial blocks holding a slab of bands
+DEFAULT_CUBE_CHUNKS = (256, 256, 32)
+
+_HEADER_NAME = "cube.json"
+_CHUNK_DIR = "c"
+_FORMAT = "siapy-chunked-cube"
+_ZARR_MARKERS = (".zarray", "zarr.json")
+
+_T = TypeVar("_T")
+_AxisSelection = slice | NDArray[np.intp]
+
+
+class _ChunkStore(ABC):
+    """Chunk-level access to a stored cube."""
+
+    def __init__(self, shape: tuple[int, int, int], chunks: tuple[int, int, int], dtype: np.dtype[Any]) -> None:
+        self.shape = shape
+        self.chunks = chunks
+        self.dtype = dtype
+
+    @property
+    def grid(self) -> tuple[int, int, int]:
+        return tuple(-(-size // chunk) for size, chunk in zip(self.shape, self.chunks))  # type: ignore[return-value]
+
+    def chunk_slices(self, index: tuple[int, int, int]) -> tuple[slice, slice, slice]:
+        return tuple(  # type: ignore[return-value]
+            slice(i * chunk, min((i + 1) * chunk, size)) for i, chunk, size in zip(index, self.chunks, self.shape)
+        )
+
+    @property
+    @abstractmethod
+    def format(self) -> Literal["zarr", "zlib"]: ...
+
+    @property
+    @abstractmethod
+    def attrs(self) -> dict[str, Any]: ...
+
+    @abstractmethod
+    def set_attrs(self, attrs: dict[str, Any]) -> None: ...
+
+    @abstractmethod
+    def read_chunk(self, index: tuple[int, int, int]) -> NDArray[Any]: ...
+
+    @abstractmethod
+    def write_chunk(self, index: tuple[int, int, int], array: NDArray[Any]) -> None: ...
+
+
+class _ZlibStore(_ChunkStore):
+    """Built-in store: a JSON header and one zlib-compressed file per chunk.
+
+    Bytes of multi-byte values are shuffled (all first bytes, then all second bytes, ...) before
+    compression, which compresses smooth floating-point data considerably better. Chunks that hold
+    only the fill value are not written.
+    """
+
+    def __init__(self, path: Path, header: dict[str, Any]) -> None:
+        super().__init__(tuple(header["shape"]), tuple(header["chunks"]), np.dtype(header["dtype"]))  # type: ignore[arg-type]
+        self._path = path
+        self._header = header
+        self._fill_value = header["fill_value"]
+        self._level = int(header["compression_level"])
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        shape: tuple[int, int, int],
+        chunks: tuple[int, int, int],
+        dtype: np.dtype[Any],
+        fill_value: float,
+        compression_level: int,
+    ) -> "_ZlibStore":
+        header = {
+            "format": _FORMAT,
+            "version": 1,
+            "shape": list(shape),
+            "chunks": list(chunks),
+            "dtype": dtype.str,
+            "fill_value": fill_value,
+            "compression": "zlib",
+            "compression_level": compression_level,
+            "shuffle": True,
+            "attrs": {},
+        }
+        (path / _CHUNK_DIR).mkdir(parents=True)
+        store = cls(path, header)
+        store._write_header()
+        return store
+
+    @classmethod
+    def open(cls, path: Path) -> "_ZlibStore":
+        with open(path / _HEADER_NAME) as f:
+            header = json.load(f)
+        if header.get("format") != _FORMAT:
+            raise InvalidInputError({"path": str(path)}, "Directory does not contain a chunked cube")
+        return cls(path, header)
+
+    @property
+    def format(self) -> Literal["zlib"]:
+        return "zlib"
+
+    @property
+    def attrs(self) -> dict[str, Any]:
+        return self._header["attrs"]
+
+    def set_attrs(self, attrs: dict[str, Any]) -> None:
+        self._header["attrs"] = attrs
+        self._write_header()
+
+    def read_chunk(self, index: tuple[int, int, int]) -> NDArray[Any]:
+        shape = tuple(s.stop - s.start for s in self.chunk_slices(index))
+        try:
+            with open(self._chunk_path(index), "rb") as f:
+                data = zlib.decompress(f.read())
+        except FileNotFoundError:
+            return np.full(shape, self._fill_value, dtype=self.dtype)
+        raw = np.frombuffer(data, dtype=np.uint8)
+        if self.dtype.itemsize > 1:
+            raw = np.ascontiguousarray(raw.reshape(self.dtype.itemsize, -1).T)
+        return raw.view(self.dtype).reshape(shape)
+
+    def write_chunk(self, index: tuple[int, int, int], array: NDArray[Any]) -> None:
+        path = self._chunk_path(index)
+        array = np.ascontiguousarray(array, dtype=self.dtype)
+        if _is_fill(array, self._fill_value):
+            path.unlink(missing_ok=True)
+            return
+        raw = array.reshape(-1).view(np.uint8)
+        if self.dtype.itemsize > 1:
+            raw = raw.reshape(-1, self.dtype.itemsize).T
+        with open(path, "wb") as f:
+            f.write(zlib.compress(np.ascontiguousarray(raw).tobytes(), self._level))
+
+    def _chunk_path(self, index: tuple[int, int, int]) -> Path:
+        return self._path / _CHUNK_DIR / ".".join(map(str, index))
+
+    def _write_header(self) -> None:
+        with open(self._path / _HEADER_NAME, "w") as f:
+            json.dump(self._header, f, indent=2)
+
+
+class _ZarrStore(_ChunkStore):
+    """Store backed by a Zarr array."""
+
+    def __init__(self, array: Any) -> None:
+        super().__init__(tuple(array.shape), tuple(array.chunks), np.dtype(array.dtype))
+        self._array = array
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        shape: tuple[int, int, int],
+        chunks: tuple[int, int, int],
+        dtype: np.dtype[Any],
+        fill_value: float,
+    ) -> "_ZarrStore":
+        array = zarr.open_array(
+            store=str(path), mode="w", shape=shape, chunks=chunks, dtype=dtype, fill_value=fill_value
+        )
+        return cls(array)
+
+    @classmethod
+    def open(cls, path: Path) -> "_ZarrStore":
+        if zarr is None:
+            raise InvalidInputError({"path": str(path)}, "Reading a Zarr cube requires zarr to be installed")
+        return cls(zarr.open_array(store=str(path), mode="r"))
+
+    @property
+    def format(self) -> Literal["zarr"]:
+        return "zarr"
+
+    @property
+    def attrs(self) -> dict[str, Any]:
+        return dict(self._array.attrs)
+
+    def set_attrs(self, attrs: dict[str, Any]) -> None:
+        self._array.attrs.update(attrs)
+
+    def read_chunk(self, index: tuple[int, int, int]) -> NDArray[Any]:
+        return np.asarray(self._array[self.chunk_slices(index)])
+
+    def write_chunk(self, index: tuple[int, int, int], array: NDArray[Any]) -> None:
+        self._array[self.chunk_slices(index)] = array
+
+
+class ChunkedCubeImage(ImageBase):
+    def __init__(self, store: _ChunkStore, filepath: Path, max_workers: int | None = None) -> None:
+        """Initialize a ChunkedCubeImage from an opened chunk store.
+
+        Args:
+            store: The opened chunk store.
+            filepath: Path of the cube directory.
+            max_workers: Maximum number of threads decoding chunks in parallel. If None, the default
+                of `concurrent.futures.ThreadPoolExecutor` is used; 1 decodes sequentially.
+
+        Note:
+            Use `ChunkedCubeImage.open` or `ChunkedCubeImage.create` instead of calling the constructor
+            directly.
+        """
+        self._store = store
+        self._filepath = filepath
+        self._max_workers = max_workers
+        self._wavelengths: NDArray[np.float64] | None = None
+
+    @classmethod
+    def open(cls, filepath: str | Path, *, max_workers: int | None = None) -> "ChunkedCubeImage":
+        """Open a chunked cube directory.
+
+        Args:
+            filepath: Path of the cube directory.
+            max_workers: Maximum number of threads decoding chunks in parallel.
+
+        Returns:
+            A ChunkedCubeImage instance reading from the directory.
+
+        Raises:
+            InvalidFilepathError: If the directory does not exist.
+            InvalidInputError: If the directory is not a chunked cube, or is a Zarr cube and zarr is not
+                installed.
+
+        Example:
+            ```python
+            cube = ChunkedCubeImage.open("image.cube", max_workers=8)
+            tile = cube.read_window(slice(0, 512), slice(0, 512), bands=[10, 20, 30])
+            ```
+        """
+        filepath = Path(filepath)
+        if not filepath.is_dir():
+            raise InvalidFilepathError(filepath)
+        store: _ChunkStore
+        if (filepath / _HEADER_NAME).is_file():
+            store = _ZlibStore.open(filepath)
+        elif any((filepath / marker).is_file() for marker in _ZARR_MARKERS):
+            store = _ZarrStore.open(filepath)
+        else:
+            raise InvalidInputError({"filepath": str(filepath)}, "Directory does not contain a chunked cube")
+        return cls(store, filepath, max_workers)
+
+    @classmethod
+    def create(
+        cls,
+        filepath: str | Path,
+        image: ImageBase | NDArray[Any],
+        *,
+        chunks: tuple[int, int, int] = DEFAULT_CUBE_CHUNKS,
+        store: ChunkStoreType = "auto",
+        dtype: Any = None,
+        compression_level: int = 6,
+        overwrite: bool = True,
+        max_workers: int | None = None,
+    ) -> "ChunkedCubeImage":
+        """Convert an image into a chunked cube directory.
+
+        The source is read one row of chunks at a time, so images larger than memory can be converted.
+        Wavelengths, default bands, camera ID and metadata of image backends are stored with the cube.
+
+        Args:
+            filepath: Path of the cube directory to create.
+            image: The source image backend or a (height, width, bands) array.
+            chunks: The (rows, cols, bands) size of a chunk; values are clipped to the image shape.
+            store: "zarr" to store a Zarr array, "zlib" for the built-in store, or "auto" to use Zarr if
+                zarr is installed.
+            dtype: The stored data type. If None, the data type of the source is kept.
+            compression_level: The zlib compression level (0-9) of the built-in store.
+            overwrite: If True, an existing cube at the path is replaced.
+            max_workers: Maximum number of threads encoding and decoding chunks in parallel.
+
+        Returns:
+            A ChunkedCubeImage instance reading from the created directory.
+
+        Raises:
+            InvalidInputError: If the chunk shape, store or compression level is invalid, zarr is
+                requested but not installed, or the path exists and cannot be overwritten.
+
+        Example:
+            ```python
+            source = SpectralLibImage.open(header_path="image.hdr")
+            cube = ChunkedCubeImage.create("image.cube", source, chunks=(256, 256, 16))
+            ```
+        """
+        filepath = Path(filepath)
+        if len(chunks) != 3 or any(int(chunk) <= 0 for chunk in chunks):
+            raise InvalidInputError({"chunks": chunks}, "Chunks must be three positive sizes (rows, cols, bands)")
+        if not 0 <= compression_level <= 9:
+            raise InvalidInputError({"compression_level": compression_level}, "Compression level must be in 0-9")
+        if store == "auto":
+            store = "zarr" if zarr is not None else "zlib"
+        if store not in ("zarr", "zlib"):
+            raise InvalidInputError({"store": store}, "Store must be one of 'auto', 'zarr' or 'zlib'")
+        if store == "zarr" and zarr is None:
+            raise InvalidInputError({"store": store}, "Writing a Zarr cube requires zarr to be installed")
+        _prepare_directory(filepath, overwrite)
+
+        if isinstance(image, ImageBase):
+            shape = image.shape
+            read: Callable[[slice], NDArray[Any]] = partial(image.read_window, cols=slice(None))
+            source_dtype = read(slice(0, 1)).dtype
+            attrs = {
+                "siapy": {
+                    "wavelengths": [float(w) for w in image.wavelengths],
+                    "default_bands": [int(b) for b in image.display_bands],
+                    "camera_id": image.camera_id,
+                },
+                "metadata": _to_json(image.metadata),
+            }
+        else:
+            array = np.asarray(image)
+            if array.ndim != 3:
+                raise InvalidInputError(array.shape, "Input array must be 3-dimensional (height, width, bands)")
+            shape = (array.shape[0], array.shape[1], array.shape[2])
+            read = array.__getitem__
+            source_dtype = array.dtype
+            attrs = {"siapy": {"default_bands": list(range(min(3, shape[2])))}, "metadata": {}}
+
+        dtype = np.dtype(source_dtype if dtype is None else dtype)
+        chunk_shape = tuple(max(min(int(chunk), size), 1) for chunk, size in zip(chunks, shape))
+        fill_value = float("nan") if np.issubdtype(dtype, np.floating) else 0
+        chunk_store: _ChunkStore
+        if store == "zarr":
+            chunk_store = _ZarrStore.create(filepath, shape, chunk_shape, dtype, fill_value)  # type: ignore[arg-type]
+        else:
+            chunk_store = _ZlibStore.create(filepath, shape, chunk_shape, dtype, fill_value, compression_level)  # type: ignore[arg-type]
+        chunk_store.set_attrs(attrs)
+
+        cube = cls(chunk_store, filepath, max_workers)
+        grid = chunk_store.grid
+        for i in range(grid[0]):
+            rows = chunk_store.chunk_slices((i, 0, 0))[0]
+            strip = np.asarray(read(rows)).astype(dtype, copy=False)
+
+            def write(index: tuple[int, int, int], strip: NDArray[Any] = strip) -> None:
+                _, cols, bands = chunk_store.chunk_slices(index)
+                chunk_store.write_chunk(index, strip[:, cols, bands])
+
+            cube._run(write, [(i, j, k) for j in range(grid[1]) for k in range(grid[2])])
+        logger.info(f"Chunked cube created as: {filepath}")
+        return cube
+
+    @property
+    def filepath(self) -> Path:
+        """Get the path of the cube directory.
+
+        Returns:
+            A Path object pointing to the directory holding the chunks.
+        """
+        return self._filepath
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Get the metadata stored with the cube.
+
+        Returns:
+            A dictionary with the metadata of the source image the cube was created from.
+        """
+        return self._store.attrs.get("metadata", {})
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Get the dimensions of the image.
+
+        Returns:
+            A tuple (height, width, bands) representing the image dimensions.
+        """
+        return self._store.shape
+
+    @property
+    def bands(self) -> int:
+        """Get the number of spectral bands in the image.
+
+        Returns:
+            The number of spectral bands in the cube.
+        """
+        return self._store.shape[2]
+
+    @property
+    def chunks(self) -> tuple[int, int, int]:
+        """Get the chunk size of the cube.
+
+        Returns:
+            The (rows, cols, bands) size of a chunk; chunks at the edges of the image may be smaller.
+        """
+        return self._store.chunks
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Get the stored data type.
+
+        Returns:
+            The numpy data type of the stored values.
+        """
+        return self._store.dtype
+
+    @property
+    def store_format(self) -> Literal["zarr", "zlib"]:
+        """Get the layout of the cube directory.
+
+        Returns:
+            "zarr" for a Zarr array or "zlib" for the built-in chunk store.
+        """
+        return self._store.format
+
+    @property
+    def stored_bytes(self) -> int:
+        """Get the size of the cube on disk.
+
+        Returns:
+            The total size in bytes of all files in the cube directory.
+        """
+        return sum(path.stat().st_size for path in self._filepath.rglob("*") if path.is_file())
+
+    @property
+    def default_bands(self) -> list[int]:
+        """Get the default band indices for RGB display.
+
+        Returns:
+            A list of 0-based band indices stored with the cube, taken from the display bands of the
+            source image.
+        """
+        return list(map(int, self._store.attrs.get("siapy", {}).get("default_bands", [])))
+
+    @property
+    def wavelengths(self) -> list[float]:
+        """Get the wavelengths corresponding to each spectral band.
+
+        Returns:
+            A list of wavelength values stored with the cube, or the band numbers 0, 1, 2, ... if the
+            source had no wavelengths.
+        """
+        return self.wavelengths_array.tolist()
+
+    @property
+    def wavelengths_array(self) -> NDArray[np.float64]:
+        """Get the wavelengths of the bands as a read-only array.
+
+        Returns:
+            A read-only float64 array of the wavelengths, read from the cube attributes on first access.
+        """
+        if self._wavelengths is None:
+            wavelengths = self._store.attrs.get("siapy", {}).get("wavelengths")
+            if not wavelengths or len(wavelengths) != self.bands:
+                wavelengths = range(self.bands)
+            array = np.array(list(wavelengths), dtype=np.float64)
+            array.flags.writeable = False
+            self._wavelengths = array
+        return self._wavelengths
+
+    @property
+    def camera_id(self) -> str:
+        """Get the camera identifier.
+
+        Returns:
+            The camera ID of the source image, or an empty string if none was stored.
+        """
+        return str(self._store.attrs.get("siapy", {}).get("camera_id", ""))
+
+    def to_display(self, equalize: bool = True) -> Image.Image:
+        """Convert the image to a PIL Image for display purposes.
+
+        Args:
+            equalize: Whether to apply histogram equalization to enhance contrast. Defaults to True.
+
+        Returns:
+            A PIL Image object representing an RGB composite of the default bands.
+        """
+        return self.render_display(self.read_window(slice(None), slice(None), self.display_bands), equalize)
+
+    def to_numpy(
+        self,
+        nan_value: float | None = None,
+        *,
+        copy: bool = True,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Convert the image to a numpy array.
+
+        Args:
+            nan_value: Optional value to replace NaN values with. If None, NaN values are preserved.
+            copy: Ignored; the chunks are always decoded into a new array.
+            bands: Optional 0-based band indices to read. If None, all bands are read. Chunks holding
+                only unselected bands are not decoded.
+
+        Returns:
+            A 3D numpy array with shape (height, width, bands) in the stored data type.
+        """
+        image = self.read_window(slice(None), slice(None), bands)
+        if nan_value is not None:
+            image = np.nan_to_num(image, nan=nan_value, copy=False)
+        return image
+
+    def read_window(
+        self,
+        rows: slice,
+        cols: slice,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Read a rectangular region of the image, decoding the chunks it touches in parallel.
+
+        Args:
+            rows: Slice selecting the rows (height axis) to read. Steps are supported.
+            cols: Slice selecting the columns (width axis) to read. Steps are supported.
+            bands: Optional 0-based band indices to read. If None, all bands are read.
+
+        Returns:
+            A 3D numpy array with shape (rows, cols, bands) containing the requested region.
+
+        Example:
+            ```python
+            # Every 4th pixel of the first band
+            preview = cube.read_window(slice(None, None, 4), slice(None, None, 4), bands=[0])
+            ```
+        """
+        return self._read(rows, cols, bands, self._max_workers)
+
+    def read_pixels(
+        self,
+        rows: Sequence[int] | NDArray[np.integer[Any]],
+        cols: Sequence[int] | NDArray[np.integer[Any]],
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Read the spectra of individual pixels, decoding only the chunks that contain them.
+
+        Args:
+            rows: Row index of each pixel.
+            cols: Column index of each pixel.
+            bands: Optional 0-based band indices to read. If None, all bands are read.
+
+        Returns:
+            A 2D numpy array with shape (pixels, bands), in the order the pixels were requested.
+
+        Raises:
+            InvalidInputError: If a pixel lies outside of the image.
+        """
+        rows_arr = np.asarray(rows, dtype=np.intp).reshape(-1)
+        cols_arr = np.asarray(cols, dtype=np.intp).reshape(-1)
+        height, width, _ = self.shape
+        if rows_arr.size and (
+            rows_arr.min() < 0 or cols_arr.min() < 0 or rows_arr.max() >= height or cols_arr.max() >= width
+        ):
+            raise InvalidInputError({"shape": self.shape}, "Pixel coordinates are outside of the image")
+        band_index = self._axis_index(bands, 2)
+        out = np.empty((rows_arr.size, band_index.size), dtype=self.dtype)
+        if not out.size:
+            return out
+
+        chunk_rows, chunk_cols, _ = self.chunks
+        spatial = (rows_arr // chunk_rows) * self._store.grid[1] + cols_arr // chunk_cols
+        order = np.argsort(spatial, kind="stable")
+        keys, starts = np.unique(spatial[order], return_index=True)
+        groups = np.split(order, starts[1:])
+        band_groups = list(self._axis_groups(band_index, 2))
+
+        def gather(task: tuple[int, NDArray[np.intp], int, NDArray[np.intp], NDArray[np.intp]]) -> None:
+            key, positions, k, band_positions, band_local = task
+            i, j = divmod(key, self._store.grid[1])
+            chunk = self._store.read_chunk((i, j, k))
+            local = chunk[rows_arr[positions] - i * chunk_rows, cols_arr[positions] - j * chunk_cols]
+            out[np.ix_(positions, band_positions)] = local[:, band_local]
+
+        self._run(
+            gather,
+            [
+                (int(key), positions, k, bpos, bloc)
+                for key, positions in zip(keys, groups)
+                for k, bpos, bloc in band_groups
+            ],
+        )
+        return out
+
+    def to_xarray(self) -> "XarrayType":
+        """Convert the image to a lazy xarray DataArray.
+
+        Returns:
+            An xarray DataArray with labeled dimensions (y, x, band), backed by a dask array with one
+            dask chunk per stored chunk, so nothing is decoded until the result is computed.
+        """
+        data = da.from_array(_LazyCube(self), chunks=self.chunks, lock=False, asarray=True)
+        return xr.DataArray(
+            data,
+            dims=["y", "x", "band"],
+            coords={
+                "y": np.arange(self.shape[0]),
+                "x": np.arange(self.shape[1]),
+                "band": self.wavelengths_array,
+            },
+            attrs=self.metadata,
+        )
+
+    def _read(
+        self, rows: slice, cols: slice, bands: Sequence[int] | None, max_workers: int | None
+    ) -> NDArray[np.floating[Any]]:
+        indices = (self._axis_index(rows, 0), self._axis_index(cols, 1), self._axis_index(bands, 2))
+        out = np.empty(tuple(index.size for index in indices), dtype=self.dtype)
+        if not out.size:
+            return out
+
+        groups = [
+            [(chunk_id, _as_slice(positions), _as_slice(local)) for chunk_id, positions, local in groups]
+            for groups in (self._axis_groups(index, axis) for axis, index in enumerate(indices))
+        ]
+
+        def decode(task: tuple[tuple[int, _AxisSelection, _AxisSelection], ...]) -> None:
+            chunk = self._store.read_chunk((task[0][0], task[1][0], task[2][0]))
+            positions = tuple(selection for _, selection, _ in task)
+            local = tuple(selection for _, _, selection in task)
+            if all(isinstance(selection, slice) for selection in positions + local):
+                # contiguous selections, e.g. whole chunks, are copied without fancy indexing
+                out[positions] = chunk[local]
+            else:
+                out[np.ix_(*map(_as_index, positions))] = chunk[np.ix_(*map(_as_index, local))]
+
+        tasks = [(r, c, b) for r in groups[0] for c in groups[1] for b in groups[2]]
+        self._run(decode, tasks, max_workers)
+        return out
+
+    def _axis_index(self, selection: slice | Sequence[int] | None, axis: int) -> NDArray[np.intp]:
+        size = self.shape[axis]
+        if selection is None:
+            return np.arange(size)
+        if isinstance(selection, slice):
+            return np.arange(*selection.indices(size))
+        index = np.asarray(selection, dtype=np.intp).reshape(-1)
+        index = np.where(index < 0, index + size, index)
+        if index.size and (index.min() < 0 or index.max() >= size):
+            raise InvalidInputError({"index": list(selection), "size": size}, "Index is out of bounds")
+        return index
+
+    def _axis_groups(
+        self, index: NDArray[np.intp], axis: int
+    ) -> Iterable[tuple[int, NDArray[np.intp], NDArray[np.intp]]]:
+        """Group the requested indices of an axis by chunk as (chunk, output positions, local indices)."""
+        chunk = self.chunks[axis]
+        chunk_ids = index // chunk
+        for chunk_id in np.unique(chunk_ids):
+            positions = np.flatnonzero(chunk_ids == chunk_id)
+            yield int(chunk_id), positions, index[positions] - chunk_id * chunk
+
+    def _run(self, func: Callable[[_T], None], tasks: list[_T], max_workers: int | None = None) -> None:
+        workers = self._max_workers if max_workers is None else max_workers
+        if len(tasks) <= 1 or workers == 1:
+            for task in tasks:
+                func(task)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # consume the results to surface exceptions raised by the workers
+            for _ in executor.map(func, tasks):
+                pass
+
+
+class _LazyCube:
+    """Array-like view of a cube for `dask.array.from_array`."""
+
+    def __init__(self, cube: ChunkedCubeImage) -> None:
+        self._cube = cube
+        self.shape = cube.shape
+        self.dtype = cube.dtype
+        self.ndim = 3
+
+    def __getitem__(self, key: tuple[slice, slice, slice]) -> NDArray[Any]:
+        rows, cols, bands = key
+        # dask schedules the blocks in parallel already
+        return self._cube._read(rows, cols, list(range(*bands.indices(self.shape[2]))), 1)
+
+
+def _as_slice(index: NDArray[np.intp]) -> _AxisSelection:
+    """Get a slice equivalent to sorted, consecutive indices, or the indices themselves."""
+    if index.size and index[-1] - index[0] == index.size - 1 and (index.size == 1 or (np.diff(index) == 1).all()):
+        return slice(int(index[0]), int(index[-1]) + 1)
+    return index
+
+
+def _as_index(selection: _AxisSelection) -> NDArray[np.intp]:
+    if isinstance(selection, slice):
+        return np.arange(selection.start, selection.stop)
+    return selection
+
+
+def _is_fill(array: NDArray[Any], fill_value: float) -> bool:
+    if np.isnan(fill_value):
+        return bool(np.isnan(array).all())
+    return bool((array == fill_value).all())
+
+
+def _prepare_directory(filepath: Path, overwrite: bool) -> None:
+    if filepath.exists():
+        is_cube = (filepath / _HEADER_NAME).is_file() or any((filepath / m).is_file() for m in _ZARR_MARKERS)
+        if not overwrite:
+            raise InvalidInputError({"filepath": str(filepath)}, f"Cube {filepath} already exists and overwrite=False.")
+        if not is_cube and (not filepath.is_dir() or any(filepath.iterdir())):
+            raise InvalidInputError(
+                {"filepath": str(filepath)}, f"Refusing to overwrite {filepath}, which is not a chunked cube."
+            )
+        shutil.rmtree(filepath)
+    os.makedirs(filepath.parent, exist_ok=True)
+
+
+def _to_json(value: Any) -> Any:
+    """Convert metadata to JSON-serializable values, representing unknown objects as strings."""
+    return json.loads(json.dumps(value, default=lambda obj: obj.tolist() if hasattr(obj, "tolist") else str(obj)))
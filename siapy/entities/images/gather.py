@@ -0,0 +1,163 @@
+"""Locality-sorted gather of individual pixel spectra.
+
+Fancy indexing a loaded cube in the order the pixels were requested needs the whole cube (or the
+bounding window of the pixels) in memory, and visiting the pixels in request order jumps back and
+forth through the file. The gather engine deduplicates the requested pixels, sorts them in the
+row-major storage order of the image and groups them into strips of consecutive image lines. Each
+strip is read as one window limited to the columns it needs, so only the lines that contain
+requested pixels are read, and the spectra are finally scattered back to the requested order.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from siapy.core.exceptions import InvalidInputError
+
+from .planner import DEFAULT_CHUNK_BYTES
+
+if TYPE_CHECKING:
+    from .interfaces import ImageBase
+
+__all__ = [
+    "PixelGather",
+    "gather_pixels",
+    "plan_pixel_gather",
+]
+
+
+@dataclass(frozen=True)
+class PixelGather:
+    """Deduplicated, storage-ordered form of a pixel request.
+
+    Attributes:
+        rows: Row of each distinct requested pixel, in row-major storage order.
+        cols: Column of each distinct requested pixel, in row-major storage order.
+        inverse: For each requested pixel, its position in `rows` and `cols`.
+        strips: Ranges of positions in `rows` and `cols` that are read together. A strip covers
+            consecutive image lines only, and at most the lines that fit into the chunk byte budget.
+    """
+
+    rows: NDArray[np.intp]
+    cols: NDArray[np.intp]
+    inverse: NDArray[np.intp]
+    strips: tuple[slice, ...]
+
+    def scatter(self, spectra: NDArray[Any]) -> NDArray[Any]:
+        """Restore the requested order (and duplicates) of spectra read in storage order.
+
+        Args:
+            spectra: Array of shape (distinct pixels, bands), ordered like `rows` and `cols`.
+
+        Returns:
+            Array of shape (requested pixels, bands).
+        """
+        return spectra[self.inverse]
+
+
+def plan_pixel_gather(
+    rows: Sequence[int] | NDArray[np.integer[Any]],
+    cols: Sequence[int] | NDArray[np.integer[Any]],
+    *,
+    shape: tuple[int, int, int],
+    itemsize: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> PixelGather:
+    """Deduplicate and sort a pixel request, and group it into line strips.
+
+    Args:
+        rows: Row index of each requested pixel.
+        cols: Column index of each requested pixel.
+        shape: Image shape as (rows, cols, bands).
+        itemsize: Size of a single value in bytes.
+        chunk_bytes: Upper bound on the size of the image lines covered by one strip.
+
+    Returns:
+        The gather plan.
+
+    Raises:
+        InvalidInputError: If rows and cols differ in length or a pixel lies outside of the image.
+
+    Example:
+        ```python
+        gather = plan_pixel_gather([5, 1, 5], [2, 0, 2], shape=(10, 10, 3), itemsize=4)
+        gather.rows, gather.cols, gather.inverse
+        # (array([1, 5]), array([0, 2]), array([1, 0, 1]))
+        ```
+    """
+    rows_arr = np.asarray(rows, dtype=np.intp).reshape(-1)
+    cols_arr = np.asarray(cols, dtype=np.intp).reshape(-1)
+    if rows_arr.shape != cols_arr.shape:
+        raise InvalidInputError(
+            {"rows": rows_arr.shape, "cols": cols_arr.shape},
+            "Rows and cols of the requested pixels must have the same length",
+        )
+    height, width, bands = shape
+    if rows_arr.size and (
+        rows_arr.min() < 0 or cols_arr.min() < 0 or rows_arr.max() >= height or cols_arr.max() >= width
+    ):
+        raise InvalidInputError({"shape": shape}, "Pixel coordinates are outside of the image")
+
+    # row-major linear offsets sort and deduplicate the pixels in storage order in one pass
+    linear, inverse = np.unique(rows_arr * width + cols_arr, return_inverse=True)
+    unique_rows, unique_cols = np.divmod(linear, width)
+    inverse = inverse.reshape(-1).astype(np.intp, copy=False)
+    if not linear.size:
+        return PixelGather(unique_rows, unique_cols, inverse, ())
+
+    # a strip starts after a skipped line, or when it would exceed the byte budget
+    rows_per_strip = max(chunk_bytes // max(width * bands * itemsize, 1), 1)
+    positions = np.arange(linear.size)
+    starts = np.ones(linear.size, dtype=bool)
+    starts[1:] = np.diff(unique_rows) > 1
+    first_rows = unique_rows[np.maximum.accumulate(np.where(starts, positions, 0))]
+    strip_ids = (unique_rows - first_rows) // rows_per_strip
+    starts[1:] |= np.diff(strip_ids) != 0
+    strip_starts = np.flatnonzero(starts)
+    strip_stops = np.append(strip_starts[1:], linear.size)
+    strips = tuple(slice(int(start), int(stop)) for start, stop in zip(strip_starts, strip_stops))
+    return PixelGather(unique_rows, unique_cols, inverse, strips)
+
+
+def gather_pixels(
+    image: "ImageBase",
+    rows: Sequence[int] | NDArray[np.integer[Any]],
+    cols: Sequence[int] | NDArray[np.integer[Any]],
+    bands: Sequence[int] | None = None,
+    *,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> NDArray[Any]:
+    """Read the spectra of individual pixels through windowed reads of the lines that contain them.
+
+    Args:
+        image: The image backend; its `read_window` is called once per strip.
+        rows: Row index of each pixel.
+        cols: Column index of each pixel.
+        bands: Optional 0-based band indices to read. If None, all bands are read.
+        chunk_bytes: Upper bound on the size of the image lines covered by one read.
+
+    Returns:
+        A 2D numpy array with shape (pixels, bands), in the order the pixels were requested.
+
+    Raises:
+        InvalidInputError: If rows and cols differ in length or a pixel lies outside of the image.
+    """
+    gather = plan_pixel_gather(
+        rows, cols, shape=image.shape, itemsize=np.dtype(image.dtype).itemsize, chunk_bytes=chunk_bytes
+    )
+    spectra: NDArray[Any] | None = None
+    for strip in gather.strips:
+        strip_rows = gather.rows[strip]
+        strip_cols = gather.cols[strip]
+        row_start, col_start = int(strip_rows[0]), int(strip_cols.min())
+        window = image.read_window(
+            slice(row_start, int(strip_rows[-1]) + 1), slice(col_start, int(strip_cols.max()) + 1), bands
+        )
+        if spectra is None:
+            spectra = np.empty((gather.rows.size, window.shape[2]), dtype=window.dtype)
+        spectra[strip] = window[strip_rows - row_start, strip_cols - col_start]
+    if spectra is None:
+        return np.empty((0, image.bands if bands is None else len(bands)), dtype=image.dtype)
+    return gather.scatter(spectra)
@@ -0,0 +1,295 @@
+"""Process-wide, bounded pool of open image file handles.
+
+Every opened ENVI image keeps its data file (and, once used, a memory map of it) open, so iterating
+over tens of thousands of images exhausts the operating system limit on open files. Backends that
+hold file handles register with a least-recently-used pool of at most N open files: when more are
+open, the handles of the least recently used images are closed and are reopened transparently on
+their next read. Handles are pinned while a read is in progress, so they are never closed under a
+running read.
+
+The pool is disabled by default, so every image keeps its handle open; it is enabled (with
+`DEFAULT_MAX_OPEN_FILES` handles unless another limit is given) and resized with
+`enable_handle_pool`. Raster files opened through rioxarray are pooled by the xarray file cache,
+whose size `enable_handle_pool` sets to the same limit.
+"""
+
+import functools
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Protocol, TypeVar
+
+import xarray as xr
+
+from siapy.core.exceptions import InvalidInputError
+
+__all__ = [
+    "DEFAULT_MAX_OPEN_FILES",
+    "HandlePool",
+    "HandlePoolStats",
+    "PooledFile",
+    "disable_handle_pool",
+    "enable_handle_pool",
+    "get_handle_pool",
+    "pooled_handle",
+    "uses_handle",
+]
+
+DEFAULT_MAX_OPEN_FILES = 256
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class PooledFile(Protocol):
+    """An image backend whose file handle can be closed and reopened."""
+
+    @property
+    def closed(self) -> bool: ...
+
+    def close(self) -> None: ...
+
+    def reopen(self) -> None: ...
+
+
+@dataclass(frozen=True)
+class HandlePoolStats:
+    """Snapshot of the pool counters.
+
+    Attributes:
+        open_handles: Number of images whose handles are currently open and tracked by the pool.
+        pinned: Number of open handles that are in use by a running read.
+        max_open: The maximum number of open handles.
+        hits: Number of uses of an image whose handle was open.
+        reopens: Number of handles reopened after they were closed.
+        evictions: Number of handles closed to stay within the limit.
+    """
+
+    open_handles: int
+    pinned: int
+    max_open: int
+    hits: int
+    reopens: int
+    evictions: int
+
+
+class HandlePool:
+    def __init__(self, max_open: int = DEFAULT_MAX_OPEN_FILES):
+        """Initialize an empty least-recently-used pool of open file handles.
+
+        Args:
+            max_open: Maximum number of images with open file handles.
+
+        Raises:
+            InvalidInputError: If max_open is not positive.
+        """
+        if max_open <= 0:
+            raise InvalidInputError(max_open, "Maximum number of open files must be positive")
+        self._max_open = int(max_open)
+        # keyed by id() so that images need not be hashable; weak references let unused images be collected
+        self._entries: OrderedDict[int, weakref.ref[PooledFile]] = OrderedDict()
+        self._pins: dict[int, int] = {}
+        self._hits = 0
+        self._reopens = 0
+        self._evictions = 0
+        # reentrant, as collecting an image while the lock is held runs `_forget` on the same thread
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_open(self) -> int:
+        """Get the maximum number of open handles.
+
+        Returns:
+            The maximum number of images with open file handles.
+        """
+        return self._max_open
+
+    def acquire(self, image: PooledFile) -> None:
+        """Pin the handle of an image for a read, reopening it if it was closed.
+
+        The image becomes the most recently used one. If more handles than allowed are open, the least
+        recently used handles that are not pinned are closed.
+
+        Args:
+            image: The image backend.
+        """
+        with self._lock:
+            self._use(image)
+            key = id(image)
+            self._pins[key] = self._pins.get(key, 0) + 1
+            self._evict()
+
+    def add(self, image: PooledFile) -> None:
+        """Track the handle of an image that was just opened, without pinning it.
+
+        Args:
+            image: The image backend.
+        """
+        with self._lock:
+            self._use(image)
+            self._evict()
+
+    def release(self, image: PooledFile) -> None:
+        """Unpin the handle of an image after a read.
+
+        Args:
+            image: The image backend, previously passed to `acquire`.
+        """
+        key = id(image)
+        with self._lock:
+            count = self._pins.get(key, 0) - 1
+            if count > 0:
+                self._pins[key] = count
+            else:
+                self._pins.pop(key, None)
+            self._evict()
+
+    def close_all(self) -> int:
+        """Close the handles of all images that are not in use.
+
+        Returns:
+            The number of closed handles.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key not in self._pins]
+            for key in keys:
+                self._close(key)
+        return len(keys)
+
+    def stats(self) -> HandlePoolStats:
+        """Get a snapshot of the pool counters.
+
+        Returns:
+            The current hit, reopen and eviction counts together with the pool occupancy.
+        """
+        with self._lock:
+            return HandlePoolStats(
+                open_handles=len(self._entries),
+                pinned=len(self._pins),
+                max_open=self._max_open,
+                hits=self._hits,
+                reopens=self._reopens,
+                evictions=self._evictions,
+            )
+
+    def _use(self, image: PooledFile) -> None:
+        """Mark an image as most recently used, reopening its handle if it was closed."""
+        key = id(image)
+        if image.closed:
+            image.reopen()
+            self._reopens += 1
+        elif key in self._entries:
+            self._hits += 1
+        if key not in self._entries:
+            self._entries[key] = weakref.ref(image, lambda _, key=key: self._forget(key))  # type: ignore[misc]
+        self._entries.move_to_end(key)
+
+    def _evict(self) -> None:
+        """Close least recently used, unpinned handles until the pool is within its limit."""
+        excess = len(self._entries) - self._max_open
+        if excess <= 0:
+            return
+        for key in [key for key in self._entries if key not in self._pins][:excess]:
+            self._close(key)
+            self._evictions += 1
+
+    def _close(self, key: int) -> None:
+        ref = self._entries.pop(key, None)
+        image = ref() if ref is not None else None
+        if image is not None:
+            image.close()
+
+    def _forget(self, key: int) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._pins.pop(key, None)
+
+
+_pool: HandlePool | None = None
+_pool_lock = threading.Lock()
+
+
+def enable_handle_pool(max_open: int = DEFAULT_MAX_OPEN_FILES) -> HandlePool:
+    """Enable the process-wide handle pool, or change its limit.
+
+    The limit is also applied to the xarray file cache, which pools the files of raster images.
+
+    Args:
+        max_open: Maximum number of images with open file handles.
+
+    Returns:
+        The active pool.
+
+    Example:
+        ```python
+        from siapy.entities.images.handles import enable_handle_pool
+
+        pool = enable_handle_pool(max_open=128)
+        dataset = TabularDataset(SpectralImageSet.spy_open(header_paths=paths, lazy=True))
+        dataset.process_image_data()
+        print(pool.stats())
+        ```
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.max_open != max_open:
+            previous = _pool
+            _pool = HandlePool(max_open)
+            if previous is not None:
+                previous.close_all()
+        xr.set_options(file_cache_maxsize=max_open)
+        return _pool
+
+
+def disable_handle_pool() -> None:
+    """Disable the process-wide handle pool (the default); images opened afterwards keep their handles open."""
+    global _pool
+    with _pool_lock:
+        _pool = None
+
+
+def get_handle_pool() -> HandlePool | None:
+    """Get the process-wide handle pool.
+
+    Returns:
+        The active pool, or None if pooling is disabled.
+    """
+    return _pool
+
+
+@contextmanager
+def pooled_handle(image: PooledFile) -> Iterator[None]:
+    """Keep the handle of an image open for the duration of a read.
+
+    Args:
+        image: The image backend.
+
+    Returns:
+        A context manager that pins the handle in the active pool, reopening it if it was closed.
+    """
+    pool = _pool
+    if pool is None:
+        if image.closed:
+            image.reopen()
+        yield
+        return
+    pool.acquire(image)
+    try:
+        yield
+    finally:
+        pool.release(image)
+
+
+def uses_handle(method: _F) -> _F:
+    """Decorate a backend method that reads from the file handle, see `pooled_handle`."""
+
+    @functools.wraps(method)
+    def wrapper(self: PooledFile, *args: Any, **kwargs: Any) -> Any:
+        with pooled_handle(self):
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
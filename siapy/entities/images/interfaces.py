@@ -1,16 +1,21 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Sequence
 
 import numpy as np
 from numpy.typing import NDArray
-from PIL import Image
+from PIL import Image, ImageOps
+
+from siapy.core.exceptions import InvalidInputError
+
+from .gather import gather_pixels
 
 if TYPE_CHECKING:
     from siapy.core.types import XarrayType
 
 __all__ = [
     "ImageBase",
+    "nearest_band_indices",
 ]
 
 
@@ -103,6 +108,51 @@ class ImageBase(ABC):
         """
         pass
 
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Get the data type of the stored values.
+
+        Returns:
+            The numpy data type returned by reads, e.g. uint16 for 12-bit sensor data. The default
+            implementation reads a single value on first access and caches its type; backends should
+            override it to answer from the file metadata, as reads are planned with it.
+        """
+        dtype: np.dtype[Any] | None = getattr(self, "_read_dtype", None)
+        if dtype is None:
+            dtype = self.read_window(slice(0, 1), slice(0, 1), [0]).dtype
+            self._read_dtype = dtype
+        return dtype
+
+    @property
+    def wavelengths_array(self) -> NDArray[np.float64]:
+        """Get the wavelengths of the bands as a read-only array.
+
+        Returns:
+            A read-only float64 array with one wavelength per band. The default implementation converts
+            `wavelengths` on every access; implementations that parse wavelengths from metadata should
+            cache the array.
+        """
+        array = np.array(self.wavelengths, dtype=np.float64)
+        array.flags.writeable = False
+        return array
+
+    def nearest_bands(self, wavelengths: float | Sequence[float] | NDArray[Any]) -> NDArray[np.intp]:
+        """Find the bands whose wavelengths are closest to the given wavelengths.
+
+        Args:
+            wavelengths: A wavelength or a sequence of wavelengths to look up.
+
+        Returns:
+            The 0-based index of the nearest band for each requested wavelength, with the shape of the
+            input. Ties are resolved towards the band with the shorter wavelength.
+
+        Example:
+            ```python
+            red, green, blue = image.nearest_bands([650, 550, 450])
+            ```
+        """
+        return nearest_band_indices(self.wavelengths_array, wavelengths)
+
     @property
     @abstractmethod
     def camera_id(self) -> str:
@@ -125,18 +175,124 @@ class ImageBase(ABC):
         """
         pass
 
+    @property
+    def display_bands(self) -> list[int]:
+        """Get the 0-based positions of the bands rendered by `to_display`.
+
+        Returns:
+            The band positions passed to `read_window` when display data is read from the image. Defaults
+            to `default_bands`; implementations whose default bands are labels rather than positions
+            should override it.
+        """
+        return self.default_bands
+
+    def render_display(self, array: NDArray[Any], equalize: bool = True) -> Image.Image:
+        """Render an array of display bands as a PIL Image.
+
+        Implementations override this to share their `to_display` rendering with display data read
+        in other ways, e.g. from decimated overviews. The array may be modified in place.
+
+        Args:
+            array: A (height, width, 3) array holding the `display_bands` of (a part of) the image.
+            equalize: Whether to apply histogram equalization to enhance contrast.
+
+        Returns:
+            A PIL Image object suitable for display.
+        """
+        array = np.nan_to_num(np.asarray(array, dtype=np.float64))
+        low = array.min(axis=(0, 1), initial=np.inf)
+        span = np.maximum(array.max(axis=(0, 1), initial=-np.inf) - low, np.finfo(np.float64).eps)
+        image = Image.fromarray(((array - low) * (255.0 / span)).astype(np.uint8))
+        if equalize:
+            image = ImageOps.equalize(image)
+        return image
+
+    def replace_nan(self, array: NDArray[Any], nan_value: float) -> NDArray[Any]:
+        """Replace the NaN values of an array read from the image, as `to_numpy(nan_value=...)` does.
+
+        Implementations override this to share their `to_numpy` NaN handling with data read in other
+        ways, e.g. served from the array cache. The array is modified in place.
+
+        Args:
+            array: A writable (height, width, bands) array holding (a part of) the image data.
+            nan_value: The value to replace NaN values with.
+
+        Returns:
+            The array with NaN values replaced. Other values, including infinities, are kept.
+        """
+        array[np.isnan(array)] = nan_value
+        return array
+
     @abstractmethod
-    def to_numpy(self, nan_value: float | None = None) -> NDArray[np.floating[Any]]:
+    def to_numpy(
+        self,
+        nan_value: float | None = None,
+        *,
+        copy: bool = True,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
         """Convert the image to a numpy array.
 
         Args:
             nan_value: Optional value to replace NaN values with. If None, NaN values are preserved.
+            copy: If True, the returned array must not share memory with the image. If False, the
+                implementation may return a read-only view of the underlying data to avoid a copy.
+            bands: Optional 0-based band indices to read. If None, all bands are read. Implementations
+                should apply the selection before reading the data, so unselected bands are not loaded.
 
         Returns:
             A 3D numpy array with shape (height, width, bands) containing the image data. The array dtype should be a floating-point type.
         """
         pass
 
+    def read_window(
+        self,
+        rows: slice,
+        cols: slice,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Read a rectangular region of the image.
+
+        Args:
+            rows: Slice selecting the rows (height axis) to read.
+            cols: Slice selecting the columns (width axis) to read.
+            bands: Optional 0-based band indices to read. If None, all bands are read.
+
+        Returns:
+            A 3D numpy array with shape (rows, cols, bands) containing the requested region.
+
+        Note:
+            The default implementation loads the full image via `to_numpy()` and slices it.
+            Backends that can read regions directly from disk should override this method.
+        """
+        image = self.to_numpy()[rows, cols]
+        if bands is not None:
+            image = image[:, :, list(bands)]
+        return image
+
+    def read_pixels(
+        self,
+        rows: Sequence[int] | NDArray[np.integer[Any]],
+        cols: Sequence[int] | NDArray[np.integer[Any]],
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Read the spectra of individual pixels.
+
+        Args:
+            rows: Row index of each pixel.
+            cols: Column index of each pixel.
+            bands: Optional 0-based band indices to read. If None, all bands are read.
+
+        Returns:
+            A 2D numpy array with shape (pixels, bands), in the order the pixels were requested.
+
+        Note:
+            The default implementation deduplicates the pixels, sorts them in storage order and reads
+            the lines that contain them in strips with `read_window` (see `gather_pixels`).
+            Backends that can gather pixels more efficiently should override this method.
+        """
+        return gather_pixels(self, rows, cols, bands)
+
     @abstractmethod
     def to_xarray(self) -> "XarrayType":
         """Convert the image to an xarray DataArray.
@@ -145,3 +301,37 @@ class ImageBase(ABC):
             An xarray DataArray with labeled dimensions and coordinates, suitable for advanced analysis and visualization. The array should include appropriate coordinate information and metadata attributes.
         """
         pass
+
+
+def nearest_band_indices(
+    band_wavelengths: NDArray[np.floating[Any]], wavelengths: float | Sequence[float] | NDArray[Any]
+) -> NDArray[np.intp]:
+    """Find the bands whose wavelengths are closest to the given wavelengths with a binary search.
+
+    Args:
+        band_wavelengths: The wavelength of each band, in any order.
+        wavelengths: A wavelength or a sequence of wavelengths to look up.
+
+    Returns:
+        The 0-based index of the nearest band for each requested wavelength, with the shape of the input.
+
+    Raises:
+        InvalidInputError: If there are no bands.
+    """
+    band_wavelengths = np.asarray(band_wavelengths, dtype=np.float64)
+    if band_wavelengths.size == 0:
+        raise InvalidInputError(wavelengths, "Cannot look up wavelengths of an image without bands")
+    targets = np.asarray(wavelengths, dtype=np.float64)
+    order = None
+    if band_wavelengths.size > 1 and np.any(band_wavelengths[1:] < band_wavelengths[:-1]):
+        order = np.argsort(band_wavelengths, kind="stable")
+        band_wavelengths = band_wavelengths[order]
+
+    right = np.clip(np.searchsorted(band_wavelengths, targets), 1, band_wavelengths.size - 1)
+    left = right - 1
+    if band_wavelengths.size == 1:
+        indices = np.zeros(targets.shape, dtype=np.intp)
+    else:
+        closer_right = band_wavelengths[right] - targets < targets - band_wavelengths[left]
+        indices = np.where(closer_right, right, left).astype(np.intp)
+    return indices if order is None else order[indices]
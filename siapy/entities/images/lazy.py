@@ -0,0 +1,229 @@
+"""Image backend that defers opening the file until it is first used.
+
+Opening an image parses its header and opens the file, which on network-mounted storage dominates
+the time needed to set up a large image set. A `LazyImage` only records how to open the image; the
+wrapped backend is opened on the first access to the data or metadata and is reused afterwards.
+"""
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image
+
+from .interfaces import ImageBase
+
+if TYPE_CHECKING:
+    from siapy.core.types import XarrayType
+
+__all__ = [
+    "LazyImage",
+]
+
+
+class LazyImage(ImageBase):
+    def __init__(
+        self,
+        opener: Callable[[], ImageBase],
+        filepath: str | Path | None = None,
+        *,
+        shape: tuple[int, int, int] | None = None,
+        dtype: np.dtype[Any] | str | None = None,
+        wavelengths: Sequence[float] | NDArray[Any] | None = None,
+        camera_id: str | None = None,
+    ):
+        """Initialize a lazily opened image.
+
+        All properties and reads delegate to the image backend, which is opened on first use and kept
+        afterwards. Concurrent first accesses open the backend only once.
+
+        Args:
+            opener: Callable without arguments that opens the image backend, e.g.
+                `functools.partial(SpectralLibImage.open, header_path="image.hdr")`.
+            filepath: Optional path of the image file. If given, `filepath` is answered without opening
+                the image; otherwise the image is opened to resolve it.
+            shape: Optional known (rows, cols, bands) of the image, e.g. from a catalog.
+            dtype: Optional known data type of the image file.
+            wavelengths: Optional known wavelengths of the bands.
+            camera_id: Optional known camera identifier.
+
+        Note:
+            Known values are answered without opening the image, until it is opened for another reason;
+            they are not checked against the file.
+        """
+        self._opener = opener
+        self._filepath = Path(filepath) if filepath is not None else None
+        self._shape = tuple(int(size) for size in shape) if shape is not None else None
+        self._dtype = np.dtype(dtype) if dtype is not None else None
+        self._wavelengths: NDArray[np.float64] | None = None
+        if wavelengths is not None:
+            self._wavelengths = np.array(wavelengths, dtype=np.float64)
+            self._wavelengths.flags.writeable = False
+        self._camera_id = camera_id
+        self._image: ImageBase | None = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # backend-specific members (e.g. `as_memmap` of SpectralLibImage) open the image on first use
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.image, name)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the lock cannot be pickled; an unopened image stays unopened in the receiving process
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, opener: Callable[[], ImageBase], filepath: str | Path | None = None) -> "LazyImage":
+        """Create a lazily opened image without touching the file.
+
+        Args:
+            opener: Callable without arguments that opens the image backend.
+            filepath: Optional path of the image file.
+
+        Returns:
+            A LazyImage that opens the backend on first use.
+
+        Example:
+            ```python
+            from functools import partial
+
+            image = LazyImage.open(partial(RasterioLibImage.open, "image.tif"), filepath="image.tif")
+            image.loaded  # False
+            image.shape  # opens the file
+            ```
+        """
+        return cls(opener, filepath)
+
+    @property
+    def loaded(self) -> bool:
+        """Check whether the image backend has been opened.
+
+        Returns:
+            True if the image has been opened.
+        """
+        return self._image is not None
+
+    @property
+    def image(self) -> ImageBase:
+        """Get the image backend, opening it on first access.
+
+        Returns:
+            The opened image backend.
+
+        Raises:
+            SiapyError: Any error raised by the opener, e.g. InvalidFilepathError for a missing file.
+                A failed open is retried on the next access.
+        """
+        if self._image is None:
+            with self._lock:
+                if self._image is None:
+                    self._image = self._opener()
+        return self._image
+
+    @property
+    def filepath(self) -> Path:
+        """Get the file path of the image, opening it only if no path was given on creation.
+
+        Returns:
+            A Path object representing the location of the image file.
+        """
+        if self._filepath is not None:
+            return self._filepath
+        return self.image.filepath
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return self.image.metadata
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        if self._image is None and self._shape is not None:
+            return self._shape  # type: ignore[return-value]
+        return self.image.shape
+
+    @property
+    def bands(self) -> int:
+        if self._image is None and self._shape is not None:
+            return self._shape[2]
+        return self.image.bands
+
+    @property
+    def default_bands(self) -> list[int]:
+        return self.image.default_bands
+
+    @property
+    def wavelengths(self) -> list[float]:
+        if self._image is None and self._wavelengths is not None:
+            return self._wavelengths.tolist()
+        return self.image.wavelengths
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        if self._image is None and self._dtype is not None:
+            return self._dtype
+        return self.image.dtype
+
+    @property
+    def wavelengths_array(self) -> NDArray[np.float64]:
+        if self._image is None and self._wavelengths is not None:
+            return self._wavelengths
+        return self.image.wavelengths_array
+
+    def nearest_bands(self, wavelengths: float | Sequence[float] | NDArray[Any]) -> NDArray[np.intp]:
+        return self.image.nearest_bands(wavelengths)
+
+    @property
+    def camera_id(self) -> str:
+        if self._image is None and self._camera_id is not None:
+            return self._camera_id
+        return self.image.camera_id
+
+    @property
+    def display_bands(self) -> list[int]:
+        return self.image.display_bands
+
+    def to_display(self, equalize: bool = True) -> Image.Image:
+        return self.image.to_display(equalize)
+
+    def render_display(self, array: NDArray[Any], equalize: bool = True) -> Image.Image:
+        return self.image.render_display(array, equalize)
+
+    def replace_nan(self, array: NDArray[Any], nan_value: float) -> NDArray[Any]:
+        return self.image.replace_nan(array, nan_value)
+
+    def to_numpy(
+        self,
+        nan_value: float | None = None,
+        *,
+        copy: bool = True,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        return self.image.to_numpy(nan_value, copy=copy, bands=bands)
+
+    def read_window(
+        self,
+        rows: slice,
+        cols: slice,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        return self.image.read_window(rows, cols, bands)
+
+    def read_pixels(
+        self,
+        rows: Sequence[int] | NDArray[np.integer[Any]],
+        cols: Sequence[int] | NDArray[np.integer[Any]],
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        return self.image.read_pixels(rows, cols, bands)
+
+    def to_xarray(self) -> "XarrayType":
+        return self.image.to_xarray()
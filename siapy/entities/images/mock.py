@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Sequence
 
 import numpy as np
 import xarray as xr
@@ -16,13 +16,14 @@ if TYPE_CHECKING:
 class MockImage(ImageBase):
     def __init__(
         self,
-        array: NDArray[np.floating[Any]],
+        array: NDArray[np.floating[Any]] | NDArray[np.integer[Any]],
     ) -> None:
         """Initialize a MockImage from a numpy array.
 
         Args:
             array: A 3D numpy array with shape (height, width, bands) containing spectral data.
-                   The array will be automatically converted to float32 dtype.
+                   Floating-point and integer arrays keep their data type; other arrays are converted
+                   to float32.
 
         Raises:
             InvalidInputError: If the input array is not 3-dimensional.
@@ -37,7 +38,8 @@ class MockImage(ImageBase):
             ```
 
         Note:
-            The input array is automatically converted to float32 dtype regardless of input type.
+            Integer data, e.g. 12-bit sensor data in uint16, is not upcast. Use the dtype policy of
+            `SpectralImage` to read it as floating point.
         """
         if len(array.shape) != 3:
             raise InvalidInputError(
@@ -45,10 +47,13 @@ class MockImage(ImageBase):
                 message="Input array must be 3-dimensional (height, width, bands)",
             )
 
-        self._array = array.astype(np.float32)
+        if np.issubdtype(array.dtype, np.floating) or np.issubdtype(array.dtype, np.integer):
+            self._array = np.array(array)
+        else:
+            self._array = array.astype(np.float32)
 
     @classmethod
-    def open(cls, array: NDArray[np.floating[Any]]) -> "MockImage":
+    def open(cls, array: NDArray[np.floating[Any]] | NDArray[np.integer[Any]]) -> "MockImage":
         """Create a MockImage instance from a numpy array.
 
         Args:
@@ -107,6 +112,15 @@ class MockImage(ImageBase):
         """
         return self._array.shape[2]
 
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Get the data type of the mock image.
+
+        Returns:
+            The numpy data type of the underlying array.
+        """
+        return self._array.dtype
+
     @property
     def default_bands(self) -> list[int]:
         """Get the default band indices for RGB display.
@@ -160,33 +174,57 @@ class MockImage(ImageBase):
             during the scaling process. The method always returns an RGB image regardless
             of the number of input bands.
         """
-        if self.bands >= 3:
-            display_bands = self._array[:, :, self.default_bands]
-        else:
-            display_bands = np.stack([self._array[:, :, 0]] * 3, axis=2)
+        return self.render_display(self._array[:, :, self.display_bands], equalize)
 
+    @property
+    def display_bands(self) -> list[int]:
+        """Get the 0-based positions of the bands rendered by `to_display`.
+
+        Returns:
+            The first 3 bands for images with 3+ bands; otherwise the first band repeated for all RGB channels.
+        """
+        return self.default_bands if self.bands >= 3 else [0, 0, 0]
+
+    def render_display(self, array: NDArray[Any], equalize: bool = True) -> Image.Image:
+        """Render an array of the display bands as a PIL Image, the same way as `to_display`.
+
+        Args:
+            array: A (height, width, 3) array of the display bands. It is modified in place.
+            equalize: Whether to apply histogram equalization to enhance contrast. Defaults to True.
+
+        Returns:
+            A PIL Image object suitable for display.
+        """
         if equalize:
-            for i in range(display_bands.shape[2]):
-                band = display_bands[:, :, i]
+            for i in range(array.shape[2]):
+                band = array[:, :, i]
                 non_nan = ~np.isnan(band)
                 if np.any(non_nan):
                     min_val = np.nanmin(band)
                     max_val = np.nanmax(band)
                     if max_val > min_val:
                         band = (band - min_val) / (max_val - min_val) * 255
-                    display_bands[:, :, i] = band
+                    array[:, :, i] = band
 
-        display_array = np.nan_to_num(display_bands).astype(np.uint8)
+        display_array = np.nan_to_num(array).astype(np.uint8)
         return Image.fromarray(display_array)
 
-    def to_numpy(self, nan_value: float | None = None) -> NDArray[np.floating[Any]]:
+    def to_numpy(
+        self,
+        nan_value: float | None = None,
+        *,
+        copy: bool = True,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
         """Convert the mock image to a numpy array.
 
         Args:
             nan_value: Optional value to replace NaN values with. If None, NaN values are preserved.
+            copy: If True, return a copy of the underlying array. If False, return a read-only view of it.
+            bands: Optional 0-based band indices to select. If None, all bands are returned.
 
         Returns:
-            A copy of the underlying 3D numpy array with shape (height, width, bands). If nan_value is provided, all NaN values are replaced with this value.
+            The underlying 3D numpy array with shape (height, width, bands), either copied or as a read-only view. If nan_value is provided, all NaN values are replaced with this value in a new array.
 
         Example:
             ```python
@@ -197,9 +235,45 @@ class MockImage(ImageBase):
             data = mock_image.to_numpy(nan_value=0.0)
             ```
         """
+        if bands is not None:
+            image = self._array[:, :, list(bands)]
+            if nan_value is not None:
+                image = np.nan_to_num(image, nan=nan_value, copy=False)
+            return image
         if nan_value is not None:
             return np.nan_to_num(self._array, nan=nan_value)
-        return self._array.copy()
+        if copy:
+            return self._array.copy()
+        view = self._array.view()
+        view.flags.writeable = False
+        return view
+
+    def read_window(
+        self,
+        rows: slice,
+        cols: slice,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Read a rectangular region of the mock image.
+
+        Args:
+            rows: Slice selecting the rows (height axis) to read.
+            cols: Slice selecting the columns (width axis) to read.
+            bands: Optional 0-based band indices to read. If None, all bands are read.
+
+        Returns:
+            A copy of the requested region with shape (rows, cols, bands).
+
+        Example:
+            ```python
+            # Read the top-left 10x10 region of the first band
+            region = mock_image.read_window(slice(0, 10), slice(0, 10), bands=[0])
+            ```
+        """
+        region = self._array[rows, cols]
+        if bands is not None:
+            return region[:, :, list(bands)]
+        return region.copy()
 
     def to_xarray(self) -> "XarrayType":
         """Convert the mock image to an xarray DataArray.
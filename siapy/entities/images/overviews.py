@@ -0,0 +1,172 @@
+"""Decimated overviews of the display bands for fast previews.
+
+Rendering a preview of a large scan from full-resolution data reads far more than the screen can
+show. An overview pyramid keeps the display bands at 2x, 4x and 8x decimation, built once from
+strided reads and stored in a sidecar file next to the image (or in a cache directory), so later
+previews only read a small compressed file.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from siapy.core import logger
+from siapy.core.exceptions import InvalidInputError
+
+from .interfaces import ImageBase
+
+__all__ = [
+    "OVERVIEW_FACTORS",
+    "Overviews",
+    "build_overviews",
+    "load_overviews",
+    "save_overviews",
+    "overviews_path",
+]
+
+OVERVIEW_FACTORS = (2, 4, 8)
+
+_SIDECAR_SUFFIX = ".overviews.npz"
+
+
+@dataclass(frozen=True)
+class Overviews:
+    """Decimated copies of the display bands of an image.
+
+    Attributes:
+        shape: The (height, width) of the full-resolution image.
+        bands: The 0-based positions of the display bands the overviews hold.
+        levels: Mapping from decimation factor to the (height, width, bands) overview array.
+    """
+
+    shape: tuple[int, int]
+    bands: tuple[int, ...]
+    levels: dict[int, NDArray[Any]]
+
+    def select(self, max_size: int) -> int | None:
+        """Select the coarsest overview that still has at least `max_size` pixels along its longer side.
+
+        Args:
+            max_size: The requested size of the longer side of the preview.
+
+        Returns:
+            The decimation factor of the selected level, or None if even the finest level is smaller
+            than `max_size` and the full-resolution image should be used instead.
+        """
+        for factor in sorted(self.levels, reverse=True):
+            if max(self.levels[factor].shape[:2]) >= max_size:
+                return factor
+        return None
+
+
+def build_overviews(image: ImageBase, factors: Sequence[int] = OVERVIEW_FACTORS) -> Overviews:
+    """Build overviews of the display bands of an image from strided reads.
+
+    The finest level is read from the image with a strided window; coarser levels whose factor is a
+    multiple of it are decimated from that level instead of being read again.
+
+    Args:
+        image: The image backend.
+        factors: The decimation factors of the levels.
+
+    Returns:
+        The overviews of the image.
+
+    Raises:
+        InvalidInputError: If no factors are given or a factor is smaller than 2.
+    """
+    factors = sorted({int(factor) for factor in factors})
+    if not factors or factors[0] < 2:
+        raise InvalidInputError({"factors": factors}, "Overview factors must be integers of at least 2")
+
+    bands = list(image.display_bands)
+    levels: dict[int, NDArray[Any]] = {}
+    base_factor = factors[0]
+    base = image.read_window(slice(None, None, base_factor), slice(None, None, base_factor), bands)
+    for factor in factors:
+        if factor % base_factor == 0:
+            step = factor // base_factor
+            levels[factor] = np.ascontiguousarray(base[::step, ::step])
+        else:
+            levels[factor] = image.read_window(slice(None, None, factor), slice(None, None, factor), bands)
+    return Overviews((image.shape[0], image.shape[1]), tuple(bands), levels)
+
+
+def overviews_path(filepath: str | Path, cache_dir: str | Path | None = None) -> Path:
+    """Get the path of the overview sidecar file of an image.
+
+    Args:
+        filepath: Path of the image file.
+        cache_dir: Optional directory holding the overview files. If None, the sidecar is stored next
+            to the image.
+
+    Returns:
+        The sidecar path. Files in a cache directory are named by a hash of the resolved image path,
+        so images with the same name in different directories do not collide.
+    """
+    filepath = Path(filepath)
+    if cache_dir is None:
+        return filepath.with_name(filepath.name + _SIDECAR_SUFFIX)
+    digest = hashlib.sha1(str(filepath.resolve()).encode()).hexdigest()[:16]
+    return Path(cache_dir) / f"{filepath.stem}-{digest}{_SIDECAR_SUFFIX}"
+
+
+def save_overviews(overviews: Overviews, image: ImageBase, cache_dir: str | Path | None = None) -> Path:
+    """Store overviews in the sidecar file of an image.
+
+    The sidecar records the modification time and size of the image file, so it is ignored once the
+    image is rewritten.
+
+    Args:
+        overviews: The overviews to store.
+        image: The image backend the overviews were built from.
+        cache_dir: Optional directory holding the overview files. If None, the sidecar is stored next
+            to the image.
+
+    Returns:
+        The path of the written sidecar file.
+    """
+    path = overviews_path(image.filepath, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stat = image.filepath.stat()
+    arrays = {f"level_{factor}": level for factor, level in overviews.levels.items()}
+    np.savez_compressed(
+        path,
+        source=np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64),
+        shape=np.array(overviews.shape, dtype=np.int64),
+        bands=np.array(overviews.bands, dtype=np.int64),
+        **arrays,
+    )
+    return path
+
+
+def load_overviews(image: ImageBase, cache_dir: str | Path | None = None) -> Overviews | None:
+    """Load the overviews of an image from its sidecar file.
+
+    Args:
+        image: The image backend.
+        cache_dir: Optional directory holding the overview files. If None, the sidecar next to the image
+            is used.
+
+    Returns:
+        The stored overviews, or None if there is no sidecar, or it is stale or unreadable.
+    """
+    path = overviews_path(image.filepath, cache_dir)
+    if not path.is_file():
+        return None
+    try:
+        with np.load(path) as data:
+            stat = image.filepath.stat()
+            bands = tuple(int(band) for band in data["bands"])
+            if data["source"].tolist() != [stat.st_mtime_ns, stat.st_size] or bands != tuple(image.display_bands):
+                return None
+            levels = {int(key.removeprefix("level_")): data[key] for key in data.files if key.startswith("level_")}
+            shape = (int(data["shape"][0]), int(data["shape"][1]))
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Ignoring unreadable overview file %s: %s", path, e)
+        return None
+    return Overviews(shape, bands, levels)
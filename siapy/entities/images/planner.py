@@ -0,0 +1,297 @@
+"""Interleave-aware read planning for memory-mapped spectral images.
+
+The cost of reading from an uncompressed image file depends on how the requested access
+pattern lines up with the file layout. Band planes are contiguous in band-sequential (BSQ)
+files, pixel spectra are contiguous in band-interleaved-by-pixel (BIP) files and image lines
+are contiguous in band-interleaved-by-line (BIL) files. The planner picks the loop order and
+chunking that turn a request into sequential, page-cache friendly reads, and the executor
+carries the plan out on a (rows, cols, bands) memory-mapped view of the file.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Literal, Sequence, TypeAlias
+
+import numpy as np
+from numpy.typing import NDArray
+
+from siapy.core.exceptions import InvalidInputError
+
+__all__ = [
+    "ReadPlan",
+    "ReadAccessType",
+    "InterleaveType",
+    "plan_pixels_read",
+    "plan_tile_read",
+    "plan_bands_read",
+    "execute_read_plan",
+]
+
+ReadAccessType: TypeAlias = Literal["pixels", "bands", "tile"]
+InterleaveType: TypeAlias = Literal["bsq", "bil", "bip"]
+
+# Upper bound on the size of the file region covered by a single chunk of a plan.
+DEFAULT_CHUNK_BYTES = 64 * 1024**2
+
+
+@dataclass(frozen=True)
+class ReadPlan:
+    """Description of how a read request is executed against the file layout.
+
+    Attributes:
+        access: The requested access pattern: a gather of individual pixels, a stack of full bands,
+            or a rectangular tile.
+        interleave: The interleave of the source file.
+        outer_axis: The axis iterated in the outer loop. "band" means one contiguous band plane is
+            swept at a time; "row" means consecutive image lines are read in chunks.
+        rows: Row selection of the request. For pixel access, the row of each requested pixel.
+        cols: Column selection of the request. For pixel access, the column of each requested pixel.
+        bands: The 0-based band indices to read.
+        chunks: Chunks of the outer loop, in execution order. For a "band" outer axis these are
+            ranges of positions in `bands`; for a "row" outer axis they are ascending ranges of rows
+            (tiles), also for a negative row step, or ranges of positions in `order` (pixels).
+        order: For pixel access, the permutation that sorts the requested pixels by storage order.
+    """
+
+    access: ReadAccessType
+    interleave: InterleaveType
+    outer_axis: Literal["band", "row"]
+    rows: slice | NDArray[np.intp]
+    cols: slice | NDArray[np.intp]
+    bands: tuple[int, ...]
+    chunks: tuple[slice, ...]
+    order: NDArray[np.intp] | None = field(default=None, repr=False)
+
+    def describe(self) -> str:
+        """Get a short human-readable summary of the plan, useful for debugging.
+
+        Returns:
+            A one-line description of the access pattern, loop order and chunking.
+
+        Example:
+            ```python
+            plan = spectral_lib_image.plan_read("pixels", rows=rows, cols=cols)
+            print(plan.describe())
+            # pixels read on bsq file: 50000 pixels x 224 bands, band-outer in 224 chunks
+            ```
+        """
+        if self.access == "pixels":
+            extent = f"{len(self.rows)} pixels"  # type: ignore[arg-type]
+        else:
+            extent = f"rows {_format_slice(self.rows)}, cols {_format_slice(self.cols)}"  # type: ignore[arg-type]
+        return (
+            f"{self.access} read on {self.interleave} file: {extent} x {len(self.bands)} bands, "
+            f"{self.outer_axis}-outer in {len(self.chunks)} chunks"
+        )
+
+
+def plan_pixels_read(
+    rows: Sequence[int] | NDArray[np.integer[Any]],
+    cols: Sequence[int] | NDArray[np.integer[Any]],
+    bands: Sequence[int],
+    *,
+    shape: tuple[int, int, int],
+    interleave: InterleaveType,
+    itemsize: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> ReadPlan:
+    """Plan a gather of individual pixel spectra.
+
+    Pixels are always visited in storage (row-major) order. On BSQ files each band plane is swept
+    once for all pixels, so every plane is read front to back. On BIL and BIP files the sorted pixels
+    are grouped into chunks covering a bounded number of consecutive lines, and all requested bands
+    of a chunk are read together.
+
+    Args:
+        rows: Row index of each requested pixel.
+        cols: Column index of each requested pixel.
+        bands: The 0-based band indices to read.
+        shape: Image shape as (rows, cols, bands).
+        interleave: Interleave of the source file.
+        itemsize: Size of a single value in bytes.
+        chunk_bytes: Upper bound on the file region covered by one chunk.
+
+    Returns:
+        The read plan.
+    """
+    rows_arr = np.asarray(rows, dtype=np.intp).reshape(-1)
+    cols_arr = np.asarray(cols, dtype=np.intp).reshape(-1)
+    if rows_arr.shape != cols_arr.shape:
+        raise InvalidInputError(
+            {"rows": rows_arr.shape, "cols": cols_arr.shape},
+            "Rows and cols of the requested pixels must have the same length",
+        )
+    _validate_interleave(interleave)
+    order = np.lexsort((cols_arr, rows_arr)).astype(np.intp)
+    band_tuple = tuple(int(b) for b in bands)
+
+    if interleave == "bsq":
+        chunks = tuple(slice(idx, idx + 1) for idx in range(len(band_tuple)))
+        return ReadPlan("pixels", interleave, "band", rows_arr, cols_arr, band_tuple, chunks, order)
+
+    rows_per_chunk = _rows_per_chunk(shape, itemsize, chunk_bytes)
+    sorted_rows = rows_arr[order]
+    chunk_ids = (sorted_rows - sorted_rows[0]) // rows_per_chunk if len(sorted_rows) else sorted_rows
+    boundaries = np.flatnonzero(np.diff(chunk_ids)) + 1
+    starts = np.concatenate(([0], boundaries)) if len(sorted_rows) else np.array([], dtype=np.intp)
+    stops = np.concatenate((boundaries, [len(sorted_rows)])) if len(sorted_rows) else starts
+    chunks = tuple(slice(int(start), int(stop)) for start, stop in zip(starts, stops))
+    return ReadPlan("pixels", interleave, "row", rows_arr, cols_arr, band_tuple, chunks, order)
+
+
+def plan_tile_read(
+    rows: slice,
+    cols: slice,
+    bands: Sequence[int],
+    *,
+    shape: tuple[int, int, int],
+    interleave: InterleaveType,
+    itemsize: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> ReadPlan:
+    """Plan a read of a rectangular tile.
+
+    On BSQ files the tile is read one band plane at a time. On BIL and BIP files it is read in
+    chunks of consecutive lines, each covering a bounded region of the file.
+
+    Args:
+        rows: Slice selecting the rows of the tile.
+        cols: Slice selecting the columns of the tile.
+        bands: The 0-based band indices to read.
+        shape: Image shape as (rows, cols, bands).
+        interleave: Interleave of the source file.
+        itemsize: Size of a single value in bytes.
+        chunk_bytes: Upper bound on the file region covered by one chunk.
+
+    Returns:
+        The read plan.
+    """
+    return _plan_region_read("tile", rows, cols, bands, shape, interleave, itemsize, chunk_bytes)
+
+
+def plan_bands_read(
+    bands: Sequence[int],
+    *,
+    shape: tuple[int, int, int],
+    interleave: InterleaveType,
+    itemsize: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> ReadPlan:
+    """Plan a read of a stack of full bands.
+
+    Args:
+        bands: The 0-based band indices to read.
+        shape: Image shape as (rows, cols, bands).
+        interleave: Interleave of the source file.
+        itemsize: Size of a single value in bytes.
+        chunk_bytes: Upper bound on the file region covered by one chunk.
+
+    Returns:
+        The read plan.
+    """
+    return _plan_region_read(
+        "bands", slice(0, shape[0]), slice(0, shape[1]), bands, shape, interleave, itemsize, chunk_bytes
+    )
+
+
+def execute_read_plan(image: NDArray[Any], plan: ReadPlan) -> NDArray[Any]:
+    """Execute a read plan against a (rows, cols, bands) view of the image file.
+
+    Args:
+        image: A (rows, cols, bands) array view of the file, typically a memory map.
+        plan: The plan to execute.
+
+    Returns:
+        For pixel access, an array of shape (pixels, bands) in the order the pixels were requested.
+        For band and tile access, an array of shape (rows, cols, bands).
+    """
+    bands = list(plan.bands)
+    if plan.access == "pixels":
+        assert plan.order is not None
+        rows = plan.rows[plan.order]  # type: ignore[index]
+        cols = plan.cols[plan.order]  # type: ignore[index]
+        output = np.empty((len(plan.order), len(bands)), dtype=image.dtype)
+        if plan.outer_axis == "band":
+            # Gather band by band into a band-major buffer, then restore the requested order once
+            sorted_spectra = np.empty((len(bands), len(plan.order)), dtype=image.dtype)
+            linear = rows * image.shape[1] + cols
+            for chunk in plan.chunks:
+                for position, band in zip(range(chunk.start, chunk.stop), bands[chunk]):
+                    plane = image[:, :, band]
+                    if plane.flags.c_contiguous:
+                        sorted_spectra[position] = np.take(plane.reshape(-1), linear)
+                    else:
+                        sorted_spectra[position] = plane[rows, cols]
+            output[plan.order] = sorted_spectra.T
+        else:
+            for chunk in plan.chunks:
+                output[plan.order[chunk]] = image[rows[chunk], cols[chunk]][:, bands]
+        return output
+
+    rows_range = range(*plan.rows.indices(image.shape[0]))  # type: ignore[union-attr]
+    cols_range = range(*plan.cols.indices(image.shape[1]))  # type: ignore[union-attr]
+    output = np.empty((len(rows_range), len(cols_range), len(bands)), dtype=image.dtype)
+    if plan.outer_axis == "band":
+        for chunk in plan.chunks:
+            for position, band in zip(range(chunk.start, chunk.stop), bands[chunk]):
+                output[:, :, position] = image[plan.rows, plan.cols, band]
+    else:
+        target = output[::-1] if rows_range.step < 0 else output
+        rows_range = _ascending(rows_range)
+        step = rows_range.step
+        for chunk in plan.chunks:
+            out_rows = slice(
+                (chunk.start - rows_range.start) // step, (chunk.stop - rows_range.start + step - 1) // step
+            )
+            target[out_rows] = image[chunk, plan.cols][:, :, bands]
+    return output
+
+
+def _plan_region_read(
+    access: ReadAccessType,
+    rows: slice,
+    cols: slice,
+    bands: Sequence[int],
+    shape: tuple[int, int, int],
+    interleave: InterleaveType,
+    itemsize: int,
+    chunk_bytes: int,
+) -> ReadPlan:
+    _validate_interleave(interleave)
+    band_tuple = tuple(int(b) for b in bands)
+    if interleave == "bsq":
+        chunks = tuple(slice(idx, idx + 1) for idx in range(len(band_tuple)))
+        return ReadPlan(access, interleave, "band", rows, cols, band_tuple, chunks)
+
+    # a negative row step is read in ascending file order and reversed by the executor
+    rows_range = _ascending(range(*rows.indices(shape[0])))
+    rows_per_chunk = _rows_per_chunk(shape, itemsize, chunk_bytes)
+    # Round to a multiple of the step so every chunk starts on a selected row
+    span = max(rows_per_chunk // rows_range.step, 1) * rows_range.step
+    chunks = tuple(
+        slice(start, min(start + span, rows_range.stop), rows_range.step)
+        for start in range(rows_range.start, rows_range.stop, span)
+    )
+    return ReadPlan(access, interleave, "row", rows, cols, band_tuple, chunks)
+
+
+def _ascending(selection: range) -> range:
+    """Get the rows of a range in ascending order."""
+    return selection[::-1] if selection.step < 0 else selection
+
+
+def _rows_per_chunk(shape: tuple[int, int, int], itemsize: int, chunk_bytes: int) -> int:
+    """Number of full image lines (all bands) that fit into the chunk byte budget."""
+    line_bytes = max(shape[1] * shape[2] * itemsize, 1)
+    return max(chunk_bytes // line_bytes, 1)
+
+
+def _validate_interleave(interleave: str) -> None:
+    if interleave not in ("bsq", "bil", "bip"):
+        raise InvalidInputError(interleave, "Interleave must be one of 'bsq', 'bil' or 'bip'")
+
+
+def _format_slice(selection: slice) -> str:
+    start = "" if selection.start is None else selection.start
+    stop = "" if selection.stop is None else selection.stop
+    step = "" if selection.step in (None, 1) else f":{selection.step}"
+    return f"[{start}:{stop}{step}]"
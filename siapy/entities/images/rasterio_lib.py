@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Sequence
 
 import numpy as np
 import rioxarray
@@ -12,7 +12,7 @@ from siapy.core.exceptions import InvalidFilepathError, InvalidInputError
 from .interfaces import ImageBase
 
 if TYPE_CHECKING:
-    from siapy.core.types import XarrayType
+    from siapy.core.types import ChunksType, XarrayType
 
 __all__ = [
     "RasterioLibImage",
@@ -30,11 +30,14 @@ class RasterioLibImage(ImageBase):
         self._file = file
 
     @classmethod
-    def open(cls, filepath: str | Path) -> "RasterioLibImage":
+    def open(cls, filepath: str | Path, *, chunks: "ChunksType | None" = None) -> "RasterioLibImage":
         """Open a raster image using the rioxarray library.
 
         Args:
             filepath: Path to the raster file (supports formats like GeoTIFF, NetCDF, HDF5, etc.).
+            chunks: Optional dask chunking passed to rioxarray.open_rasterio() (an int, a tuple in
+                (band, y, x) order, "auto", or a dict keyed by dimension name). If set, the data is
+                backed by a lazy dask array and read chunk by chunk on demand.
 
         Returns:
             A RasterioLibImage instance wrapping the opened raster data.
@@ -52,6 +55,9 @@ class RasterioLibImage(ImageBase):
 
             # Open a NetCDF file
             image = RasterioLibImage.open("climate_data.nc")
+
+            # Open for lazy, chunked processing with dask
+            image = RasterioLibImage.open("satellite_image.tif", chunks={"y": 512, "x": 512})
             ```
 
         Note:
@@ -63,7 +69,7 @@ class RasterioLibImage(ImageBase):
             raise InvalidFilepathError(filepath)
 
         try:
-            raster = rioxarray.open_rasterio(filepath)
+            raster = rioxarray.open_rasterio(filepath, chunks=chunks)  # type: ignore[arg-type]
         except Exception as e:
             raise InvalidInputError({"filepath": str(filepath)}, f"Failed to open raster file: {e}") from e
 
@@ -136,6 +142,15 @@ class RasterioLibImage(ImageBase):
         """
         return self.file.band.size
 
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Get the data type of the stored values.
+
+        Returns:
+            The numpy data type of the raster bands.
+        """
+        return np.dtype(self.file.dtype)
+
     @property
     def default_bands(self) -> list[int]:
         """Get the default band indices for RGB display.
@@ -196,8 +211,30 @@ class RasterioLibImage(ImageBase):
             ```
         """
         bands_data = self.file.sel(band=self.default_bands)
-        image_3ch = bands_data.transpose("y", "x", "band").values
-        image_3ch_clean = np.nan_to_num(np.asarray(image_3ch))
+        image_3ch = np.asarray(bands_data.transpose("y", "x", "band").values)
+        return self.render_display(image_3ch, equalize)
+
+    @property
+    def display_bands(self) -> list[int]:
+        """Get the 0-based positions of the default bands.
+
+        Returns:
+            The positions of the 1-based `default_bands` labels along the band dimension.
+        """
+        labels = self.file.band.values
+        return [int(np.flatnonzero(labels == band)[0]) for band in self.default_bands]
+
+    def render_display(self, array: NDArray[Any], equalize: bool = True) -> Image.Image:
+        """Render an array of the default bands as a PIL Image, the same way as `to_display`.
+
+        Args:
+            array: A (height, width, 3) array of the default bands.
+            equalize: Whether to apply histogram equalization to enhance contrast. Defaults to True.
+
+        Returns:
+            A PIL Image object with values scaled to 0-255 range and optional histogram equalization.
+        """
+        image_3ch_clean = np.nan_to_num(np.asarray(array))
         min_val = np.nanmin(image_3ch_clean)
         max_val = np.nanmax(image_3ch_clean)
 
@@ -208,11 +245,21 @@ class RasterioLibImage(ImageBase):
             image = ImageOps.equalize(image)
         return image
 
-    def to_numpy(self, nan_value: float | None = None) -> NDArray[np.floating[Any]]:
+    def to_numpy(
+        self,
+        nan_value: float | None = None,
+        *,
+        copy: bool = True,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
         """Convert the image to a numpy array.
 
         Args:
             nan_value: Optional value to replace NaN values with. If None, NaN values are preserved.
+            copy: If True, return an independent array. If False, return a read-only view of the data
+                loaded by xarray, without copying it.
+            bands: Optional 0-based band positions to read. The selection is applied before the data
+                is loaded, so only the selected bands are read from the file.
 
         Returns:
             A 3D numpy array with shape (height, width, bands) containing the raster data. The array is transposed from rioxarray's native (band, y, x) to (y, x, band) format.
@@ -226,11 +273,51 @@ class RasterioLibImage(ImageBase):
             data = raster_image.to_numpy(nan_value=0.0)
             ```
         """
-        image = np.asarray(self.file.transpose("y", "x", "band").values)
+        raster = self.file if bands is None else self.file.isel(band=list(bands))
+        image = np.asarray(raster.transpose("y", "x", "band").values)
         if nan_value is not None:
-            image = np.nan_to_num(image, nan=nan_value)
+            return self.replace_nan(image if raster.chunks is not None else image.copy(), nan_value)
+        if copy:
+            # Computing a dask-backed raster already yields a fresh array
+            return image if raster.chunks is not None else image.copy()
+        image = image.view()
+        image.flags.writeable = False
         return image
 
+    def read_window(
+        self,
+        rows: slice,
+        cols: slice,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Read a rectangular region of the raster.
+
+        The selection is applied to the lazily opened raster before any data is loaded, so rioxarray
+        translates it into a windowed rasterio read and only the requested region is read from disk.
+
+        Args:
+            rows: Slice selecting the rows (y axis) to read.
+            cols: Slice selecting the columns (x axis) to read.
+            bands: Optional 0-based band positions to read. If None, all bands are read.
+
+        Returns:
+            A 3D numpy array with shape (rows, cols, bands) containing the requested region.
+
+        Note:
+            Band selection is positional (0-based), unlike `default_bands`, which returns
+            1-based band labels as used by rioxarray.
+
+        Example:
+            ```python
+            # Read a 200x200 panel of the first two bands
+            panel = raster_image.read_window(slice(100, 300), slice(400, 600), bands=[0, 1])
+            ```
+        """
+        selection = self.file.isel(y=rows, x=cols)
+        if bands is not None:
+            selection = selection.isel(band=list(bands))
+        return np.asarray(selection.transpose("y", "x", "band").values)
+
     def to_xarray(self) -> "XarrayType":
         """Convert the image to an xarray DataArray.
 
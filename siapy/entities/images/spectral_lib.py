@@ -1,8 +1,9 @@
 # mypy: ignore-errors
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Sequence
 
+import dask.array as da
 import numpy as np
 import spectral as sp
 import xarray as xr
@@ -11,36 +12,76 @@ from PIL import Image, ImageOps
 
 from siapy.core.exceptions import InvalidFilepathError, InvalidInputError
 
+from .gather import plan_pixel_gather
+from .handles import get_handle_pool, uses_handle
 from .interfaces import ImageBase
+from .planner import (
+    InterleaveType,
+    ReadAccessType,
+    ReadPlan,
+    execute_read_plan,
+    plan_bands_read,
+    plan_pixels_read,
+    plan_tile_read,
+)
+from .validity import ValidMask, load_valid_mask, pixel_valid_mask
 
 if TYPE_CHECKING:
-    from siapy.core.types import SpectralLibType, XarrayType
+    from siapy.core.types import ChunksType, SpectralLibType, XarrayType
 
 __all__ = [
     "SpectralLibImage",
 ]
 
+# Upper bound on the size of a single block when copying from the memory map.
+_CHUNK_BYTES = 64 * 1024**2
+
 
 @dataclass
 class SpectralLibImage(ImageBase):
     def __init__(
         self,
         file: "SpectralLibType",
+        chunks: "ChunksType | None" = None,
+        header_path: str | Path | None = None,
     ):
         """Initialize a SpectralLibImage wrapper around a SpectralPython file object.
 
         Args:
             file: A SpectralPython file object representing the opened spectral image.
+            chunks: Optional dask chunking of the (y, x, band) axes. If set, `to_xarray` returns a lazy,
+                dask-backed DataArray instead of loading the image into memory.
+            header_path: Optional path of the ENVI header the file was opened from.
         """
         self._file = file
+        self._chunks = chunks
+        self._header_path = Path(header_path) if header_path is not None else None
+        self._memmap: np.memmap | None = None
+        self._memmap_failed = False
+        # parsed from the header once per opened image
+        self._description: dict[str, Any] | None = None
+        self._wavelengths: NDArray[np.float64] | None = None
+        self._valid_mask: ValidMask | None = None
+        pool = get_handle_pool()
+        if pool is not None:
+            pool.add(self)
 
     @classmethod
-    def open(cls, *, header_path: str | Path, image_path: str | Path | None = None) -> "SpectralLibImage":
+    def open(
+        cls,
+        *,
+        header_path: str | Path,
+        image_path: str | Path | None = None,
+        chunks: "ChunksType | None" = None,
+    ) -> "SpectralLibImage":
         """Open a spectral image using the SpectralPython ENVI library.
 
         Args:
             header_path: Path to the ENVI header file (.hdr) containing image metadata.
             image_path: Optional path to the image data file. If None, the path is inferred from the header file.
+            chunks: Optional dask chunking used by `to_xarray`. Accepts anything `dask.array.from_array`
+                accepts (an int, a tuple in (y, x, band) order or "auto"), or a dict keyed by dimension name,
+                e.g. `{"y": 512, "x": 512}`. If None, `to_xarray` loads the image eagerly.
 
         Returns:
             A SpectralLibImage instance wrapping the opened spectral file.
@@ -59,6 +100,9 @@ class SpectralLibImage(ImageBase):
                 header_path="image.hdr",
                 image_path="image.dat"
             )
+
+            # Open for lazy, chunked processing with dask
+            image = SpectralLibImage.open(header_path="image.hdr", chunks={"y": 512})
             ```
         """
         header_path = Path(header_path)
@@ -73,17 +117,90 @@ class SpectralLibImage(ImageBase):
         if isinstance(sp_file, sp.io.envi.SpectralLibrary):
             raise InvalidInputError({"file_type": type(sp_file).__name__}, "Expected Image, got SpectralLibrary")
 
-        return cls(sp_file)
+        return cls(sp_file, chunks=chunks, header_path=header_path)
+
+    @property
+    def chunks(self) -> "ChunksType | None":
+        """Get the dask chunking used by `to_xarray`.
+
+        Returns:
+            The chunking passed on open, or None if `to_xarray` loads the image eagerly.
+        """
+        return self._chunks
+
+    @property
+    def header_path(self) -> Path | None:
+        """Get the path of the ENVI header.
+
+        Returns:
+            The header path passed to `open`, or None if the image was created from a file object.
+        """
+        return self._header_path
 
     @property
     def file(self) -> "SpectralLibType":
         """Get the underlying SpectralPython file object.
 
         Returns:
-            The wrapped SpectralPython file object.
+            The wrapped SpectralPython file object. If its data file was closed by the handle pool,
+            it is reopened first.
         """
+        if self.closed:
+            pool = get_handle_pool()
+            if pool is None:
+                self.reopen()
+            else:
+                pool.add(self)
         return self._file
 
+    @property
+    def closed(self) -> bool:
+        """Check whether the file handle of the image is closed.
+
+        Returns:
+            True if the data file is closed, e.g. after it was evicted from the handle pool (see
+            `siapy.entities.images.handles`). Reads reopen it transparently.
+        """
+        return self._file.fid.closed
+
+    def close(self) -> None:
+        """Close the data file and drop the memory map of the image.
+
+        Memory-mapped views returned earlier stay valid. The file is reopened on the next read.
+        """
+        self._file.fid.close()
+        self._memmap = None
+        # SpectralPython keeps its own memory map of BSQ, BIL and BIP files
+        if getattr(self._file, "_memmap", None) is not None:
+            self._file._memmap = None
+
+    def reopen(self) -> None:
+        """Reopen the data file of the image after it was closed."""
+        if self.closed:
+            self._open_data_file()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # open files cannot be pickled (e.g. to send the image to a worker process); the copy reopens them
+        state = {**self.__dict__, "_memmap": None}
+        file_state = {key: value for key, value in vars(self._file).items() if key not in ("fid", "_memmap")}
+        state["_file"] = (type(self._file), file_state)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        file_type, file_state = state.pop("_file")
+        file = file_type.__new__(file_type)
+        file.__dict__.update(file_state)
+        self.__dict__.update(state, _file=file)
+        self._open_data_file()
+        pool = get_handle_pool()
+        if pool is not None:
+            pool.add(self)
+
+    def _open_data_file(self) -> None:
+        self._file.fid = open(sp.io.spyfile.find_file_path(self._file.filename), "rb")  # noqa: SIM115
+        if hasattr(self._file, "_open_memmap"):
+            self._file._memmap = self._file._open_memmap("r")
+
     @property
     def filepath(self) -> Path:
         """Get the file path of the spectral image.
@@ -141,6 +258,29 @@ class SpectralLibImage(ImageBase):
         """
         return self.file.nbands
 
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Get the data type of the stored values.
+
+        Returns:
+            The numpy data type of the image file as given by the ENVI header.
+        """
+        return np.dtype(self._file.dtype)
+
+    @property
+    def interleave(self) -> InterleaveType:
+        """Get the interleave (storage order) of the image file.
+
+        Returns:
+            "bsq" for band-sequential, "bil" for band-interleaved-by-line or "bip" for
+            band-interleaved-by-pixel files.
+        """
+        if isinstance(self.file, sp.io.bsqfile.BsqFile):
+            return "bsq"
+        if isinstance(self.file, sp.io.bilfile.BilFile):
+            return "bil"
+        return "bip"
+
     @property
     def default_bands(self) -> list[int]:
         """Get the default band indices for RGB display.
@@ -162,18 +302,30 @@ class SpectralLibImage(ImageBase):
         Returns:
             A list of wavelength values (typically in nanometers) for each band as stored in the ENVI metadata. The length equals the number of bands.
         """
-        wavelength_data = self.metadata.get("wavelength", [])
-        return list(map(float, wavelength_data))
+        return self.wavelengths_array.tolist()
+
+    @property
+    def wavelengths_array(self) -> NDArray[np.float64]:
+        """Get the wavelengths of the bands as a read-only array.
+
+        Returns:
+            A read-only float64 array of the wavelengths in the ENVI metadata. It is parsed on first access
+            and reused until the image is opened again.
+        """
+        if self._wavelengths is None:
+            wavelengths = np.array(list(map(float, self.metadata.get("wavelength", []))), dtype=np.float64)
+            wavelengths.flags.writeable = False
+            self._wavelengths = wavelengths
+        return self._wavelengths
 
     @property
     def description(self) -> dict[str, Any]:
         """Get parsed description metadata from the ENVI header.
 
         Returns:
-            A dictionary containing parsed key-value pairs from the description field in the ENVI metadata, with automatic type conversion for numeric values and comma-separated lists.
+            A dictionary containing parsed key-value pairs from the description field in the ENVI metadata, with automatic type conversion for numeric values and comma-separated lists. The description is parsed on first access; an empty dictionary is returned if the header has no description.
         """
-        description_str = self.metadata.get("description", {})
-        return _parse_description(description_str)
+        return dict(self._parsed_description())
 
     @property
     def camera_id(self) -> str:
@@ -182,8 +334,9 @@ class SpectralLibImage(ImageBase):
         Returns:
             A string identifying the camera or sensor used to capture the image, extracted from the "ID" field in the parsed description metadata.
         """
-        return self.description.get("ID", "")
+        return self._parsed_description().get("ID", "")
 
+    @uses_handle
     def to_display(self, equalize: bool = True) -> Image.Image:
         """Convert the image to a PIL Image for display purposes.
 
@@ -203,9 +356,21 @@ class SpectralLibImage(ImageBase):
             pil_image = spectral_image.to_display(equalize=False)
             ```
         """
-        max_uint8 = 255.0
         image_3ch = self.file.read_bands(self.default_bands)
-        image_3ch = self._remove_nan(image_3ch, nan_value=0)
+        return self.render_display(image_3ch, equalize)
+
+    def render_display(self, array: NDArray[Any], equalize: bool = True) -> Image.Image:
+        """Render an array of the default bands as a PIL Image, the same way as `to_display`.
+
+        Args:
+            array: A (height, width, 3) array of the default bands. It is modified in place.
+            equalize: Whether to apply histogram equalization to enhance contrast. Defaults to True.
+
+        Returns:
+            A PIL Image object with normalized values and optional histogram equalization.
+        """
+        max_uint8 = 255.0
+        image_3ch = self._remove_nan(array, nan_value=0)
         image_3ch[:, :, 0] = image_3ch[:, :, 0] / image_3ch[:, :, 0].max() / max_uint8
         image_3ch[:, :, 1] = image_3ch[:, :, 1] / (image_3ch[:, :, 1].max() / max_uint8)
         image_3ch[:, :, 2] = image_3ch[:, :, 2] / (image_3ch[:, :, 2].max() / max_uint8)
@@ -214,15 +379,35 @@ class SpectralLibImage(ImageBase):
             image = ImageOps.equalize(image)
         return image
 
-    def to_numpy(self, nan_value: float | None = None) -> NDArray[np.floating[Any]]:
+    @uses_handle
+    def to_numpy(
+        self,
+        nan_value: float | None = None,
+        *,
+        copy: bool = True,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
         """Convert the image to a numpy array.
 
         Args:
             nan_value: Optional value to replace NaN values with. If None, NaN values are preserved.
+            copy: If True, return an independent in-memory array. If False and `nan_value` is None,
+                return a read-only memory-mapped view of the file (see `as_memmap`) instead of a copy.
+            bands: Optional 0-based band indices to read. Only the selected bands are read from the
+                file, so reading a few bands of a band-sequential (BSQ) file costs a fraction of a full read.
+                With `nan_value`, pixels are blanked by the stored validity mask (see
+                `SpectralImage.valid_mask`) if there is one, as in a full read; without it only the
+                selected bands are checked for NaN values.
 
         Returns:
             A 3D numpy array with shape (rows, cols, bands) containing the spectral data.
 
+        Note:
+            When a new array is created, it is filled block by block from the memory map and NaN
+            replacement is applied per block, so no full-size temporary arrays are allocated.
+            Files with a reflectance scale factor other than 1, or files that cannot be memory mapped,
+            are always read through SpectralPython.
+
         Example:
             ```python
             # Get the raw data with NaN values preserved
@@ -230,19 +415,230 @@ class SpectralLibImage(ImageBase):
 
             # Replace NaN values with zero
             data = spectral_image.to_numpy(nan_value=0.0)
+
+            # Get a zero-copy, read-only view shared with other processes through the page cache
+            view = spectral_image.to_numpy(copy=False)
+
+            # Read only three bands
+            data = spectral_image.to_numpy(bands=[10, 20, 30])
             ```
         """
-        image = self.file[:, :, :]
-        if nan_value is not None:
-            image = self._remove_nan(image, nan_value)
+        memmap = self._memmap_or_none()
+        if bands is not None:
+            if memmap is not None:
+                image = execute_read_plan(memmap, self.plan_read("bands", bands=bands))
+            else:
+                image = self.file.read_bands(list(bands))
+            if nan_value is not None:
+                mask = self._stored_valid_mask()
+                image = self._remove_nan(image, nan_value, None if mask is None else mask.to_numpy())
+            return image
+
+        if memmap is None:
+            image = self.file[:, :, :]
+            if nan_value is not None:
+                mask = self._stored_valid_mask()
+                image = self._remove_nan(image, nan_value, None if mask is None else mask.to_numpy())
+            return image
+
+        if not copy and nan_value is None:
+            return memmap
+
+        image = np.empty(memmap.shape, dtype=memmap.dtype)
+        mask = self._stored_valid_mask() if nan_value is not None else None
+        for rows in _row_chunks(memmap.shape, memmap.dtype.itemsize):
+            image[rows] = memmap[rows]
+            if nan_value is not None:
+                self._remove_nan(image[rows], nan_value, None if mask is None else mask.window(rows, slice(None)))
         return image
 
-    def _remove_nan(self, image: np.ndarray, nan_value: float = 0.0) -> np.ndarray:
+    @uses_handle
+    def as_memmap(self) -> np.memmap:
+        """Get a read-only memory-mapped view of the image file.
+
+        The view is opened once and reused. No data is read until it is accessed, and the pages are
+        shared through the operating system page cache between all processes mapping the same file.
+
+        Returns:
+            A read-only numpy memmap with shape (rows, cols, bands), regardless of the file interleave.
+
+        Raises:
+            InvalidInputError: If the file cannot be memory mapped, or if it defines a reflectance scale
+                factor other than 1, in which case the raw memory-mapped values would differ from the
+                values returned by `to_numpy`.
+
+        Example:
+            ```python
+            view = spectral_image.as_memmap()
+            band_mean = view[:, :, 10].mean()
+            ```
+        """
+        memmap = self._memmap_or_none()
+        if memmap is None:
+            raise InvalidInputError(
+                {"filepath": str(self.filepath), "scale_factor": self.file.scale_factor},
+                "Image file cannot be memory mapped",
+            )
+        return memmap
+
+    def _memmap_or_none(self) -> np.memmap | None:
+        """Get the cached memory map, or None if the raw file values cannot be served through one."""
+        if self.file.scale_factor != 1 or self._memmap_failed:
+            return None
+        if self._memmap is None:
+            # SpectralPython returns None for files it cannot map, and fails transposing it for BSQ and
+            # BIL files; the callers then read through SpectralPython instead
+            try:
+                self._memmap = self.file.open_memmap(writable=False)
+            except Exception:  # noqa: BLE001
+                self._memmap = None
+            self._memmap_failed = self._memmap is None
+        return self._memmap
+
+    def plan_read(
+        self,
+        access: ReadAccessType,
+        *,
+        rows: slice | Sequence[int] | NDArray[np.integer[Any]] | None = None,
+        cols: slice | Sequence[int] | NDArray[np.integer[Any]] | None = None,
+        bands: Sequence[int] | None = None,
+    ) -> ReadPlan:
+        """Plan how a read request is executed against the file interleave.
+
+        This is the plan used internally by `read_pixels`, `read_window` and band subset reads of
+        `to_numpy`; it is exposed for inspecting and debugging I/O behaviour.
+
+        Args:
+            access: "pixels" for a gather of individual pixels, "bands" for a stack of full bands,
+                or "tile" for a rectangular region.
+            rows: For "pixels", the row of each pixel; for "tile", a row slice. Ignored for "bands".
+            cols: For "pixels", the column of each pixel; for "tile", a column slice. Ignored for "bands".
+            bands: Optional 0-based band indices to read. If None, all bands are read.
+
+        Returns:
+            The read plan, including the loop order and chunking chosen for the file layout.
+
+        Raises:
+            InvalidInputError: If the access type is unknown or required selections are missing.
+
+        Example:
+            ```python
+            plan = spectral_lib_image.plan_read("pixels", rows=[10, 500, 20], cols=[3, 40, 7])
+            print(plan.describe())
+            # pixels read on bsq file: 3 pixels x 160 bands, band-outer in 160 chunks
+            ```
+        """
+        band_list = list(range(self.bands)) if bands is None else list(bands)
+        layout = {"shape": self.shape, "interleave": self.interleave, "itemsize": np.dtype(self.file.dtype).itemsize}
+        if access == "pixels" and rows is not None and cols is not None:
+            return plan_pixels_read(rows, cols, band_list, **layout)  # type: ignore[arg-type]
+        if access == "tile" and isinstance(rows, slice) and isinstance(cols, slice):
+            return plan_tile_read(rows, cols, band_list, **layout)
+        if access == "bands":
+            return plan_bands_read(band_list, **layout)
+        raise InvalidInputError(
+            {"access": access, "rows": type(rows).__name__, "cols": type(cols).__name__},
+            "Unsupported read access, or missing rows/cols selection for it",
+        )
+
+    @uses_handle
+    def read_pixels(
+        self,
+        rows: Sequence[int] | NDArray[np.integer[Any]],
+        cols: Sequence[int] | NDArray[np.integer[Any]],
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Read the spectra of individual pixels.
+
+        Repeated pixels are read once, and pixels are read in the storage order of the file (see
+        `plan_read`) and returned in the requested order, so scattered pixels are gathered with
+        sequential reads.
+
+        Args:
+            rows: Row index of each pixel.
+            cols: Column index of each pixel.
+            bands: Optional 0-based band indices to read. If None, all bands are read.
+
+        Returns:
+            A 2D numpy array with shape (pixels, bands).
+
+        Example:
+            ```python
+            spectra = spectral_lib_image.read_pixels(rows=[10, 500, 20], cols=[3, 40, 7])
+            ```
+        """
+        memmap = self._memmap_or_none()
+        if memmap is None:
+            return super().read_pixels(rows, cols, bands)
+        gather = plan_pixel_gather(rows, cols, shape=self.shape, itemsize=np.dtype(self.file.dtype).itemsize)
+        plan = self.plan_read("pixels", rows=gather.rows, cols=gather.cols, bands=bands)
+        return gather.scatter(execute_read_plan(memmap, plan))
+
+    @uses_handle
+    def read_window(
+        self,
+        rows: slice,
+        cols: slice,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Read a rectangular region of the image directly from the file.
+
+        Only the requested region is read from disk, so the full image is never loaded into memory.
+
+        Args:
+            rows: Slice selecting the rows (height axis) to read.
+            cols: Slice selecting the columns (width axis) to read.
+            bands: Optional 0-based band indices to read. If None, all bands are read.
+
+        Returns:
+            A 3D numpy array with shape (rows, cols, bands) containing the requested region.
+
+        Example:
+            ```python
+            # Read a 200x200 panel with all bands
+            panel = spectral_image.read_window(slice(100, 300), slice(400, 600))
+
+            # Read every 4th row and column of three bands
+            preview = spectral_image.read_window(slice(None, None, 4), slice(None, None, 4), bands=[10, 20, 30])
+            ```
+        """
+        memmap = self._memmap_or_none()
+        if memmap is not None:
+            return execute_read_plan(memmap, self.plan_read("tile", rows=rows, cols=cols, bands=bands))
+
+        row_range = range(*rows.indices(self.rows))
+        col_range = range(*cols.indices(self.cols))
+        band_list = list(bands) if bands is not None else None
+        if row_range.step == 1 and col_range.step == 1:
+            return self.file.read_subregion(
+                (row_range.start, row_range.stop),
+                (col_range.start, col_range.stop),
+                band_list,
+            )
+        return self.file.read_subimage(list(row_range), list(col_range), band_list)
+
+    def replace_nan(self, array: NDArray[Any], nan_value: float) -> NDArray[Any]:
+        """Blank every band of the pixels that have a NaN value in any band, as `to_numpy` does.
+
+        Args:
+            array: A writable (height, width, bands) array holding (a part of) the image data.
+            nan_value: The value to replace the pixels with.
+
+        Returns:
+            The array with invalid pixels replaced (see `_remove_nan`).
+        """
+        return self._remove_nan(array, nan_value)
+
+    def _remove_nan(
+        self, image: np.ndarray, nan_value: float = 0.0, valid: NDArray[np.bool_] | None = None
+    ) -> np.ndarray:
         """Replace NaN values in the image array with a specified value.
 
         Args:
             image: The input image array that may contain NaN values.
             nan_value: The value to replace NaN values with. Defaults to 0.0.
+            valid: Optional (rows, cols) mask of the valid pixels of the array, e.g. a window of the
+                stored validity mask. If None, it is computed from the array.
 
         Returns:
             The image array with NaN values replaced by the specified value.
@@ -256,10 +652,18 @@ class SpectralLibImage(ImageBase):
             If a pixel at position (0,0) has NaN in any band, all bands for that pixel
             will be set to nan_value, not just the bands containing NaN.
         """
-        image_mask = np.bitwise_not(np.bool_(np.isnan(image).sum(axis=2)))
-        image[~image_mask] = nan_value
+        if valid is None:
+            valid = pixel_valid_mask(image)
+        image[~valid] = nan_value
         return image
 
+    def _stored_valid_mask(self) -> ValidMask | None:
+        """Get the validity mask of the file from its sidecar (see `SpectralImage.valid_mask`), loading it once."""
+        if self._valid_mask is None:
+            self._valid_mask = load_valid_mask(self)
+        return self._valid_mask
+
+    @uses_handle
     def to_xarray(self) -> "XarrayType":
         """Convert the image to an xarray DataArray.
 
@@ -274,20 +678,52 @@ class SpectralLibImage(ImageBase):
             # Access specific bands or wavelengths
             red_band = xr_data.sel(band=650, method='nearest')
             ```
+
+        Note:
+            If the image was opened with `chunks`, the DataArray is backed by a dask array built on a
+            read-only memory map of the file, so nothing is read until the result is computed and
+            reductions such as `mean` run chunk by chunk. Images that cannot be memory-mapped fall
+            back to an eager read.
         """
-        data = self._file[:, :, :]
+        data = self._file[:, :, :] if self._chunks is None else self._lazy_data()
         xarray = xr.DataArray(
             data,
             dims=["y", "x", "band"],
             coords={
                 "y": np.arange(self.rows),
                 "x": np.arange(self.cols),
-                "band": self.wavelengths,
+                "band": self.wavelengths_array,
             },
             attrs=self._file.metadata,
         )
         return xarray
 
+    def _parsed_description(self) -> dict[str, Any]:
+        if self._description is None:
+            description = self.metadata.get("description", "")
+            self._description = _parse_description(description) if description else {}
+        return self._description
+
+    def _lazy_data(self) -> da.Array | NDArray[Any]:
+        memmap = self._memmap_or_none()
+        if memmap is None:
+            return self._file[:, :, :]
+        chunks = self._chunks
+        if isinstance(chunks, dict):
+            axes = {"y": 0, "x": 1, "band": 2}
+            unknown = set(chunks) - set(axes)
+            if unknown:
+                raise InvalidInputError({"chunks": chunks}, f"Unknown dimensions in chunks: {sorted(unknown)}")
+            chunks = {axes[key]: value for key, value in chunks.items()}
+        return da.from_array(memmap, chunks=chunks, lock=False)
+
+
+def _row_chunks(shape: tuple[int, ...], itemsize: int) -> list[slice]:
+    """Split the row axis into slices whose blocks stay within the chunk byte budget."""
+    row_bytes = max(int(np.prod(shape[1:])) * itemsize, 1)
+    step = max(_CHUNK_BYTES // row_bytes, 1)
+    return [slice(start, min(start + step, shape[0])) for start in range(0, shape[0], step)]
+
 
 def _parse_description(description: str) -> dict[str, Any]:
     """Parse the description string from ENVI metadata into a structured dictionary.
@@ -1,30 +1,45 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generic, Iterable, Sequence, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterable, Iterator, Literal, Sequence, TypeVar, get_args
 
 import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
 from PIL import Image
 
+from siapy.core import logger
+from siapy.core.exceptions import InvalidInputError
+
 from ..pixels import CoordinateInput, Pixels, validate_pixel_input
 from ..shapes import GeometricShapes, Shape
-from ..signatures import Signatures
+from ..signatures import Signals, Signatures
+from .cache import array_cache_key, get_array_cache
+from .chunked import ChunkedCubeImage
 from .interfaces import ImageBase
 from .mock import MockImage
+from .overviews import Overviews, build_overviews, load_overviews, save_overviews
 from .rasterio_lib import RasterioLibImage
 from .spectral_lib import SpectralLibImage
+from .statistics import BandStatistics
+from .validity import ValidMask, build_valid_mask, load_valid_mask, save_valid_mask
 
 if TYPE_CHECKING:
-    from siapy.core.types import XarrayType
+    from siapy.core.types import ChunksType, XarrayType
 
 
 __all__ = [
     "SpectralImage",
+    "DtypePolicyType",
 ]
 
 T = TypeVar("T", bound=ImageBase)
 
+# "native" keeps the data type of the file; the float policies convert every read
+DtypePolicyType = Literal["native", "float32", "float64"]
+
+# Upper bound on the size of a single tile read when streaming over the image.
+_TILE_BYTES = 64 * 1024**2
+
 
 @dataclass
 class SpectralImage(Generic[T]):
@@ -32,15 +47,27 @@ class SpectralImage(Generic[T]):
         self,
         image: T,
         geometric_shapes: list["Shape"] | None = None,
+        *,
+        dtype_policy: DtypePolicyType = "native",
     ):
         """Initialize a SpectralImage wrapper around an image backend.
 
         Args:
             image: The underlying image implementation (e.g., RasterioLibImage, SpectralLibImage, MockImage).
             geometric_shapes: Optional list of geometric shapes associated with this image. Defaults to None.
+            dtype_policy: Data type of the arrays returned by reads: "native" keeps the data type of the
+                file (e.g. uint16 sensor data is not upcast), "float32" and "float64" convert every read.
+
+        Raises:
+            InvalidInputError: If the dtype policy is not one of "native", "float32" or "float64".
         """
+        if dtype_policy not in get_args(DtypePolicyType):
+            raise InvalidInputError(dtype_policy, f"Dtype policy must be one of {get_args(DtypePolicyType)}")
         self._image = image
+        self._dtype_policy: DtypePolicyType = dtype_policy
         self._geometric_shapes = GeometricShapes(self, geometric_shapes)
+        self._overviews: Overviews | None = None
+        self._valid_mask: ValidMask | None = None
 
     def __repr__(self) -> str:
         """Return a string representation of the SpectralImage.
@@ -74,7 +101,7 @@ class SpectralImage(Generic[T]):
             return NotImplemented
         return self.filepath.name == other.filepath.name and self._image == other._image
 
-    def __array__(self, dtype: np.dtype | None = None) -> NDArray[np.floating[Any]]:
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> NDArray[np.floating[Any]]:
         """Convert this spectral image to a numpy array when requested by NumPy.
 
         This method enables the SpectralImage to be used directly with NumPy functions
@@ -82,24 +109,33 @@ class SpectralImage(Generic[T]):
 
         Args:
             dtype: Optional numpy data type to cast the array to. Defaults to None.
+            copy: Whether NumPy requested a copy. Unless True, the backend may return a
+                read-only zero-copy view (e.g. a memory map) of the image data.
 
         Returns:
             A numpy array representation of the spectral image data.
         """
-        array = self.to_numpy()
+        array = self.to_numpy(copy=bool(copy))
         if dtype is not None:
             return array.astype(dtype)
         return array
 
     @classmethod
     def spy_open(
-        cls, *, header_path: str | Path, image_path: str | Path | None = None
+        cls,
+        *,
+        header_path: str | Path,
+        image_path: str | Path | None = None,
+        chunks: "ChunksType | None" = None,
+        dtype_policy: DtypePolicyType = "native",
     ) -> "SpectralImage[SpectralLibImage]":
         """Open a spectral image using the SpectralPython library backend.
 
         Args:
             header_path: Path to the header file (.hdr) containing image metadata.
             image_path: Optional path to the image data file. If None, inferred from header_path.
+            chunks: Optional dask chunking. If set, `to_xarray` returns a lazy, chunked DataArray.
+            dtype_policy: Data type of the arrays returned by reads ("native", "float32" or "float64").
 
         Returns:
             A SpectralImage instance wrapping a SpectralLibImage backend.
@@ -116,15 +152,19 @@ class SpectralImage(Generic[T]):
             )
             ```
         """
-        image = SpectralLibImage.open(header_path=header_path, image_path=image_path)
-        return SpectralImage(image)
+        image = SpectralLibImage.open(header_path=header_path, image_path=image_path, chunks=chunks)
+        return SpectralImage(image, dtype_policy=dtype_policy)
 
     @classmethod
-    def rasterio_open(cls, filepath: str | Path) -> "SpectralImage[RasterioLibImage]":
+    def rasterio_open(
+        cls, filepath: str | Path, *, chunks: "ChunksType | None" = None, dtype_policy: DtypePolicyType = "native"
+    ) -> "SpectralImage[RasterioLibImage]":
         """Open a spectral image using the Rasterio library backend.
 
         Args:
             filepath: Path to the image file (supports formats like GeoTIFF, etc.).
+            chunks: Optional dask chunking. If set, the raster is backed by a lazy, chunked dask array.
+            dtype_policy: Data type of the arrays returned by reads ("native", "float32" or "float64").
 
         Returns:
             A SpectralImage instance wrapping a RasterioLibImage backend.
@@ -135,15 +175,44 @@ class SpectralImage(Generic[T]):
             image = SpectralImage.rasterio_open("image.tif")
             ```
         """
-        image = RasterioLibImage.open(filepath)
-        return SpectralImage(image)
+        image = RasterioLibImage.open(filepath, chunks=chunks)
+        return SpectralImage(image, dtype_policy=dtype_policy)
 
     @classmethod
-    def from_numpy(cls, array: NDArray[np.floating[Any]]) -> "SpectralImage[MockImage]":
+    def chunked_open(
+        cls, filepath: str | Path, *, max_workers: int | None = None, dtype_policy: DtypePolicyType = "native"
+    ) -> "SpectralImage[ChunkedCubeImage]":
+        """Open a chunked cube directory using the chunked backend.
+
+        Args:
+            filepath: Path of the cube directory (a Zarr array or a built-in chunk store).
+            max_workers: Maximum number of threads decoding chunks in parallel.
+            dtype_policy: Data type of the arrays returned by reads ("native", "float32" or "float64").
+
+        Returns:
+            A SpectralImage instance wrapping a ChunkedCubeImage backend.
+
+        Example:
+            ```python
+            # Open a cube created with chunked_create_image
+            image = SpectralImage.chunked_open("image.cube")
+            ```
+        """
+        image = ChunkedCubeImage.open(filepath, max_workers=max_workers)
+        return SpectralImage(image, dtype_policy=dtype_policy)
+
+    @classmethod
+    def from_numpy(
+        cls,
+        array: NDArray[np.floating[Any]] | NDArray[np.integer[Any]],
+        *,
+        dtype_policy: DtypePolicyType = "native",
+    ) -> "SpectralImage[MockImage]":
         """Create a spectral image from a numpy array using the mock backend.
 
         Args:
             array: A 3D numpy array with shape (height, width, bands) containing spectral data.
+            dtype_policy: Data type of the arrays returned by reads ("native", "float32" or "float64").
 
         Returns:
             A SpectralImage instance wrapping a MockImage backend.
@@ -155,10 +224,14 @@ class SpectralImage(Generic[T]):
             # Create a synthetic spectral image
             data = np.random.rand(100, 100, 10)  # 100x100 image with 10 bands
             image = SpectralImage.from_numpy(data)
+
+            # Keep 12-bit sensor data in uint16, or read it as float32
+            raw = SpectralImage.from_numpy(counts.astype(np.uint16))
+            scaled = SpectralImage.from_numpy(counts.astype(np.uint16), dtype_policy="float32")
             ```
         """
         image = MockImage.open(array)
-        return SpectralImage(image)
+        return SpectralImage(image, dtype_policy=dtype_policy)
 
     @property
     def image(self) -> T:
@@ -169,6 +242,47 @@ class SpectralImage(Generic[T]):
         """
         return self._image
 
+    @property
+    def dtype_policy(self) -> DtypePolicyType:
+        """Get the dtype policy of the reads.
+
+        Returns:
+            "native" if reads keep the data type of the file, otherwise the floating-point type that
+            every read is converted to.
+        """
+        return self._dtype_policy
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Get the data type of the arrays returned by reads.
+
+        Returns:
+            The data type of the file under the "native" policy, otherwise the policy's floating-point type.
+        """
+        if self._dtype_policy == "native":
+            return self.image.dtype
+        return np.dtype(self._dtype_policy)
+
+    def with_dtype_policy(self, dtype_policy: DtypePolicyType) -> "SpectralImage[T]":
+        """Get a spectral image that reads the same backend with another dtype policy.
+
+        Args:
+            dtype_policy: Data type of the arrays returned by reads ("native", "float32" or "float64").
+
+        Returns:
+            A new SpectralImage sharing the backend, the geometric shapes and the validity mask of this image.
+
+        Example:
+            ```python
+            # Process uint16 counts as float32 instead of float64
+            spectral_image = spectral_image.with_dtype_policy("float32")
+            ```
+        """
+        image = SpectralImage(self.image, list(self.geometric_shapes), dtype_policy=dtype_policy)
+        # NaN pixels do not depend on the data type of the reads
+        image._valid_mask = self._valid_mask
+        return image
+
     @property
     def geometric_shapes(self) -> GeometricShapes:
         """Get the geometric shapes associated with this image.
@@ -250,6 +364,34 @@ class SpectralImage(Generic[T]):
         """
         return self.image.wavelengths
 
+    @property
+    def wavelengths_array(self) -> NDArray[np.float64]:
+        """Get the wavelengths of the bands as a read-only array.
+
+        Returns:
+            A read-only float64 array with one wavelength per band. Backends that parse wavelengths from
+            metadata cache it, so repeated lookups do not convert the metadata again.
+        """
+        return self.image.wavelengths_array
+
+    def nearest_bands(self, wavelengths: float | Sequence[float] | NDArray[Any]) -> NDArray[np.intp]:
+        """Find the bands whose wavelengths are closest to the given wavelengths.
+
+        Args:
+            wavelengths: A wavelength or a sequence of wavelengths to look up.
+
+        Returns:
+            The 0-based index of the nearest band for each requested wavelength, with the shape of the
+            input.
+
+        Example:
+            ```python
+            bands = spectral_image.nearest_bands([650, 550, 450])
+            rgb = spectral_image.to_numpy(bands=bands.tolist())
+            ```
+        """
+        return self.image.nearest_bands(wavelengths)
+
     @property
     def camera_id(self) -> str:
         """Get the camera or sensor identifier.
@@ -259,11 +401,22 @@ class SpectralImage(Generic[T]):
         """
         return self.image.camera_id
 
-    def to_display(self, equalize: bool = True) -> Image.Image:
+    def to_display(
+        self,
+        equalize: bool = True,
+        *,
+        max_size: int | None = None,
+        overview_dir: str | Path | None = None,
+    ) -> Image.Image:
         """Convert the image to a PIL Image for display purposes.
 
         Args:
             equalize: Whether to apply histogram equalization to enhance contrast. Defaults to True.
+            max_size: Optional upper bound on the longer side of the returned image. If the image is
+                larger, the preview is rendered from the coarsest overview that still has at least
+                `max_size` pixels along its longer side and is then downscaled to fit.
+            overview_dir: Optional directory for the overview files. If None, overviews are stored in a
+                sidecar file next to the image.
 
         Returns:
             A PIL Image object suitable for display, typically as an RGB composite.
@@ -276,18 +429,133 @@ class SpectralImage(Generic[T]):
 
             # Display without histogram equalization
             pil_image = spectral_image.to_display(equalize=False)
+
+            # Fast thumbnail of a large scan, served from cached overviews
+            thumbnail = spectral_image.to_display(max_size=512)
+            ```
+        """
+        if max_size is None or max(self.height, self.width) <= max_size:
+            return self.image.to_display(equalize)
+        overviews = self.overviews(cache_dir=overview_dir)
+        factor = overviews.select(max_size)
+        if factor is None:
+            image = self.image.to_display(equalize)
+        else:
+            image = self.image.render_display(overviews.levels[factor].copy(), equalize)
+        image.thumbnail((max_size, max_size))
+        return image
+
+    def overviews(self, *, cache_dir: str | Path | None = None, rebuild: bool = False) -> Overviews:
+        """Get the decimated overviews of the display bands.
+
+        Overviews are loaded from the sidecar file of the image if it is up to date; otherwise they are
+        built from strided reads and stored for later use. The result is kept on this instance.
+
+        Args:
+            cache_dir: Optional directory for the overview files. If None, the sidecar file next to the
+                image is used.
+            rebuild: If True, ignore existing overviews and build them again.
+
+        Returns:
+            The 2x, 4x and 8x overviews of the display bands.
+        """
+        if self._overviews is not None and not rebuild:
+            return self._overviews
+        file_backed = self.filepath.is_file()
+        overviews = load_overviews(self.image, cache_dir) if file_backed and not rebuild else None
+        if overviews is None:
+            overviews = build_overviews(self.image)
+            if file_backed:
+                try:
+                    save_overviews(overviews, self.image, cache_dir)
+                except OSError as e:
+                    logger.warning("Could not store overviews of %s: %s", self.filepath, e)
+        self._overviews = overviews
+        return overviews
+
+    def valid_mask(self, *, cache_dir: str | Path | None = None, rebuild: bool = False) -> ValidMask:
+        """Get the mask of the pixels that have no NaN value in any band.
+
+        The mask is loaded from the sidecar file of the image if it is up to date; otherwise it is built
+        in a single pass over full-width strips and stored for later use. The result is kept on this
+        instance and is reused to replace NaN pixels, measure the background share, drop NaN signatures
+        and skip empty tiles.
+
+        Args:
+            cache_dir: Optional directory for the mask files. If None, the sidecar file next to the
+                image is used.
+            rebuild: If True, ignore an existing mask and build it again.
+
+        Returns:
+            The validity mask, packed to one bit per pixel.
+
+        Example:
+            ```python
+            mask = spectral_image.valid_mask()
+            print(f"{mask.background_percentage:.1f}% background")
+            valid_pixels = mask.to_numpy()
             ```
         """
-        return self.image.to_display(equalize)
+        if self._valid_mask is not None and not rebuild:
+            return self._valid_mask
+        file_backed = self.filepath.is_file()
+        mask = load_valid_mask(self.image, cache_dir) if file_backed and not rebuild else None
+        if mask is None:
+            mask = build_valid_mask(self.image, _strip_shape(self.shape)[0])
+            if file_backed:
+                try:
+                    save_valid_mask(mask, self.image, cache_dir)
+                except OSError as e:
+                    logger.warning("Could not store the validity mask of %s: %s", self.filepath, e)
+        self._valid_mask = mask
+        return mask
+
+    def stored_valid_mask(self, *, cache_dir: str | Path | None = None) -> ValidMask | None:
+        """Get the validity mask only if it is already available, without building it.
 
-    def to_numpy(self, nan_value: float | None = None) -> NDArray[np.floating[Any]]:
+        Args:
+            cache_dir: Optional directory for the mask files. If None, the sidecar file next to the
+                image is used.
+
+        Returns:
+            The mask kept on this instance or loaded from an up-to-date sidecar file, or None if the
+            mask was never built (see `valid_mask`).
+        """
+        if self._valid_mask is None and self.filepath.is_file():
+            self._valid_mask = load_valid_mask(self.image, cache_dir)
+        return self._valid_mask
+
+    def to_numpy(
+        self,
+        nan_value: float | None = None,
+        *,
+        copy: bool = True,
+        bands: Sequence[int] | None = None,
+        wavelength_range: tuple[float, float] | None = None,
+        exclude: Sequence[bool] | Sequence[int] | NDArray[Any] | None = None,
+    ) -> NDArray[np.floating[Any]]:
         """Convert the image to a numpy array.
 
         Args:
             nan_value: Optional value to replace NaN values with. If None, NaN values are preserved.
+            copy: If True, return an independent array. If False, the backend may return a read-only
+                zero-copy view of the data (e.g. a memory map of an ENVI file).
+            bands: Optional 0-based band indices to read. If None, all bands are considered.
+            wavelength_range: Optional inclusive (low, high) range; only bands whose wavelength lies
+                within it are read.
+            exclude: Optional bad-band selection to leave out, given either as a boolean mask with one
+                entry per band (True marks a band to exclude) or as a sequence of band indices.
 
         Returns:
-            A 3D numpy array with shape (height, width, bands) containing the spectral data.
+            A 3D numpy array with shape (height, width, selected bands) containing the spectral data.
+
+        Raises:
+            InvalidInputError: If the band selection is invalid or selects no bands.
+
+        Note:
+            The band selection is passed to the image backend, so only the selected bands are read.
+            If the process-wide array cache is enabled (see `siapy.entities.images.cache`), reads are
+            served from and stored in the cache shared by all images of the same file.
 
         Example:
             ```python
@@ -296,9 +564,19 @@ class SpectralImage(Generic[T]):
 
             # Replace NaN values with zero
             data = spectral_image.to_numpy(nan_value=0.0)
+
+            # Get a read-only view without copying the image into memory
+            view = spectral_image.to_numpy(copy=False)
+
+            # Read only visible bands, leaving out known bad bands
+            data = spectral_image.to_numpy(wavelength_range=(400, 700), exclude=bad_band_mask)
             ```
         """
-        return self.image.to_numpy(nan_value)
+        band_indices = self._resolve_bands(bands, wavelength_range, exclude)
+        cached = self._read_cached(band_indices, None, lambda: self.image.to_numpy(copy=True, bands=band_indices))
+        if cached is None:
+            return self._apply_dtype_policy(self.image.to_numpy(nan_value, copy=copy, bands=band_indices))
+        return self._apply_dtype_policy(_from_cached(self.image, cached, nan_value, copy))
 
     def to_xarray(self) -> "XarrayType":
         """Convert the image to an xarray DataArray.
@@ -317,6 +595,124 @@ class SpectralImage(Generic[T]):
         """
         return self.image.to_xarray()
 
+    def read_window(
+        self,
+        rows: slice,
+        cols: slice,
+        bands: Sequence[int] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Read a rectangular region of the image without loading the full image.
+
+        Args:
+            rows: Slice selecting the rows (height axis) to read.
+            cols: Slice selecting the columns (width axis) to read.
+            bands: Optional 0-based band indices to read. If None, all bands are read.
+
+        Returns:
+            A 3D numpy array with shape (rows, cols, bands) containing the requested region.
+
+        Example:
+            ```python
+            # Read a 200x200 panel starting at row 100 and column 400
+            panel = spectral_image.read_window(slice(100, 300), slice(400, 600))
+            ```
+        """
+        cached = self._read_cached(bands, (rows, cols), lambda: self.image.read_window(rows, cols, bands))
+        if cached is None:
+            return self._apply_dtype_policy(self.image.read_window(rows, cols, bands))
+        return self._apply_dtype_policy(cached, copy=True)
+
+    def _apply_dtype_policy(self, array: NDArray[Any], copy: bool = False) -> NDArray[Any]:
+        """Convert a read to the data type of the dtype policy, copying only if needed or requested."""
+        if self._dtype_policy == "native" or array.dtype == self._dtype_policy:
+            return array.copy() if copy else array
+        return array.astype(self._dtype_policy)
+
+    def _read_cached(
+        self,
+        bands: Sequence[int] | None,
+        window: tuple[slice, slice] | None,
+        read: Callable[[], NDArray[np.floating[Any]]],
+    ) -> NDArray[np.floating[Any]] | None:
+        """Serve a read from the process-wide array cache, reading and storing it on a miss.
+
+        Returns:
+            The cached read-only array, or None if caching is disabled or the image is not file-backed.
+        """
+        cache = get_array_cache()
+        if cache is None:
+            return None
+        key = array_cache_key(self.filepath, bands, window, self.shape[:2])
+        if key is None:
+            return None
+        array = cache.get(key)
+        if array is None:
+            array = cache.put(key, read())
+        return array
+
+    def _cached_read(
+        self, bands: Sequence[int] | None, window: tuple[slice, slice] | None
+    ) -> NDArray[np.floating[Any]] | None:
+        """Look up a read in the process-wide array cache without reading it on a miss.
+
+        Returns:
+            The cached read-only array, or None if it is not cached, caching is disabled or the
+            image is not file-backed.
+        """
+        cache = get_array_cache()
+        if cache is None:
+            return None
+        key = array_cache_key(self.filepath, bands, window, self.shape[:2])
+        return None if key is None else cache.get(key)
+
+    def _resolve_bands(
+        self,
+        bands: Sequence[int] | None = None,
+        wavelength_range: tuple[float, float] | None = None,
+        exclude: Sequence[bool] | Sequence[int] | NDArray[Any] | None = None,
+    ) -> list[int] | None:
+        """Combine band, wavelength and exclusion selections into 0-based band indices.
+
+        Returns:
+            The selected band indices in the requested order, or None if all bands are selected.
+        """
+        if bands is None and wavelength_range is None and exclude is None:
+            return None
+
+        selected = np.arange(self.bands) if bands is None else np.asarray(bands, dtype=int).reshape(-1)
+        if np.any((selected < 0) | (selected >= self.bands)):
+            raise InvalidInputError(
+                input_value={"bands": selected.tolist(), "image_bands": self.bands},
+                message="Band indices exceed the number of image bands",
+            )
+
+        if wavelength_range is not None:
+            low, high = wavelength_range
+            wavelengths = self.wavelengths_array
+            selected = selected[(wavelengths[selected] >= low) & (wavelengths[selected] <= high)]
+
+        if exclude is not None:
+            exclude_arr = np.asarray(exclude)
+            if exclude_arr.dtype == bool:
+                if exclude_arr.shape != (self.bands,):
+                    raise InvalidInputError(
+                        input_value={"exclude_shape": exclude_arr.shape, "image_bands": self.bands},
+                        message="Boolean exclude mask must contain one entry per band",
+                    )
+                excluded = np.flatnonzero(exclude_arr)
+            else:
+                excluded = exclude_arr.astype(int).reshape(-1)
+            selected = selected[~np.isin(selected, excluded)]
+
+        if selected.size == 0:
+            raise InvalidInputError(
+                input_value={"bands": bands, "wavelength_range": wavelength_range},
+                message="Band selection does not contain any bands",
+            )
+        if bands is None and selected.size == self.bands:
+            return None
+        return selected.tolist()
+
     def to_signatures(self, pixels: Pixels | pd.DataFrame | Iterable[CoordinateInput]) -> Signatures:
         """Extract spectral signatures from specific pixel locations.
 
@@ -325,7 +721,9 @@ class SpectralImage(Generic[T]):
                     pandas DataFrame with 'x' and 'y' columns, or an iterable of coordinate tuples.
 
         Returns:
-            A Signatures object containing the spectral data for the specified pixels.
+            A Signatures object containing the spectral data for the specified pixels. Floating-point
+            signals are stored as float32 unless the dtype policy requests another data type, and they
+            carry the wavelengths of the image bands.
 
         Example:
             ```python
@@ -339,23 +737,39 @@ class SpectralImage(Generic[T]):
             signatures = spectral_image.to_signatures(df)
             ```
         """
-        pixels = validate_pixel_input(pixels)
-        image_arr = self.to_numpy()
-        signatures = Signatures.from_array_and_pixels(image_arr, pixels)
-        return signatures
+        pixels = _validate_pixels_within_image(pixels, self.shape)
+        rows = pixels.y_array.astype(np.intp)
+        cols = pixels.x_array.astype(np.intp)
+        # reuse a bounding window cached by to_subarray or read_window, but never read one just for
+        # the gather: the backend reads only the lines that contain the pixels
+        window = _pixels_bounding_window(pixels)
+        window_arr = self._cached_read(None, window)
+        if window_arr is None:
+            signals_arr = self.image.read_pixels(rows, cols)
+        else:
+            signals_arr = window_arr[rows - window[0].start, cols - window[1].start]
+        wavelengths = self.wavelengths_array
+        signals = Signals.from_numpy(
+            self._apply_dtype_policy(signals_arr),
+            wavelengths if wavelengths.size == self.bands else None,
+            float_dtype=np.float32 if self._dtype_policy == "native" else None,
+        )
+        return Signatures.from_signals_and_pixels(signals, pixels)
 
     def to_subarray(self, pixels: Pixels | pd.DataFrame | Iterable[CoordinateInput]) -> NDArray[np.floating[Any]]:
         """Extract a rectangular subarray containing the specified pixels.
 
         Creates a new array that encompasses all the specified pixel coordinates,
-        with NaN values for pixels not in the original selection.
+        with NaN values for pixels not in the original selection. The array has the data type of the
+        dtype policy; integer data cannot hold NaN, so it is returned as a masked array in which the
+        unselected pixels are masked.
 
         Args:
             pixels: Pixel coordinates defining the region of interest. Can be a Pixels object,
                     pandas DataFrame with 'x' and 'y' columns, or an iterable of coordinate tuples.
 
         Returns:
-            A 3D numpy array containing the subregion with shape (height, width, bands). Unselected pixels within the bounding rectangle are filled with NaN.
+            A 3D numpy array containing the subregion with shape (height, width, bands). Unselected pixels within the bounding rectangle are filled with NaN, or masked for integer data.
 
         Example:
             ```python
@@ -367,19 +781,18 @@ class SpectralImage(Generic[T]):
             # from (10,20) to (15,25) with only the specified pixels having data
             ```
         """
-        pixels = validate_pixel_input(pixels)
-        image_arr = self.to_numpy()
-        x_max = pixels.x().max()
-        x_min = pixels.x().min()
-        y_max = pixels.y().max()
-        y_min = pixels.y().min()
-        # create new image
-        image_arr_area = np.nan * np.ones((int(y_max - y_min + 1), int(x_max - x_min + 1), self.bands))
+        pixels = _validate_pixels_within_image(pixels, self.shape)
+        rows, cols = _pixels_bounding_window(pixels)
+        # read only the bounding box of the selected pixels
+        window_arr = self.read_window(rows, cols)
+        # create new image in the data type of the reads
+        shape = (rows.stop - rows.start, cols.stop - cols.start, self.bands)
+        image_arr_area = _missing_array(shape, window_arr.dtype)
         # convert original coordinates to coordinates for new image
-        y_norm = pixels.y() - y_min
-        x_norm = pixels.x() - x_min
+        y_norm = pixels.y_array - rows.start
+        x_norm = pixels.x_array - cols.start
         # write values from original image to new image
-        image_arr_area[y_norm, x_norm, :] = image_arr[pixels.y(), pixels.x(), :]
+        image_arr_area[y_norm, x_norm, :] = window_arr[y_norm, x_norm, :]
         return image_arr_area
 
     def average_intensity(
@@ -410,3 +823,171 @@ class SpectralImage(Generic[T]):
         """
         image_arr = self.to_numpy()
         return np.nanmean(image_arr, axis=axis)
+
+    def band_statistics(
+        self,
+        bands: Sequence[int] | None = None,
+        wavelength_range: tuple[float, float] | None = None,
+        exclude: Sequence[bool] | Sequence[int] | NDArray[Any] | None = None,
+        *,
+        tile_shape: tuple[int, int] | None = None,
+    ) -> BandStatistics:
+        """Compute per-band statistics in a single streaming pass over the image.
+
+        The image is read tile by tile and the statistics of each tile are merged into the running
+        result, so memory use is bounded by a single tile regardless of the image size.
+
+        Args:
+            bands: Optional 0-based band indices to include. If None, all bands are considered.
+            wavelength_range: Optional inclusive (low, high) wavelength range of the bands to include.
+            exclude: Optional bad-band selection to leave out, as a boolean mask or band indices.
+            tile_shape: Optional (rows, cols) size of the tiles. If None, full-width strips of at most
+                64 MiB are read.
+
+        Returns:
+            The count, mean, variance, min, max and NaN count of each selected band.
+
+        Raises:
+            InvalidInputError: If the band selection or the tile shape is invalid.
+
+        Example:
+            ```python
+            stats = spectral_image.band_statistics()
+            normalized = (spectral_image.to_numpy() - stats.mean) / stats.std
+
+            # Combine with the statistics of another image
+            combined = stats.merge(other_image.band_statistics())
+            ```
+        """
+        band_indices = self._resolve_bands(bands, wavelength_range, exclude)
+        if tile_shape is None:
+            tile_shape = _strip_shape(self.shape)
+        statistics = BandStatistics.empty(self.bands if band_indices is None else len(band_indices))
+        for _, tile in self.iter_tiles(tile_shape, bands=band_indices):
+            statistics = statistics.update(tile)
+        return statistics
+
+    def iter_tiles(
+        self,
+        tile_shape: int | tuple[int, int],
+        overlap: int | tuple[int, int] = 0,
+        bands: Sequence[int] | None = None,
+        drop_partial: bool = False,
+        skip_empty: bool = False,
+    ) -> Iterator[tuple[tuple[slice, slice], NDArray[np.floating[Any]]]]:
+        """Iterate over the image tile by tile, reading each tile from the backend on demand.
+
+        Tiles are visited in row-major order. Only one tile is held in memory at a time, so any per-tile
+        algorithm can stream over images that do not fit into memory.
+
+        Args:
+            tile_shape: Size of the tiles as (rows, cols), or a single int for square tiles.
+            overlap: Number of rows and columns shared by neighbouring tiles, as (rows, cols) or a single
+                int. Tiles start every `tile_shape - overlap` pixels.
+            bands: Optional 0-based band indices to read. If None, all bands are read.
+            drop_partial: If True, skip the tiles at the bottom and right edges that are smaller than
+                `tile_shape`. If False, they are yielded with their actual, smaller size.
+            skip_empty: If True, skip the tiles without a single valid pixel (see `valid_mask`) before
+                reading them, e.g. the NaN background around a cropped scan.
+
+        Returns:
+            An iterator of tuples of the (rows, cols) window of the tile in image coordinates and the
+            (rows, cols, bands) array read from it. Each tile is read when the iterator reaches it.
+
+        Raises:
+            InvalidInputError: If the tile shape is not positive, the overlap is negative or not smaller
+                than the tile shape, or the band selection is invalid.
+
+        Example:
+            ```python
+            for (rows, cols), tile in spectral_image.iter_tiles((512, 512), overlap=16):
+                result[rows, cols] = process(tile)
+            ```
+        """
+        band_indices = self._resolve_bands(bands)
+        windows = _tile_windows(self.shape[:2], tile_shape, overlap, drop_partial)
+        if skip_empty:
+            mask = self.valid_mask()
+            windows = [window for window in windows if mask.any(*window)]
+        return ((window, self._apply_dtype_policy(self.image.read_window(*window, band_indices))) for window in windows)
+
+
+def _tile_windows(
+    size: tuple[int, int],
+    tile_shape: int | tuple[int, int],
+    overlap: int | tuple[int, int] = 0,
+    drop_partial: bool = False,
+) -> list[tuple[slice, slice]]:
+    """Split an image of the given (rows, cols) size into row-major (rows, cols) tile windows."""
+    tile = (tile_shape, tile_shape) if isinstance(tile_shape, int) else tuple(tile_shape)
+    overlaps = (overlap, overlap) if isinstance(overlap, int) else tuple(overlap)
+    if len(tile) != 2 or len(overlaps) != 2 or min(tile) < 1 or min(overlaps) < 0:
+        raise InvalidInputError(
+            {"tile_shape": tile_shape, "overlap": overlap},
+            "Tile shape must be positive and overlap non-negative, given as an int or a (rows, cols) tuple",
+        )
+    if overlaps[0] >= tile[0] or overlaps[1] >= tile[1]:
+        raise InvalidInputError({"tile_shape": tile_shape, "overlap": overlap}, "Overlap must be smaller than the tile")
+
+    axes = []
+    for length, tile_length, overlap_length in zip(size, tile, overlaps):
+        starts = range(0, length, tile_length - overlap_length)
+        # skip tiles that lie entirely within the overlap of the previous one
+        spans = [
+            slice(start, min(start + tile_length, length))
+            for start in starts
+            if start == 0 or start + overlap_length < length
+        ]
+        if drop_partial:
+            spans = [span for span in spans if span.stop - span.start == tile_length]
+        axes.append(spans)
+    return [(rows, cols) for rows in axes[0] for cols in axes[1]]
+
+
+def _strip_shape(shape: tuple[int, int, int]) -> tuple[int, int]:
+    """Get the shape of full-width strips that stay within the tile byte budget."""
+    _, width, bands = shape
+    # assume 8-byte values so the budget also holds for float64 images
+    return (max(_TILE_BYTES // max(width * bands * 8, 1), 1), width)
+
+
+def _validate_pixels_within_image(
+    pixels: Pixels | pd.DataFrame | Iterable[CoordinateInput], shape: tuple[int, int, int]
+) -> Pixels:
+    """Validate pixel input and ensure all coordinates are integer positions inside the image."""
+    pixels = validate_pixel_input(pixels)
+    if np.issubdtype(pixels.dtype, np.floating):
+        logger.warning("Pixel DataFrame contains float values. Converting to integers.")
+        pixels = pixels.as_type(int)
+
+    x = pixels.x_array
+    y = pixels.y_array
+    if x.min() < 0 or y.min() < 0 or x.max() >= shape[1] or y.max() >= shape[0]:
+        raise InvalidInputError(
+            input_value={"image_shape": shape, "u_range": (x.min(), x.max()), "v_range": (y.min(), y.max())},
+            message="Pixel coordinates exceed image dimensions",
+        )
+    return pixels
+
+
+def _missing_array(shape: tuple[int, ...], dtype: np.dtype[Any]) -> NDArray[Any]:
+    """Create an array of missing values: NaN for floating-point data, fully masked for other data."""
+    if np.issubdtype(dtype, np.floating):
+        return np.full(shape, np.nan, dtype=dtype)
+    return np.ma.masked_all(shape, dtype=dtype)
+
+
+def _from_cached(
+    image: ImageBase, array: NDArray[np.floating[Any]], nan_value: float | None, copy: bool
+) -> NDArray[np.floating[Any]]:
+    """Apply the to_numpy output options to a read-only cached array, using the NaN handling of the backend."""
+    if nan_value is not None:
+        return image.replace_nan(array.copy(), nan_value)
+    return array.copy() if copy else array
+
+
+def _pixels_bounding_window(pixels: Pixels) -> tuple[slice, slice]:
+    """Get the (rows, cols) slices of the smallest window containing all pixels."""
+    rows = slice(int(pixels.y_array.min()), int(pixels.y_array.max()) + 1)
+    cols = slice(int(pixels.x_array.min()), int(pixels.x_array.max()) + 1)
+    return rows, cols
@@ -0,0 +1,176 @@
+"""Streaming, mergeable per-band statistics.
+
+Statistics are accumulated tile by tile with the parallel form of Welford's algorithm, so only a
+single tile has to be in memory at a time, and partial results of different tiles, images or
+workers can be merged exactly into dataset-wide statistics.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from siapy.core.exceptions import InvalidInputError
+
+__all__ = [
+    "BandStatistics",
+]
+
+
+@dataclass(frozen=True)
+class BandStatistics:
+    """Per-band summary statistics that can be updated and merged.
+
+    Attributes:
+        count: Number of valid (non-NaN) values of each band.
+        mean: Mean of the valid values of each band; NaN for bands without valid values.
+        m2: Sum of squared deviations from the mean of each band.
+        min: Minimum valid value of each band; NaN for bands without valid values.
+        max: Maximum valid value of each band; NaN for bands without valid values.
+        nan_count: Number of NaN values of each band.
+    """
+
+    count: NDArray[np.int64]
+    mean: NDArray[np.float64]
+    m2: NDArray[np.float64]
+    min: NDArray[np.float64]
+    max: NDArray[np.float64]
+    nan_count: NDArray[np.int64]
+
+    @classmethod
+    def empty(cls, bands: int) -> "BandStatistics":
+        """Create statistics of no values.
+
+        Args:
+            bands: Number of bands.
+
+        Returns:
+            Statistics that act as the identity element of `merge`.
+        """
+        nan = np.full(bands, np.nan)
+        zeros = np.zeros(bands, dtype=np.int64)
+        return cls(zeros, nan, np.zeros(bands), nan, nan, zeros)
+
+    @classmethod
+    def from_array(cls, array: NDArray[Any]) -> "BandStatistics":
+        """Compute the statistics of an array whose last axis holds the bands.
+
+        Args:
+            array: Array of shape (..., bands), e.g. an image tile of shape (rows, cols, bands).
+
+        Returns:
+            The statistics of all values of the array, per band.
+        """
+        values = np.asarray(array).reshape(-1, np.shape(array)[-1])
+        bands = values.shape[1]
+        if not np.issubdtype(values.dtype, np.floating):
+            # integer data has no NaN values
+            if values.shape[0] == 0:
+                return cls.empty(bands)
+            mean = values.mean(axis=0, dtype=np.float64)
+            return cls(
+                np.full(bands, values.shape[0], dtype=np.int64),
+                mean,
+                np.square(values - mean).sum(axis=0),
+                values.min(axis=0).astype(np.float64),
+                values.max(axis=0).astype(np.float64),
+                np.zeros(bands, dtype=np.int64),
+            )
+
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0, dtype=np.int64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nansum(values, axis=0, dtype=np.float64) / count
+            m2 = np.nansum(np.square(values - mean), axis=0, dtype=np.float64)
+        return cls(
+            count,
+            np.where(count > 0, mean, np.nan),
+            m2,
+            np.fmin.reduce(values, axis=0, initial=np.nan).astype(np.float64),
+            np.fmax.reduce(values, axis=0, initial=np.nan).astype(np.float64),
+            values.shape[0] - count,
+        )
+
+    @property
+    def bands(self) -> int:
+        """Get the number of bands.
+
+        Returns:
+            The number of bands the statistics are computed for.
+        """
+        return len(self.count)
+
+    @property
+    def variance(self) -> NDArray[np.float64]:
+        """Get the population variance of each band.
+
+        Returns:
+            The variance of the valid values of each band; NaN for bands without valid values.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 0, self.m2 / self.count, np.nan)
+
+    @property
+    def std(self) -> NDArray[np.float64]:
+        """Get the population standard deviation of each band.
+
+        Returns:
+            The standard deviation of the valid values of each band.
+        """
+        return np.sqrt(self.variance)
+
+    def update(self, array: NDArray[Any]) -> "BandStatistics":
+        """Add the values of an array to the statistics.
+
+        Args:
+            array: Array of shape (..., bands).
+
+        Returns:
+            New statistics covering both the previous values and the array.
+        """
+        return self.merge(BandStatistics.from_array(array))
+
+    def merge(self, other: "BandStatistics") -> "BandStatistics":
+        """Combine two sets of statistics computed over disjoint values.
+
+        Args:
+            other: Statistics of the same bands.
+
+        Returns:
+            The statistics of the union of both sets of values.
+
+        Raises:
+            InvalidInputError: If the number of bands does not match.
+
+        Example:
+            ```python
+            stats = BandStatistics.from_array(tile_a).merge(BandStatistics.from_array(tile_b))
+            print(stats.mean, stats.std)
+            ```
+        """
+        if other.bands != self.bands:
+            raise InvalidInputError(
+                {"bands": self.bands, "other_bands": other.bands},
+                "Statistics with a different number of bands cannot be merged",
+            )
+        count = self.count + other.count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = other.mean - self.mean
+            weight = other.count / count
+            mean = np.where(
+                self.count == 0, other.mean, np.where(other.count == 0, self.mean, self.mean + delta * weight)
+            )
+            m2 = np.where(
+                (self.count == 0) | (other.count == 0),
+                self.m2 + other.m2,
+                self.m2 + other.m2 + np.square(delta) * self.count * weight,
+            )
+        return BandStatistics(
+            count,
+            mean,
+            m2,
+            np.fmin(self.min, other.min),
+            np.fmax(self.max, other.max),
+            self.nan_count + other.nan_count,
+        )
@@ -0,0 +1,276 @@
+"""Per-pixel validity masks stored as packed bitmaps.
+
+A pixel is valid if none of its bands is NaN. Several operations (replacing NaN pixels, measuring
+the background share, dropping NaN signatures, skipping empty tiles) need this mask, and computing
+it means reading every band of every pixel. The mask is therefore built once in a streaming pass,
+packed to one bit per pixel and stored in a sidecar file next to the image (or in a cache
+directory), so later uses only read a small compressed file.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from siapy.core import logger
+from siapy.core.exceptions import InvalidInputError
+
+from .interfaces import ImageBase
+
+__all__ = [
+    "ValidMask",
+    "build_valid_mask",
+    "load_valid_mask",
+    "pixel_valid_mask",
+    "save_valid_mask",
+    "valid_mask_path",
+]
+
+_SIDECAR_SUFFIX = ".valid.npz"
+
+
+@dataclass(frozen=True)
+class ValidMask:
+    """Validity of each pixel of an image, packed to one bit per pixel.
+
+    Attributes:
+        shape: The (height, width) of the image.
+        packed: The row-wise packed bits of shape (height, ceil(width / 8)), as produced by
+            `np.packbits(mask, axis=1)`. Set bits mark valid pixels.
+    """
+
+    shape: tuple[int, int]
+    packed: NDArray[np.uint8]
+
+    @classmethod
+    def from_array(cls, mask: NDArray[np.bool_]) -> "ValidMask":
+        """Pack a boolean mask.
+
+        Args:
+            mask: Boolean array of shape (height, width), True for valid pixels.
+
+        Returns:
+            The packed mask.
+
+        Raises:
+            InvalidInputError: If the mask is not two-dimensional.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.ndim != 2:
+            raise InvalidInputError(mask.shape, "Validity mask must be a 2D (height, width) array")
+        return cls((mask.shape[0], mask.shape[1]), np.packbits(mask, axis=1))
+
+    @property
+    def nbytes(self) -> int:
+        """Get the size of the packed bitmap.
+
+        Returns:
+            The number of bytes used by the packed bits.
+        """
+        return int(self.packed.nbytes)
+
+    @property
+    def count(self) -> int:
+        """Get the number of valid pixels.
+
+        Returns:
+            The number of set bits; the padding bits of each row are always zero.
+        """
+        return int(np.unpackbits(self.packed).sum(dtype=np.int64))
+
+    @property
+    def valid_fraction(self) -> float:
+        """Get the share of valid pixels.
+
+        Returns:
+            The fraction of valid pixels in the range [0, 1], or 0.0 for an empty image.
+        """
+        size = self.shape[0] * self.shape[1]
+        return self.count / size if size else 0.0
+
+    @property
+    def background_percentage(self) -> float:
+        """Get the share of invalid (background) pixels.
+
+        Returns:
+            The percentage of pixels with a NaN value in at least one band.
+        """
+        size = self.shape[0] * self.shape[1]
+        return (size - self.count) / size * 100 if size else 0.0
+
+    def to_numpy(self) -> NDArray[np.bool_]:
+        """Unpack the mask.
+
+        Returns:
+            Boolean array of shape (height, width), True for valid pixels.
+        """
+        return self.window(slice(None), slice(None))
+
+    def window(self, rows: slice, cols: slice) -> NDArray[np.bool_]:
+        """Unpack a rectangular region of the mask.
+
+        Only the packed rows of the region are unpacked.
+
+        Args:
+            rows: Slice selecting the rows.
+            cols: Slice selecting the columns.
+
+        Returns:
+            Boolean array of the region, True for valid pixels.
+        """
+        bits = np.unpackbits(self.packed[rows], axis=1, count=self.shape[1])
+        return bits[:, cols].astype(bool)
+
+    def any(self, rows: slice, cols: slice) -> bool:
+        """Check whether a rectangular region contains a valid pixel.
+
+        Args:
+            rows: Slice selecting the rows.
+            cols: Slice selecting the columns.
+
+        Returns:
+            True if at least one pixel of the region is valid.
+        """
+        return bool(self.window(rows, cols).any())
+
+    def at(self, rows: ArrayLike, cols: ArrayLike) -> NDArray[np.bool_]:
+        """Look up the validity of individual pixels without unpacking the mask.
+
+        Args:
+            rows: Row (y) coordinates of the pixels.
+            cols: Column (x) coordinates of the pixels.
+
+        Returns:
+            Boolean array with the validity of each pixel.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp)
+        return ((self.packed[rows, cols >> 3] >> (7 - (cols & 7))) & 1).astype(bool)
+
+
+def pixel_valid_mask(array: NDArray[Any]) -> NDArray[np.bool_]:
+    """Compute which pixels of an array have no missing value in any band.
+
+    Args:
+        array: Array of shape (..., bands), e.g. an image tile of shape (rows, cols, bands).
+
+    Returns:
+        Boolean array of shape (...), True for pixels without NaN (or masked) values.
+    """
+    missing = np.ma.getmaskarray(array).any(axis=-1) if np.ma.isMaskedArray(array) else None
+    data = np.ma.getdata(array)
+    if np.issubdtype(data.dtype, np.floating):
+        nan = np.isnan(data).any(axis=-1)
+        missing = nan if missing is None else missing | nan
+    if missing is None:
+        # integer data has no NaN values
+        return np.ones(data.shape[:-1], dtype=bool)
+    return ~missing
+
+
+def build_valid_mask(image: ImageBase, strip_rows: int) -> ValidMask:
+    """Build the validity mask of an image in a single streaming pass.
+
+    The image is read in full-width strips and each strip is packed right away, so memory use is
+    bounded by one strip plus the packed bitmap. Images with an integer data type cannot hold NaN
+    values and are not read at all.
+
+    Args:
+        image: The image backend.
+        strip_rows: Number of rows read at a time.
+
+    Returns:
+        The validity mask of the image.
+
+    Raises:
+        InvalidInputError: If strip_rows is not positive.
+    """
+    if strip_rows < 1:
+        raise InvalidInputError(strip_rows, "Number of rows per strip must be positive")
+    height, width = image.shape[0], image.shape[1]
+    if not np.issubdtype(image.dtype, np.floating):
+        return ValidMask.from_array(np.ones((height, width), dtype=bool))
+
+    packed = np.empty((height, (width + 7) // 8), dtype=np.uint8)
+    for start in range(0, height, strip_rows):
+        rows = slice(start, min(start + strip_rows, height))
+        packed[rows] = np.packbits(pixel_valid_mask(image.read_window(rows, slice(None))), axis=1)
+    return ValidMask((height, width), packed)
+
+
+def valid_mask_path(filepath: str | Path, cache_dir: str | Path | None = None) -> Path:
+    """Get the path of the validity mask sidecar file of an image.
+
+    Args:
+        filepath: Path of the image file.
+        cache_dir: Optional directory holding the mask files. If None, the sidecar is stored next to
+            the image.
+
+    Returns:
+        The sidecar path. Files in a cache directory are named by a hash of the resolved image path,
+        so images with the same name in different directories do not collide.
+    """
+    filepath = Path(filepath)
+    if cache_dir is None:
+        return filepath.with_name(filepath.name + _SIDECAR_SUFFIX)
+    digest = hashlib.sha1(str(filepath.resolve()).encode()).hexdigest()[:16]
+    return Path(cache_dir) / f"{filepath.stem}-{digest}{_SIDECAR_SUFFIX}"
+
+
+def save_valid_mask(mask: ValidMask, image: ImageBase, cache_dir: str | Path | None = None) -> Path:
+    """Store a validity mask in the sidecar file of an image.
+
+    The sidecar records the modification time and size of the image file, so it is ignored once the
+    image is rewritten.
+
+    Args:
+        mask: The mask to store.
+        image: The image backend the mask was built from.
+        cache_dir: Optional directory holding the mask files. If None, the sidecar is stored next to
+            the image.
+
+    Returns:
+        The path of the written sidecar file.
+    """
+    path = valid_mask_path(image.filepath, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stat = image.filepath.stat()
+    np.savez_compressed(
+        path,
+        source=np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64),
+        shape=np.array(mask.shape, dtype=np.int64),
+        packed=mask.packed,
+    )
+    return path
+
+
+def load_valid_mask(image: ImageBase, cache_dir: str | Path | None = None) -> ValidMask | None:
+    """Load the validity mask of an image from its sidecar file.
+
+    Args:
+        image: The image backend.
+        cache_dir: Optional directory holding the mask files. If None, the sidecar next to the image
+            is used.
+
+    Returns:
+        The stored mask, or None if there is no sidecar, or it is stale or unreadable.
+    """
+    path = valid_mask_path(image.filepath, cache_dir)
+    if not path.is_file():
+        return None
+    try:
+        with np.load(path) as data:
+            stat = image.filepath.stat()
+            shape = (int(data["shape"][0]), int(data["shape"][1]))
+            if data["source"].tolist() != [stat.st_mtime_ns, stat.st_size] or shape != tuple(image.shape[:2]):
+                return None
+            packed = data["packed"]
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Ignoring unreadable validity mask file %s: %s", path, e)
+        return None
+    if packed.shape != (shape[0], (shape[1] + 7) // 8):
+        return None
+    return ValidMask(shape, packed)
@@ -1,23 +1,130 @@
+import functools
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Iterator, Sequence
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    SupportsIndex,
+    TypeVar,
+    get_args,
+    overload,
+)
 
-import numpy as np
+from numpy.typing import NDArray
 from rich.progress import track
 
 from siapy.core import logger
-from siapy.core.exceptions import InvalidInputError
+from siapy.core.exceptions import InvalidFilepathError, InvalidInputError, ProcessingError
 from siapy.entities import SpectralImage
+from siapy.entities.images import RasterioLibImage, SpectralLibImage
+from siapy.entities.images.catalog import (
+    catalog_entry,
+    catalog_entry_is_stale,
+    lazy_image_from_entry,
+    read_catalog,
+    wavelengths_signature,
+    write_catalog,
+)
+from siapy.entities.images.lazy import LazyImage
+from siapy.entities.images.statistics import BandStatistics
+from siapy.utils.general import get_number_cpus
 
 __all__ = [
     "SpectralImageSet",
+    "OnErrorType",
+    "ExecutorType",
 ]
 
+# "raise" reports the failed files after every file was tried (a single failure as its own error, several
+# in one ProcessingError); "skip" leaves them out
+OnErrorType = Literal["raise", "skip"]
+
+# threads share the opened images; processes receive pickled copies that reopen their files
+ExecutorType = Literal["thread", "process"]
+
+_SourceT = TypeVar("_SourceT")
+_ResultT = TypeVar("_ResultT")
+
+
+class _ImageList(list[SpectralImage[Any]]):
+    """List of the images of a set that counts its mutations, so that indexes know when to rebuild."""
+
+    def __init__(self, images: Iterable[SpectralImage[Any]] = ()):
+        super().__init__(images)
+        self.version = 0
+
+    def _mutated(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._mutated()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._mutated()
+
+    def __iadd__(self, images: Iterable[SpectralImage[Any]]) -> "_ImageList":  # type: ignore[override,misc]  # noqa: PYI034
+        super().__iadd__(images)
+        self._mutated()
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> "_ImageList":  # noqa: PYI034
+        super().__imul__(count)
+        self._mutated()
+        return self
+
+    def append(self, image: SpectralImage[Any]) -> None:
+        super().append(image)
+        self._mutated()
+
+    def extend(self, images: Iterable[SpectralImage[Any]]) -> None:
+        super().extend(images)
+        self._mutated()
+
+    def insert(self, index: Any, image: SpectralImage[Any]) -> None:
+        super().insert(index, image)
+        self._mutated()
+
+    def pop(self, index: Any = -1) -> SpectralImage[Any]:
+        image = super().pop(index)
+        self._mutated()
+        return image
+
+    def remove(self, image: SpectralImage[Any]) -> None:
+        super().remove(image)
+        self._mutated()
+
+    def clear(self) -> None:
+        super().clear()
+        self._mutated()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._mutated()
+
+    def sort(self, *, key: Any = None, reverse: bool = False) -> None:
+        super().sort(key=key, reverse=reverse)
+        self._mutated()
+
 
 @dataclass
 class SpectralImageSet:
     def __init__(self, spectral_images: list[SpectralImage[Any]] | None = None):
-        self._images = spectral_images if spectral_images is not None else []
+        self._images = _ImageList(spectral_images if spectral_images is not None else [])
+        self._open_errors: dict[Path, Exception] = {}
+        # hash indexes from a key (e.g. camera ID) to the images with that key, built on first use
+        self._indexes: dict[str, dict[Hashable, list[SpectralImage[Any]]]] = {}
+        # version of the images list the indexes were built from; changes made through the `images` list
+        # directly bump the version and invalidate the indexes
+        self._indexed_version = self._images.version
 
     def __len__(self) -> int:
         return len(self.images)
@@ -37,6 +144,9 @@ class SpectralImageSet:
         *,
         header_paths: Sequence[str | Path],
         image_paths: Sequence[str | Path] | None = None,
+        max_workers: int = 1,
+        lazy: bool = False,
+        on_error: OnErrorType = "raise",
     ) -> "SpectralImageSet":
         if image_paths is not None and len(header_paths) != len(image_paths):
             raise InvalidInputError(
@@ -47,47 +157,383 @@ class SpectralImageSet:
                 "The length of hdr_paths and img_path must be equal.",
             )
 
-        if image_paths is None:
-            spectral_images = [
-                SpectralImage.spy_open(header_path=hdr_path)
-                for hdr_path in track(header_paths, description="Loading spectral images...")
-            ]
-        else:
-            spectral_images = [
-                SpectralImage.spy_open(header_path=hdr_path, image_path=img_path)
-                for hdr_path, img_path in track(
-                    zip(header_paths, image_paths),
-                    description="Loading spectral images...",
-                )
-            ]
+        sources: list[tuple[Path, Path | None]] = [
+            (Path(hdr_path), None if image_paths is None else Path(image_paths[idx]))
+            for idx, hdr_path in enumerate(header_paths)
+        ]
+        if lazy:
+            return cls._open_all(
+                sources,
+                _lazy_spy_image,
+                max_workers=max_workers,
+                on_error=on_error,
+                description="Locating spectral images...",
+            )
+
+        image_set = cls._open_all(
+            sources,
+            lambda source: SpectralImage.spy_open(header_path=source[0], image_path=source[1]),
+            max_workers=max_workers,
+            on_error=on_error,
+            description="Loading spectral images...",
+        )
         logger.info("Spectral images loaded into memory.")
-        return cls(spectral_images)
+        return image_set
 
     @classmethod
     def rasterio_open(
         cls,
         *,
         filepaths: Sequence[str | Path],
+        max_workers: int = 1,
+        lazy: bool = False,
+        on_error: OnErrorType = "raise",
     ) -> "SpectralImageSet":
+        sources = [Path(filepath) for filepath in filepaths]
+        if lazy:
+            return cls._open_all(
+                sources,
+                _lazy_rasterio_image,
+                max_workers=max_workers,
+                on_error=on_error,
+                description="Locating raster images...",
+            )
+
+        image_set = cls._open_all(
+            sources,
+            SpectralImage.rasterio_open,
+            max_workers=max_workers,
+            on_error=on_error,
+            description="Loading raster images...",
+        )
+        logger.info("Raster images loaded into memory.")
+        return image_set
+
+    @classmethod
+    def from_catalog(
+        cls,
+        path: str | Path,
+        *,
+        max_workers: int = 1,
+        on_error: OnErrorType = "raise",
+    ) -> "SpectralImageSet":
+        entries = read_catalog(path)
+        # unchanged files become lazy images answering their metadata from the catalog; changed ones are reopened
+        stale = [idx for idx, entry in enumerate(entries) if catalog_entry_is_stale(entry)]
+        sources: list[tuple[Path, Path] | Path] = [
+            (Path(entries[idx]["header_path"]), Path(entries[idx]["filepath"]))
+            if entries[idx]["backend"] == "spectral"
+            else Path(entries[idx]["filepath"])
+            for idx in stale
+        ]
+        reopened = cls._open_all(
+            sources,
+            lambda source: (
+                SpectralImage.spy_open(header_path=source[0], image_path=source[1])
+                if isinstance(source, tuple)
+                else SpectralImage.rasterio_open(source)
+            ),
+            max_workers=max_workers,
+            on_error=on_error,
+            description="Revalidating changed images...",
+        )
+        if stale:
+            logger.info("Reopened %d of %d cataloged images whose files changed.", len(reopened), len(stale))
+
+        reopened_images = iter(reopened.images)
+        replaced = {
+            idx: next(reopened_images)
+            for idx, source in zip(stale, sources)
+            if _source_path(source) not in reopened.open_errors
+        }
+        stale_indexes = set(stale)
         spectral_images = [
-            SpectralImage.rasterio_open(filepath)
-            for filepath in track(filepaths, description="Loading raster images...")
+            replaced[idx] if idx in replaced else SpectralImage(lazy_image_from_entry(entry))
+            for idx, entry in enumerate(entries)
+            if idx in replaced or idx not in stale_indexes
         ]
-        logger.info("Raster images loaded into memory.")
-        return cls(spectral_images)
+        image_set = cls(spectral_images)
+        image_set._open_errors = reopened.open_errors
+        return image_set
+
+    @classmethod
+    def _open_all(
+        cls,
+        sources: Sequence[_SourceT],
+        open_image: Callable[[_SourceT], SpectralImage[Any]],
+        *,
+        max_workers: int,
+        on_error: OnErrorType,
+        description: str,
+    ) -> "SpectralImageSet":
+        if max_workers < 1:
+            raise InvalidInputError(max_workers, "Number of workers must be positive.")
+        if on_error not in get_args(OnErrorType):
+            raise InvalidInputError(on_error, f"on_error must be one of {get_args(OnErrorType)}.")
+
+        def attempt(source: _SourceT) -> SpectralImage[Any] | Exception:
+            # errors are collected so that one broken file does not abort the whole batch
+            try:
+                return open_image(source)
+            except Exception as e:  # noqa: BLE001
+                return e
+
+        if max_workers == 1:
+            results = list(track(map(attempt, sources), total=len(sources), description=description))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(track(executor.map(attempt, sources), total=len(sources), description=description))
+
+        spectral_images = [result for result in results if isinstance(result, SpectralImage)]
+        errors = {
+            _source_path(source): result for source, result in zip(sources, results) if isinstance(result, Exception)
+        }
+        if len(errors) == 1 and on_error == "raise":
+            raise next(iter(errors.values()))
+        if errors and on_error == "raise":
+            details = "; ".join(f"{path}: {error}" for path, error in errors.items())
+            raise ProcessingError(f"Failed to open {len(errors)} of {len(sources)} images: {details}")
+        for path, error in errors.items():
+            logger.warning("Skipping image %s: %s", path, error)
+
+        image_set = cls(spectral_images)
+        image_set._open_errors = errors
+        return image_set
+
+    def build_catalog(self, path: str | Path) -> Path:
+        return write_catalog([catalog_entry(image.image) for image in self.images], path)
 
     @property
     def images(self) -> list[SpectralImage[Any]]:
         return self._images
 
+    @property
+    def open_errors(self) -> dict[Path, Exception]:
+        return dict(self._open_errors)
+
     @property
     def cameras_id(self) -> list[str]:
-        return list({image.camera_id for image in self.images})
+        return list(self._index("camera_id"))
 
     def images_by_camera_id(self, camera_id: str) -> list[SpectralImage[Any]]:
-        ids = np.array([image.camera_id for image in self.images])
-        indices = np.nonzero(ids == camera_id)[0]
-        return [image for idx, image in enumerate(self.images) if idx in indices]
+        return list(self._index("camera_id").get(camera_id, []))
+
+    def query(
+        self,
+        *,
+        camera_id: str | None = None,
+        bands: int | None = None,
+        shape: Sequence[int] | None = None,
+        wavelengths: Sequence[float] | NDArray[Any] | None = None,
+        stem: str | None = None,
+        path_glob: str | None = None,
+    ) -> "SpectralImageSet":
+        candidates: list[list[SpectralImage[Any]]] = []
+        for field, value in (("camera_id", camera_id), ("bands", bands), ("stem", stem)):
+            if value is not None:
+                candidates.append(self._index(field).get(value, []))
+        if shape is not None:
+            candidates.append(self._index("shape").get(tuple(int(size) for size in shape), []))
+        if wavelengths is not None:
+            candidates.append(self._index("wavelengths").get(wavelengths_signature(wavelengths), []))
+        if path_glob is not None:
+            candidates.append(
+                [image for path, images in self._index("filepath").items() if path.match(path_glob) for image in images]
+            )
+        if not candidates:
+            return SpectralImageSet(list(self.images))
+
+        # intersect starting from the most selective criterion, keeping the order of the set
+        candidates.sort(key=len)
+        result = candidates[0]
+        for other in candidates[1:]:
+            other_ids = {id(image) for image in other}
+            result = [image for image in result if id(image) in other_ids]
+        return SpectralImageSet(list(result))
+
+    def append(self, image: SpectralImage[Any]) -> None:
+        self._sync_indexes()
+        self._images.append(image)
+        for field, index in self._indexes.items():
+            index.setdefault(_INDEX_KEYS[field](image), []).append(image)
+        self._indexed_version = self._images.version
+
+    def extend(self, images: Iterable[SpectralImage[Any]]) -> None:
+        for image in images:
+            self.append(image)
 
     def sort(self, key: Any = None, reverse: bool = False) -> None:
-        self.images.sort(key=key, reverse=reverse)
+        self._images.sort(key=key, reverse=reverse)
+
+    def _index(self, field: str) -> dict[Any, list[SpectralImage[Any]]]:
+        self._sync_indexes()
+        index = self._indexes.get(field)
+        if index is None:
+            index = {}
+            for image in self.images:
+                index.setdefault(_INDEX_KEYS[field](image), []).append(image)
+            self._indexes[field] = index
+        return index
+
+    def _sync_indexes(self) -> None:
+        if self._indexed_version != self._images.version:
+            self._indexes.clear()
+            self._indexed_version = self._images.version
+
+    @overload
+    def map(
+        self,
+        func: Callable[[SpectralImage[Any]], _ResultT],
+        *,
+        executor: ExecutorType = ...,
+        max_workers: int = ...,
+        max_inflight_bytes: int | None = ...,
+        reduce: None = ...,
+    ) -> list[_ResultT]: ...
+
+    @overload
+    def map(
+        self,
+        func: Callable[[SpectralImage[Any]], _ResultT],
+        *,
+        executor: ExecutorType = ...,
+        max_workers: int = ...,
+        max_inflight_bytes: int | None = ...,
+        reduce: Callable[[_ResultT, _ResultT], _ResultT],
+    ) -> _ResultT: ...
+
+    def map(
+        self,
+        func: Callable[[SpectralImage[Any]], _ResultT],
+        *,
+        executor: ExecutorType = "thread",
+        max_workers: int = -1,
+        max_inflight_bytes: int | None = None,
+        reduce: Callable[[_ResultT, _ResultT], _ResultT] | None = None,
+    ) -> list[_ResultT] | _ResultT:
+        if executor not in get_args(ExecutorType):
+            raise InvalidInputError(executor, f"executor must be one of {get_args(ExecutorType)}.")
+        if max_inflight_bytes is not None and max_inflight_bytes <= 0:
+            raise InvalidInputError(max_inflight_bytes, "Memory budget must be positive.")
+        if reduce is not None and not self.images:
+            raise InvalidInputError({"images": 0}, "Cannot reduce the results of an empty image set.")
+
+        workers = get_number_cpus(max_workers)
+        executor_type = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        with executor_type(max_workers=workers) as pool:
+            results = _map_in_order(pool, func, self.images, workers, max_inflight_bytes)
+            if reduce is None:
+                return list(results)
+            # results are folded in order as they become available, so they are not all kept in memory
+            return functools.reduce(reduce, results)
+
+    def band_statistics(
+        self,
+        bands: Sequence[int] | None = None,
+        *,
+        tile_shape: tuple[int, int] | None = None,
+    ) -> BandStatistics:
+        if not self.images:
+            raise InvalidInputError({"images": 0}, "Cannot compute statistics of an empty image set.")
+        statistics = self.images[0].band_statistics(bands, tile_shape=tile_shape)
+        for image in self.images[1:]:
+            statistics = statistics.merge(image.band_statistics(bands, tile_shape=tile_shape))
+        return statistics
+
+
+def _resident_bytes(image: SpectralImage[Any]) -> int:
+    """Estimate the memory needed to load an image from its shape and data type."""
+    rows, cols, bands = image.shape
+    return rows * cols * bands * image.dtype.itemsize
+
+
+def _map_in_order(
+    pool: Executor,
+    func: Callable[[SpectralImage[Any]], _ResultT],
+    images: Sequence[SpectralImage[Any]],
+    max_workers: int,
+    max_inflight_bytes: int | None,
+) -> Iterator[_ResultT]:
+    """Apply a function to the images in a pool, keeping the estimated size of the running images within a budget.
+
+    Images are submitted in order while a worker is free and the budget allows it; an image larger than
+    the budget runs alone. Results are yielded in the order of the images.
+    """
+    sizes = [_resident_bytes(image) for image in images] if max_inflight_bytes is not None else [0] * len(images)
+    running: dict[Future[_ResultT], int] = {}
+    finished: dict[int, _ResultT] = {}
+    inflight = 0
+    next_submit = 0
+    for next_yield in range(len(images)):
+        while next_yield not in finished:
+            while (
+                next_submit < len(images)
+                and len(running) < max_workers
+                and (not running or max_inflight_bytes is None or inflight + sizes[next_submit] <= max_inflight_bytes)
+            ):
+                running[pool.submit(func, images[next_submit])] = next_submit
+                inflight += sizes[next_submit]
+                next_submit += 1
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = running.pop(future)
+                inflight -= sizes[idx]
+                finished[idx] = future.result()
+        yield finished.pop(next_yield)
+
+
+_INDEX_KEYS: dict[str, Callable[[SpectralImage[Any]], Hashable]] = {
+    "camera_id": lambda image: image.camera_id,
+    "bands": lambda image: image.bands,
+    "shape": lambda image: image.shape,
+    "wavelengths": lambda image: wavelengths_signature(image.wavelengths_array),
+    "stem": lambda image: image.filepath.stem,
+    "filepath": lambda image: image.filepath,
+}
+
+
+def _source_path(source: Any) -> Path:
+    """Get the path identifying an image source: the header of (header, image) pairs, or the path itself."""
+    return Path(source[0]) if isinstance(source, tuple) else Path(source)
+
+
+# data file extensions tried next to an ENVI header, in the order the spectral library tries them
+_ENVI_DATA_EXTENSIONS = ("", "img", "dat", "sli", "hyspex", "raw", "bin", "bsq", "bil", "bip")
+
+
+def _envi_data_path(header_path: Path) -> Path:
+    """Find the data file of an ENVI header without parsing the header.
+
+    Raises:
+        InvalidFilepathError: If the header or its data file does not exist.
+    """
+    if not header_path.exists():
+        raise InvalidFilepathError(header_path)
+    if header_path.suffix.lower() == ".hdr":
+        stem = header_path.with_suffix("")
+        for ext in _ENVI_DATA_EXTENSIONS + tuple(ext.upper() for ext in _ENVI_DATA_EXTENSIONS if ext):
+            candidate = stem.with_name(f"{stem.name}.{ext}") if ext else stem
+            if candidate.is_file():
+                return candidate
+    raise InvalidFilepathError(header_path.with_suffix(""))
+
+
+def _lazy_spy_image(source: tuple[Path, Path | None]) -> SpectralImage[Any]:
+    """Create a lazily opened ENVI image, checking only that its files exist."""
+    header_path, image_path = source
+    if image_path is None:
+        image_path = _envi_data_path(header_path)
+    elif not header_path.exists():
+        raise InvalidFilepathError(header_path)
+    elif not image_path.exists():
+        raise InvalidFilepathError(image_path)
+    return SpectralImage(
+        LazyImage(partial(SpectralLibImage.open, header_path=header_path, image_path=image_path), image_path)
+    )
+
+
+def _lazy_rasterio_image(filepath: Path) -> SpectralImage[Any]:
+    """Create a lazily opened raster image, checking only that its file exists."""
+    if not filepath.exists():
+        raise InvalidFilepathError(filepath)
+    return SpectralImage(LazyImage(partial(RasterioLibImage.open, filepath), filepath))
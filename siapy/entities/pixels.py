@@ -34,27 +34,49 @@ class PixelCoordinate(NamedTuple):
 CoordinateInput: TypeAlias = PixelCoordinate | tuple[float, float] | Sequence[float]
 
 
-@dataclass
 class Pixels:
-    _data: pd.DataFrame
+    """Pixel coordinates stored as a (2, n) array of x and y values.
+
+    Integer coordinates are stored as int32 if they fit, however they are given. The DataFrame returned
+    by `df` is created on first access as a view of the stored values. Edits made through it, in place
+    or by replacing columns, rows or the index, are taken over by the array-based methods.
+    """
+
+    __slots__ = ("_df", "_index", "_xy")
     coords: ClassVar[HomogeneousCoordinate] = HomogeneousCoordinate()
 
+    def __init__(self, data: pd.DataFrame):
+        validate_pixel_input_dimensions(data)
+        self._xy: NDArray[Any] = _as_xy(data[[self.coords.X, self.coords.Y]].to_numpy())
+        # None stands for the default range index, so array-only construction never creates an index
+        self._index: pd.Index | None = None if _is_default_index(data.index) else data.index
+        self._df: pd.DataFrame | None = None
+
     def __len__(self) -> int:
-        return len(self.df)
+        return self._values().shape[1]
 
     def __repr__(self) -> str:
         return f"Pixels(\n{self.df}\n)"
 
     def __getitem__(self, indices: Any) -> "Pixels":
-        df_slice = self.df.iloc[indices]
-        if isinstance(df_slice, pd.Series):
-            df_slice = df_slice.to_frame().T
-        return Pixels(df_slice)
+        if isinstance(indices, (int, np.integer)):
+            indices = [indices]
+        return Pixels._from_xy(self._values()[:, indices], self._row_index()[indices])
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Pixels):
             return False
-        return self.df.equals(other.df)
+        xy, other_xy = self._values(), other._values()
+        return (
+            xy.dtype == other_xy.dtype and np.array_equal(xy, other_xy) and self._row_index().equals(other._row_index())
+        )
+
+    def __getstate__(self) -> tuple[NDArray[Any], pd.Index | None]:
+        return self._values(), self._index
+
+    def __setstate__(self, state: tuple[NDArray[Any], pd.Index | None]) -> None:
+        self._xy, self._index = state
+        self._df = None
 
     def __array__(self, dtype: np.dtype | None = None) -> NDArray[np.floating[Any]]:
         """Convert this pixels object to a numpy array when requested by NumPy."""
@@ -63,24 +85,77 @@ class Pixels:
             return array.astype(dtype)
         return array
 
-    def __post_init__(self) -> None:
-        validate_pixel_input_dimensions(self._data)
+    @classmethod
+    def _from_xy(cls, xy: NDArray[Any], index: pd.Index | None = None) -> Pixels:
+        """Create pixels from a validated (2, n) array without copying it."""
+        pixels = cls.__new__(cls)
+        pixels._xy = xy
+        pixels._index = None if index is None or _is_default_index(index) else index
+        pixels._df = None
+        return pixels
+
+    @classmethod
+    def from_numpy(cls, array: NDArray[Any]) -> Pixels:
+        """Create pixels from an (n, 2) array of x and y coordinates without creating a DataFrame.
+
+        Args:
+            array: Array of shape (n, 2). Integer coordinates are stored as int32 if they fit, other
+                values as given.
+
+        Returns:
+            The pixels.
+
+        Raises:
+            InvalidInputError: If the array does not have the shape (n, 2) with n > 0.
+        """
+        array = np.asarray(array)
+        if array.ndim != 2 or array.shape[1] != 2:
+            raise InvalidInputError(
+                input_value=array.shape,
+                message=f"NumPy array must be 2D with shape (n, 2), got shape {array.shape}",
+            )
+        if array.shape[0] == 0:
+            raise InvalidInputError(input_value=array.shape, message="Input array is empty.")
+        return cls._from_xy(_as_xy(array))
 
     @classmethod
     def from_iterable(cls, iterable: Iterable[CoordinateInput]) -> "Pixels":
-        df = pd.DataFrame(iterable, columns=[cls.coords.X, cls.coords.Y])
-        validate_pixel_input_dimensions(df)
-        return cls(df)
+        items = list(iterable)
+        if not items:
+            raise InvalidInputError(message="Input DataFrame is empty.", input_value=items)
+        try:
+            values = np.asarray(items)
+        except ValueError:
+            # ragged input is validated (and reported) through a DataFrame
+            return cls(pd.DataFrame(items, columns=[cls.coords.X, cls.coords.Y]))
+        if values.ndim != 2 or values.shape[1] != 2 or not np.issubdtype(values.dtype, np.number):
+            # irregular or non-numeric input is validated (and reported) through a DataFrame
+            df = pd.DataFrame(values, columns=[cls.coords.X, cls.coords.Y])
+            return cls(df)
+        return cls._from_xy(_as_xy(values))
 
     @classmethod
     def load_from_parquet(cls, filepath: str | Path) -> "Pixels":
         df = pd.read_parquet(filepath)
-        validate_pixel_input_dimensions(df)
         return cls(df)
 
     @property
     def df(self) -> pd.DataFrame:
-        return self._data
+        if self._df is None:
+            self._df = pd.DataFrame(self._xy.T, index=self._index, columns=[self.coords.X, self.coords.Y], copy=False)
+        return self._df
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        return self._values().dtype
+
+    @property
+    def x_array(self) -> NDArray[Any]:
+        return self._values()[0]
+
+    @property
+    def y_array(self) -> NDArray[Any]:
+        return self._values()[1]
 
     def df_homogenious(self) -> pd.DataFrame:
         df_homo = self.df.copy()
@@ -88,29 +163,64 @@ class Pixels:
         return df_homo
 
     def x(self) -> "pd.Series[float]":
-        return self.df[self.coords.X]
+        return pd.Series(self._values()[0], index=self._row_index(), name=self.coords.X, copy=False)
 
     def y(self) -> "pd.Series[float]":
-        return self.df[self.coords.Y]
+        return pd.Series(self._values()[1], index=self._row_index(), name=self.coords.Y, copy=False)
 
     def to_numpy(self) -> NDArray[np.floating[Any]]:
-        return self.df.to_numpy()
+        return self._values().T
 
     def to_list(self) -> list[PixelCoordinate]:
-        return self.df.values.tolist()
+        return self._values().T.tolist()
 
     def save_to_parquet(self, filepath: str | Path) -> None:
         self.df.to_parquet(filepath, index=True)
 
     def as_type(self, dtype: type) -> "Pixels":
-        converted_df = self.df.copy()
-        converted_df[self.coords.X] = converted_df[self.coords.X].astype(dtype)
-        converted_df[self.coords.Y] = converted_df[self.coords.Y].astype(dtype)
-        return Pixels(converted_df)
+        return Pixels._from_xy(self._values().astype(dtype), self._index)
 
     def get_coordinate(self, idx: int) -> PixelCoordinate:
-        row = self.df.iloc[idx]
-        return PixelCoordinate(x=row[self.coords.X], y=row[self.coords.Y])
+        xy = self._values()
+        return PixelCoordinate(x=xy[0, idx].item(), y=xy[1, idx].item())
+
+    def _values(self) -> NDArray[Any]:
+        """Get the (2, n) coordinates, taking over edits made through the DataFrame returned by `df`."""
+        df = self._df
+        if df is not None:
+            frame = df if list(df.columns) == [self.coords.X, self.coords.Y] else df[[self.coords.X, self.coords.Y]]
+            values = frame.to_numpy()
+            # edits in place keep the frame a view of the array; anything else replaces its data
+            if values.shape != self._xy.T.shape or not np.shares_memory(values, self._xy):
+                self._xy = _as_xy(values)
+            if df.index is not self._index and not (self._index is None and _is_default_index(df.index)):
+                self._index = None if _is_default_index(df.index) else df.index
+        return self._xy
+
+    def _row_index(self) -> pd.Index:
+        self._values()
+        return self._index if self._index is not None else pd.RangeIndex(len(self))
+
+
+def _is_default_index(index: pd.Index) -> bool:
+    return isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1 and index.name is None
+
+
+def _as_xy(values: NDArray[Any]) -> NDArray[Any]:
+    """Convert (n, 2) coordinates to a contiguous (2, n) array, storing integers as int32 if they fit."""
+    if values.dtype == object:
+        values = np.array(values.tolist())
+    dtype = values.dtype
+    if np.issubdtype(dtype, np.integer) and _fits_int32(values):
+        dtype = np.dtype(np.int32)
+    return np.ascontiguousarray(values.T, dtype=dtype)
+
+
+def _fits_int32(array: NDArray[np.integer[Any]]) -> bool:
+    if array.dtype.itemsize <= 2 or array.dtype == np.int32:
+        return True
+    info = np.iinfo(np.int32)
+    return bool(array.min() >= info.min and array.max() <= info.max)
 
 
 def validate_pixel_input_dimensions(df: pd.DataFrame | pd.Series) -> None:
@@ -151,12 +261,7 @@ def validate_pixel_input(input_data: Pixels | pd.DataFrame | Iterable[Coordinate
             return Pixels(input_data)
 
         if isinstance(input_data, np.ndarray):
-            if input_data.ndim != 2 or input_data.shape[1] != 2:
-                raise InvalidInputError(
-                    input_value=input_data.shape,
-                    message=f"NumPy array must be 2D with shape (n, 2), got shape {input_data.shape}",
-                )
-            return Pixels(pd.DataFrame(input_data, columns=[HomogeneousCoordinate.X, HomogeneousCoordinate.Y]))
+            return Pixels.from_numpy(input_data)
 
         if isinstance(input_data, Iterable):
             return Pixels.from_iterable(input_data)  # type: ignore
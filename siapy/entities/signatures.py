@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, Sequence
+from typing import Any, Iterable, Literal, Sequence, overload
 
 import numpy as np
 import pandas as pd
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 from siapy.core import logger
 from siapy.core.exceptions import InvalidInputError, InvalidTypeError
@@ -17,21 +17,60 @@ __all__ = [
 ]
 
 
-@dataclass
 class Signals:
-    _data: pd.DataFrame
+    """Spectral signals stored as a C-contiguous (n, bands) array.
+
+    Floating-point values are stored as float32 unless another `float_dtype` is requested; integer
+    values keep their data type. The DataFrame returned by `df` is created on first access as a view of
+    the stored values. Edits made through it, in place or by replacing columns, rows or the index, are
+    taken over by the array-based methods as the frame holds them, including their data type. The
+    wavelengths of the bands are optional and kept alongside the values.
+    """
+
+    __slots__ = ("_columns", "_df", "_index", "_values", "_wavelengths")
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        wavelengths: Sequence[float] | NDArray[Any] | None = None,
+        *,
+        float_dtype: DTypeLike | None = np.float32,
+    ):
+        self._values: NDArray[Any] = _as_values(data.to_numpy(), float_dtype)
+        self._index: pd.Index | None = None if _is_default_index(data.index) else data.index
+        self._columns: pd.Index | None = None if _is_default_index(data.columns) else data.columns
+        self._wavelengths = _validate_wavelengths(wavelengths, self._values.shape[1])
+        self._df: pd.DataFrame | None = None
 
     def __len__(self) -> int:
-        return len(self.df)
+        return self._data().shape[0]
 
     def __repr__(self) -> str:
         return f"Signals(\n{self.df}\n)"
 
     def __getitem__(self, indices: Any) -> "Signals":
-        df_slice = self.df.iloc[indices]
-        if isinstance(df_slice, pd.Series):
-            df_slice = df_slice.to_frame().T
-        return Signals(df_slice)
+        if isinstance(indices, (int, np.integer)):
+            indices = [indices]
+        return Signals._from_values(self._data()[indices], self._row_index()[indices], self._columns, self._wavelengths)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Signals):
+            return False
+        values, other_values = self._data(), other._data()
+        return (
+            values.dtype == other_values.dtype
+            and values.shape == other_values.shape
+            and np.array_equal(values, other_values, equal_nan=np.issubdtype(values.dtype, np.inexact))
+            and self._row_index().equals(other._row_index())
+            and self._column_index().equals(other._column_index())
+        )
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return self._data(), self._index, self._columns, self._wavelengths
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        self._values, self._index, self._columns, self._wavelengths = state
+        self._df = None
 
     def __array__(self, dtype: np.dtype | None = None) -> NDArray[np.floating[Any]]:
         """Convert this signals object to a numpy array when requested by NumPy."""
@@ -40,6 +79,58 @@ class Signals:
             return array.astype(dtype)
         return array
 
+    @classmethod
+    def _from_values(
+        cls,
+        values: NDArray[Any],
+        index: pd.Index | None = None,
+        columns: pd.Index | None = None,
+        wavelengths: NDArray[np.float64] | None = None,
+    ) -> "Signals":
+        """Create signals from a validated 2D array, copying it only if it is not C-contiguous."""
+        signals = cls.__new__(cls)
+        signals._values = np.ascontiguousarray(values)
+        signals._index = None if index is None or _is_default_index(index) else index
+        signals._columns = columns
+        signals._wavelengths = wavelengths
+        signals._df = None
+        return signals
+
+    @classmethod
+    def from_numpy(
+        cls,
+        array: NDArray[Any],
+        wavelengths: Sequence[float] | NDArray[Any] | None = None,
+        *,
+        float_dtype: DTypeLike | None = np.float32,
+    ) -> "Signals":
+        """Create signals from an array without creating a DataFrame.
+
+        Args:
+            array: Array of shape (n, bands), or (bands,) for a single signal.
+            wavelengths: Optional wavelengths of the bands.
+            float_dtype: Data type of floating-point values; None keeps the data type of the array.
+                Integer values always keep their data type.
+
+        Returns:
+            The signals.
+
+        Raises:
+            InvalidInputError: If the array is not 1D or 2D, or the number of wavelengths differs from
+                the number of bands.
+        """
+        array = np.asarray(array)
+        if array.ndim not in (1, 2):
+            raise InvalidInputError(
+                input_value=array.shape,
+                message=f"NumPy array must be 1D or 2D, got shape {array.shape}",
+            )
+        if array.ndim == 1:
+            array = array.reshape(1, -1)
+        return cls._from_values(
+            _as_values(array, float_dtype), wavelengths=_validate_wavelengths(wavelengths, array.shape[1])
+        )
+
     @classmethod
     def from_iterable(cls, iterable: Iterable) -> "Signals":
         df = pd.DataFrame(iterable)
@@ -52,17 +143,87 @@ class Signals:
 
     @property
     def df(self) -> pd.DataFrame:
-        return self._data
+        if self._df is None:
+            self._df = pd.DataFrame(self._values, index=self._index, columns=self._columns, copy=False)
+        return self._df
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        return self._data().dtype
+
+    @property
+    def wavelengths(self) -> NDArray[np.float64] | None:
+        self._data()
+        return self._wavelengths
+
+    def with_wavelengths(self, wavelengths: Sequence[float] | NDArray[Any] | None) -> "Signals":
+        values = self._data()
+        return Signals._from_values(
+            values, self._index, self._columns, _validate_wavelengths(wavelengths, values.shape[1])
+        )
 
     def to_numpy(self) -> NDArray[np.floating[Any]]:
-        return self.df.to_numpy()
+        return self._data()
 
     def average_signal(self, axis: int | tuple[int, ...] | Sequence[int] | None = 0) -> NDArray[np.floating[Any]]:
-        return np.nanmean(self.to_numpy(), axis=axis)
+        return np.nanmean(self._data(), axis=axis)
 
     def save_to_parquet(self, filepath: str | Path) -> None:
         self.df.to_parquet(filepath, index=True)
 
+    def _data(self) -> NDArray[Any]:
+        """Get the (n, bands) values, taking over edits made through the DataFrame returned by `df`."""
+        df = self._df
+        if df is not None:
+            values = df.to_numpy()
+            # edits in place keep the frame a view of the array; anything else replaces its data
+            if values.shape != self._values.shape or not np.shares_memory(values, self._values):
+                if values.shape[1] != self._values.shape[1]:
+                    self._wavelengths = None
+                self._values = values
+            if df.index is not self._index and not (self._index is None and _is_default_index(df.index)):
+                self._index = None if _is_default_index(df.index) else df.index
+            if df.columns is not self._columns and not (self._columns is None and _is_default_index(df.columns)):
+                self._columns = None if _is_default_index(df.columns) else df.columns
+        return self._values
+
+    def _row_index(self) -> pd.Index:
+        self._data()
+        return self._index if self._index is not None else pd.RangeIndex(len(self))
+
+    def _column_index(self) -> pd.Index:
+        return self._columns if self._columns is not None else pd.RangeIndex(self._data().shape[1])
+
+
+def _is_default_index(index: pd.Index) -> bool:
+    return isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1 and index.name is None
+
+
+def _as_values(values: NDArray[Any], float_dtype: DTypeLike | None) -> NDArray[Any]:
+    """Convert signal values to a C-contiguous array, storing floating-point values as `float_dtype`."""
+    if float_dtype is not None and np.issubdtype(values.dtype, np.floating):
+        return np.ascontiguousarray(values, dtype=float_dtype)
+    return np.ascontiguousarray(values)
+
+
+def _same_wavelengths(first: NDArray[np.float64] | None, second: NDArray[np.float64] | None) -> bool:
+    if first is None or second is None:
+        return first is second
+    return np.array_equal(first, second)
+
+
+def _validate_wavelengths(wavelengths: Sequence[float] | NDArray[Any] | None, bands: int) -> NDArray[np.float64] | None:
+    if wavelengths is None:
+        return None
+    array = np.array(wavelengths, dtype=np.float64)
+    if array.shape != (bands,):
+        raise InvalidInputError(
+            input_value={"wavelengths": array.shape, "bands": bands},
+            message="The number of wavelengths must equal the number of bands.",
+        )
+    array.flags.writeable = False
+    return array
+
 
 def validate_signal_input(input_data: Signals | pd.DataFrame | Iterable[Sequence[float]]) -> Signals:
     """Validates and converts various input types to Signals object."""
@@ -74,14 +235,7 @@ def validate_signal_input(input_data: Signals | pd.DataFrame | Iterable[Sequence
             return Signals(input_data)
 
         if isinstance(input_data, np.ndarray):
-            if input_data.ndim not in (1, 2):
-                raise InvalidInputError(
-                    input_value=input_data.shape,
-                    message=f"NumPy array must be 1D or 2D, got shape {input_data.shape}",
-                )
-            if input_data.ndim == 1:
-                input_data = input_data.reshape(1, -1)  # Reshape 1D array to 2D if needed
-            return Signals(pd.DataFrame(input_data))
+            return Signals.from_numpy(input_data)
 
         if isinstance(input_data, Iterable):
             return Signals.from_iterable(input_data)
@@ -113,7 +267,7 @@ class Signatures:
         return f"Signatures(\n{self.pixels}\n{self.signals}\n)"
 
     def __len__(self) -> int:
-        return len(self.pixels.df)
+        return len(self.pixels)
 
     def __getitem__(self, indices: Any) -> "Signatures":
         pixels = self.pixels[indices]
@@ -123,11 +277,65 @@ class Signatures:
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Signatures):
             return False
-        return self.pixels.df.equals(other.pixels.df) and self.signals.df.equals(other.signals.df)
+        return self.pixels == other.pixels and self.signals == other.signals
 
     def __post_init__(self) -> None:
         validate_inputs(self.pixels, self.signals)
 
+    @overload
+    @classmethod
+    def concat(cls, signatures: Sequence["Signatures"], *, return_source_ids: Literal[False] = ...) -> "Signatures": ...
+
+    @overload
+    @classmethod
+    def concat(
+        cls, signatures: Sequence["Signatures"], *, return_source_ids: Literal[True]
+    ) -> tuple["Signatures", NDArray[np.int32]]: ...
+
+    @classmethod
+    def concat(
+        cls, signatures: Sequence["Signatures"], *, return_source_ids: bool = False
+    ) -> "Signatures | tuple[Signatures, NDArray[np.int32]]":
+        if not signatures:
+            raise InvalidInputError({"signatures": 0}, "Cannot concatenate an empty sequence of signatures.")
+        lengths = np.fromiter((len(item) for item in signatures), dtype=np.int64, count=len(signatures))
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        total = int(offsets[-1])
+
+        # pre-size the outputs and copy every block into place, instead of concatenating frames pairwise
+        xy = np.empty((2, total), dtype=np.result_type(*(item.pixels.dtype for item in signatures)))
+        for item, start, stop in zip(signatures, offsets[:-1], offsets[1:]):
+            xy[:, start:stop] = item.pixels.to_numpy().T
+
+        columns = [item.signals._column_index() for item in signatures]
+        signals_dtype = np.result_type(*(item.signals.dtype for item in signatures))
+        wavelengths = signatures[0].signals.wavelengths
+        if all(column.equals(columns[0]) for column in columns[1:]):
+            values = np.empty((total, len(columns[0])), dtype=signals_dtype)
+            for item, start, stop in zip(signatures, offsets[:-1], offsets[1:]):
+                values[start:stop] = item.signals.to_numpy()
+            if not all(_same_wavelengths(item.signals.wavelengths, wavelengths) for item in signatures[1:]):
+                wavelengths = None
+        else:
+            # signals with different bands (e.g. of several cameras) are aligned on the union of their
+            # columns; bands missing from a block are NaN, as with pandas.concat
+            union = columns[0].append([column.difference(columns[0]) for column in columns[1:]]).unique()
+            values = np.full((total, len(union)), np.nan, dtype=np.result_type(signals_dtype, np.float32))
+            for item, column, start, stop in zip(signatures, columns, offsets[:-1], offsets[1:]):
+                values[start:stop, union.get_indexer(column)] = item.signals.to_numpy()
+            columns = [union]
+            wavelengths = None
+
+        result = cls(
+            Pixels._from_xy(xy),
+            Signals._from_values(
+                values, columns=None if _is_default_index(columns[0]) else columns[0], wavelengths=wavelengths
+            ),
+        )
+        if not return_source_ids:
+            return result
+        return result, np.repeat(np.arange(len(signatures), dtype=np.int32), lengths)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Signatures":
         pixels_df = pd.DataFrame(data["pixels"])
@@ -139,15 +347,19 @@ class Signatures:
 
     @classmethod
     def from_array_and_pixels(
-        cls, array: NDArray[np.floating[Any]], pixels: Pixels | pd.DataFrame | Iterable[CoordinateInput]
+        cls,
+        array: NDArray[np.floating[Any]],
+        pixels: Pixels | pd.DataFrame | Iterable[CoordinateInput],
+        *,
+        float_dtype: DTypeLike | None = np.float32,
     ) -> "Signatures":
         pixels = validate_pixel_input(pixels)
-        if pd.api.types.is_float_dtype(pixels.df.dtypes.x) or pd.api.types.is_float_dtype(pixels.df.dtypes.y):
+        if np.issubdtype(pixels.dtype, np.floating):
             logger.warning("Pixel DataFrame contains float values. Converting to integers.")
             pixels = pixels.as_type(int)
 
-        x = pixels.x()
-        y = pixels.y()
+        x = pixels.x_array
+        y = pixels.y_array
 
         if array.ndim != 3:
             raise InvalidInputError(f"Expected a 3-dimensional array, but got {array.ndim}-dimensional array.")
@@ -157,8 +369,7 @@ class Signatures:
                 f"image shape is {array.shape}, but max u={np.max(x)}, max v={np.max(y)}."
             )
 
-        signals_list = array[y, x, :]
-        signals = Signals(pd.DataFrame(signals_list))
+        signals = Signals.from_numpy(array[y, x, :], float_dtype=float_dtype)
         validate_inputs(pixels, signals)
         return cls(pixels, signals)
 
@@ -235,9 +446,25 @@ class Signatures:
             "signals": self.signals.df.to_dict(),
         }
 
+    def mean(self) -> "Signatures":
+        # like the pandas mean of the signatures frame: float coordinates, NaN for no signatures
+        signals = self.signals.to_numpy()
+        dtype = np.result_type(signals.dtype, np.float32)
+        if len(self):
+            xy = self.pixels.to_numpy().mean(axis=0, dtype=np.float64).reshape(2, 1)
+            values = signals.mean(axis=0, dtype=dtype, keepdims=True)
+        else:
+            xy = np.full((2, 1), np.nan)
+            values = np.full((1, signals.shape[1]), np.nan, dtype=dtype)
+        return Signatures(
+            Pixels._from_xy(xy),
+            Signals._from_values(values, columns=self.signals._columns, wavelengths=self.signals.wavelengths),
+        )
+
     def reset_index(self) -> "Signatures":
         return Signatures(
-            Pixels(self.pixels.df.reset_index(drop=True)), Signals(self.signals.df.reset_index(drop=True))
+            Pixels(self.pixels.df.reset_index(drop=True)),
+            Signals(self.signals.df.reset_index(drop=True), self.signals.wavelengths),
         )
 
     def save_to_parquet(self, filepath: str | Path) -> None:
@@ -246,7 +473,7 @@ class Signatures:
     def copy(self) -> "Signatures":
         pixels_df = self.pixels.df.copy()
         signals_df = self.signals.df.copy()
-        return Signatures(Pixels(pixels_df), Signals(signals_df))
+        return Signatures(Pixels(pixels_df), Signals(signals_df, self.signals.wavelengths))
 
 
 def validate_inputs(pixels: Pixels, signals: Signals) -> None:
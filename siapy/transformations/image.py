@@ -24,48 +24,53 @@ def add_gaussian_noise(
     std: float = 1.0,
     clip_to_max: bool = True,
 ) -> NDArray[np.floating[Any]]:
-    image_np = validate_image_to_numpy(image)
+    image_np = validate_image_to_numpy(image, copy=False)
     rng = np.random.default_rng()
-    noise = rng.normal(loc=mean, scale=std, size=image_np.shape)
-    image_np = image_np + noise
+    # build the result in the noise buffer to avoid temporaries of the image size
+    noisy = rng.standard_normal(size=image_np.shape, dtype=_float_dtype(image_np.dtype))
+    noisy *= std
+    noisy += mean
+    noisy += image_np
     if clip_to_max:
-        image_np = np.clip(image_np, 0, np.max(image_np))
-    return image_np
+        np.clip(noisy, 0, np.max(noisy), out=noisy)
+    return _restore_dtype(noisy, image_np.dtype)
 
 
 def random_crop(image: ImageType, output_size: ImageSizeType) -> NDArray[np.floating[Any]]:
-    image_np = validate_image_to_numpy(image)
+    image_np = validate_image_to_numpy(image, copy=False)
     output_size = validate_image_size(output_size)
     h, w = image_np.shape[:2]
     new_h, new_w = output_size
     top = np.random.randint(0, h - new_h)
     left = np.random.randint(0, w - new_w)
-    return image_np[top : top + new_h, left : left + new_w]
+    # copy only the cropped region, not the whole input
+    return image_np[top : top + new_h, left : left + new_w].copy()
 
 
 def random_mirror(image: ImageType) -> NDArray[np.floating[Any]]:
-    image_np = validate_image_to_numpy(image)
+    image_np = validate_image_to_numpy(image, copy=False)
     axis = random.choices([0, 1, (0, 1), None])[0]
     if isinstance(axis, int) or isinstance(axis, tuple):
         image_np = np.flip(image_np, axis=axis)
-    return image_np
+    return image_np.copy()
 
 
 def random_rotation(image: ImageType, angle: float) -> NDArray[np.floating[Any]]:
-    image_np = validate_image_to_numpy(image)
+    image_np = validate_image_to_numpy(image, copy=False)
     rotated_image = transform.rotate(image_np, angle, preserve_range=True)
-    return rotated_image
+    return _restore_dtype(rotated_image, image_np.dtype)
 
 
 def rescale(image: ImageType, output_size: ImageSizeType) -> NDArray[np.floating[Any]]:
-    image_np = validate_image_to_numpy(image)
+    image_np = validate_image_to_numpy(image, copy=False)
     output_size = validate_image_size(output_size)
     rescaled_image = transform.resize(image_np, output_size, preserve_range=True)
-    return rescaled_image
+    return _restore_dtype(rescaled_image, image_np.dtype)
 
 
 def area_normalization(image: ImageType) -> NDArray[np.floating[Any]]:
-    image_np = validate_image_to_numpy(image)
+    image_np = validate_image_to_numpy(image, copy=False)
+    image_np = image_np.astype(_float_dtype(image_np.dtype), copy=False)
 
     def _signal_normalize(signal: NDArray[np.floating[Any]]) -> NDArray[np.floating[Any]]:
         area = np.trapz(signal)
@@ -79,3 +84,18 @@ def area_normalization(image: ImageType) -> NDArray[np.floating[Any]]:
         return np.apply_along_axis(func1d, axis=2, arr=image_np)
 
     return _image_normalization(image_np, _signal_normalize)
+
+
+def _float_dtype(dtype: np.dtype[Any]) -> np.dtype[Any]:
+    """Get the floating-point type to compute with: the input type itself, or float32 for data up to 16 bits."""
+    if np.issubdtype(dtype, np.floating) and dtype.itemsize >= 4:
+        return dtype
+    return np.dtype(np.float32 if dtype.itemsize <= 2 else np.float64)
+
+
+def _restore_dtype(result: NDArray[Any], dtype: np.dtype[Any]) -> NDArray[Any]:
+    """Convert a result back to the input data type, rounding and clipping integer data to its range."""
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return np.clip(np.rint(result), info.min, info.max).astype(dtype)
+    return result.astype(dtype, copy=False)
@@ -15,13 +15,13 @@ __all__ = [
 ]
 
 
-def validate_image_to_numpy_3channels(image: ImageType) -> NDArray[np.floating[Any]]:
+def validate_image_to_numpy_3channels(image: ImageType, *, copy: bool = True) -> NDArray[np.floating[Any]]:
     if isinstance(image, SpectralImage):
         image_display = np.array(image.to_display())
     elif isinstance(image, Image):
         image_display = np.array(image)
     elif isinstance(image, np.ndarray) and len(image.shape) == 3 and image.shape[-1] == 3:
-        image_display = image.copy()
+        image_display = image.copy() if copy else _read_only_view(image)
     else:
         raise InvalidInputError(
             input_value=image,
@@ -30,21 +30,31 @@ def validate_image_to_numpy_3channels(image: ImageType) -> NDArray[np.floating[A
     return image_display
 
 
-def validate_image_to_numpy(image: ImageType) -> NDArray[np.floating[Any]]:
+def validate_image_to_numpy(image: ImageType, *, copy: bool = True) -> NDArray[np.floating[Any]]:
+    # Arrays are copied by default; functions that only read the image pass copy=False to get a read-only
+    # view instead, so that chained functions do not copy the image one after another
     if isinstance(image, SpectralImage):
-        image_np = image.to_numpy()
+        image_np = image.to_numpy(copy=copy)
     elif isinstance(image, Image):
         image_np = np.array(image)
     elif isinstance(image, np.ndarray):
-        image_np = image.copy()
+        return image.copy() if copy else _read_only_view(image)
     else:
         raise InvalidInputError(
             input_value=image,
             message="Argument image must be convertible to a numpy array.",
         )
+    if not copy:
+        image_np.flags.writeable = False
     return image_np
 
 
+def _read_only_view(array: NDArray[Any]) -> NDArray[Any]:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
 def validate_image_size(output_size: ImageSizeType) -> tuple[int, int]:
     if not isinstance(output_size, (int, tuple)):
         raise InvalidTypeError(
@@ -1,18 +1,24 @@
 import os
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, Iterable, Literal, Sequence
 
 import numpy as np
+import rasterio
+import rasterio.shutil
 import rioxarray  # noqa  # activate the rio accessor
 import spectral as sp
-import xarray as xr
 from numpy.typing import NDArray
+from rasterio.enums import Resampling
+from rasterio.transform import Affine
+from rasterio.windows import Window
 
 from siapy.core import logger
-from siapy.core.exceptions import InvalidInputError
-from siapy.core.types import ImageDataType, ImageType
+from siapy.core.exceptions import InvalidInputError, ProcessingError
+from siapy.core.types import ImageDataType, ImageType, SpectralLibType
 from siapy.entities import SpectralImage
-from siapy.entities.images import RasterioLibImage, SpectralLibImage
+from siapy.entities.images import ChunkedCubeImage, RasterioLibImage, SpectralLibImage
+from siapy.entities.images.chunked import DEFAULT_CUBE_CHUNKS, ChunkStoreType
+from siapy.entities.images.validity import pixel_valid_mask
 from siapy.transformations.image import rescale
 from siapy.utils.image_validators import validate_image_to_numpy
 from siapy.utils.signatures import get_signatures_within_convex_hull
@@ -21,8 +27,11 @@ __all__ = [
     "spy_save_image",
     "spy_create_image",
     "spy_merge_images_by_specter",
+    "EnviWriter",
     "rasterio_save_image",
     "rasterio_create_image",
+    "chunked_save_image",
+    "chunked_create_image",
     "convert_radiance_image_to_reflectance",
     "calculate_correction_factor",
     "calculate_correction_factor_from_panel",
@@ -30,6 +39,12 @@ __all__ = [
     "calculate_image_background_percentage",
 ]
 
+# Upper bound on the size of a single strip written to a raster file.
+_WRITE_CHUNK_BYTES = 64 * 1024**2
+
+# Attributes that describe the array encoding rather than the image, as skipped by rioxarray.
+_SKIPPED_RASTER_TAGS = ("crs", "transform", "scale_factor", "add_offset", "_FillValue", "missing_value", "nodata")
+
 
 def spy_save_image(
     image: Annotated[ImageType, "The image to save."],
@@ -48,7 +63,7 @@ def spy_save_image(
         "The numpy data type with which to store the image.",
     ] = np.float32,
 ) -> None:
-    image_np = validate_image_to_numpy(image)
+    image_np = validate_image_to_numpy(image, copy=False)
     if isinstance(save_path, str):
         save_path = Path(save_path)
     if metadata is None:
@@ -82,27 +97,159 @@ def spy_create_image(
         "The numpy data type with which to store the image.",
     ] = np.float32,
 ) -> SpectralImage[Any]:
-    image_np = validate_image_to_numpy(image)
     if isinstance(save_path, str):
         save_path = Path(save_path)
-    if metadata is None:
-        metadata = {
-            "lines": image_np.shape[0],
-            "samples": image_np.shape[1],
-            "bands": image_np.shape[2],
-        }
-
-    os.makedirs(save_path.parent, exist_ok=True)
-    spectral_image = sp.envi.create_image(
-        hdr_file=save_path,
-        metadata=metadata,
-        dtype=dtype,
-        force=overwrite,
-    )
-    mmap = spectral_image.open_memmap(writable=True)
-    mmap[:, :, :] = image_np
+    # Spectral images are copied strip by strip; other inputs are already in memory
+    shape: tuple[int, ...]
+    if isinstance(image, SpectralImage):
+        shape = image.shape
+    else:
+        image_np = validate_image_to_numpy(image, copy=False)
+        shape = image_np.shape
+
+    with EnviWriter(save_path, shape, metadata=metadata, overwrite=overwrite, dtype=dtype) as writer:
+        if isinstance(image, SpectralImage):
+            writer.write_tiles(image.iter_tiles((_strip_rows(shape[1], shape[2], dtype), shape[1])))
+        else:
+            writer.write_window((slice(None), slice(None)), image_np)
     logger.info(f"Image created as:  {save_path}")
-    return SpectralImage(SpectralLibImage(spectral_image))
+    return SpectralImage(SpectralLibImage(writer.file))
+
+
+class EnviWriter:
+    def __init__(
+        self,
+        save_path: str | Path,
+        shape: tuple[int, ...],
+        *,
+        metadata: dict[str, Any] | None = None,
+        overwrite: bool = True,
+        dtype: type[ImageDataType] = np.float32,
+        interleave: Literal["bip", "bil", "bsq"] | None = None,
+    ):
+        """Streaming writer of ENVI images.
+
+        On entering the context, the image file is pre-allocated with the given shape and data type and
+        memory-mapped for writing. Data is then written window by window, so processing stages can write
+        their output as they go without holding the full output (or input) array in memory.
+
+        Args:
+            save_path: Header file (with '.hdr' extension) name with path.
+            shape: Image shape as (rows, cols, bands).
+            metadata: Optional ENVI header parameters, e.g. extracted from a source image. The shape and
+                data type given as arguments take precedence over the ones in the metadata.
+            overwrite: If the image file or header already exist and set to True, they are overwritten;
+                otherwise an exception is raised.
+            dtype: The numpy data type with which to store the image.
+            interleave: Optional interleave of the image file. If None, the interleave in the metadata is
+                used, or "bip" if there is none.
+
+        Example:
+            ```python
+            with EnviWriter("reflectance.hdr", radiance.shape, metadata=radiance.metadata) as writer:
+                for window, tile in radiance.iter_tiles(512):
+                    writer.write_window(window, tile * correction_factor)
+            reflectance = SpectralImage.spy_open(header_path="reflectance.hdr")
+            ```
+        """
+        self._save_path = Path(save_path)
+        self._shape = tuple(int(size) for size in shape)
+        self._metadata = dict(metadata) if metadata is not None else {}
+        self._overwrite = overwrite
+        self._dtype = dtype
+        self._interleave = interleave
+        self._file: SpectralLibType | None = None
+        self._memmap: np.memmap | None = None
+
+    def __enter__(self) -> "EnviWriter":  # noqa: PYI034
+        self.open()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def file(self) -> SpectralLibType:
+        """Get the SpectralPython file object of the created image."""
+        if self._file is None:
+            raise ProcessingError("The ENVI writer has not been opened.")
+        return self._file
+
+    def open(self) -> None:
+        """Create the image file and header and memory-map the image for writing."""
+        if len(self._shape) != 3:
+            raise InvalidInputError({"shape": self._shape}, "Image shape must be (rows, cols, bands).")
+        os.makedirs(self._save_path.parent, exist_ok=True)
+        kwargs: dict[str, Any] = {"shape": self._shape, "dtype": self._dtype, "force": self._overwrite}
+        if self._interleave is not None:
+            kwargs["interleave"] = self._interleave
+        try:
+            self._file = sp.envi.create_image(hdr_file=self._save_path, metadata=self._metadata, **kwargs)
+        except sp.io.envi.EnviException as e:
+            raise InvalidInputError({"save_path": str(self._save_path)}, f"Failed to create ENVI image: {e}") from e
+        self._memmap = self._file.open_memmap(writable=True)
+
+    def write_window(
+        self,
+        window: tuple[slice, slice],
+        array: NDArray[Any],
+        bands: Sequence[int] | None = None,
+    ) -> None:
+        """Write an array into a rectangular window of the image.
+
+        Args:
+            window: The (rows, cols) slices of the window in image coordinates.
+            array: Array of shape (rows, cols, bands) holding the window data. Values are cast to the
+                data type of the image.
+            bands: Optional 0-based band indices the array holds. If None, the array holds all bands.
+
+        Raises:
+            ProcessingError: If the writer is not open.
+            InvalidInputError: If the array does not match the shape of the window.
+        """
+        if self._memmap is None:
+            raise ProcessingError("The ENVI writer is not open.")
+        rows, cols = window
+        target = self._memmap[rows, cols]
+        expected = (*target.shape[:2], target.shape[2] if bands is None else len(bands))
+        if np.shape(array) != expected:
+            raise InvalidInputError(
+                {"window": window, "array_shape": np.shape(array), "expected_shape": expected},
+                "Array shape does not match the window.",
+            )
+        if bands is None:
+            target[...] = array
+        else:
+            target[:, :, list(bands)] = array
+
+    def write_tiles(self, tiles: Iterable[tuple[tuple[slice, slice], NDArray[Any]]]) -> None:
+        """Write (window, array) tiles as they are produced, e.g. by `SpectralImage.iter_tiles`.
+
+        Args:
+            tiles: Iterable of the (rows, cols) window of each tile and its (rows, cols, bands) array.
+        """
+        for window, array in tiles:
+            self.write_window(window, array)
+
+    def flush(self) -> None:
+        """Flush the written data to disk."""
+        if self._memmap is not None:
+            self._memmap.flush()
+
+    def close(self) -> None:
+        """Flush the written data, release the memory map and close the data file.
+
+        The file object stays usable: `SpectralLibImage` reopens a closed data file on the next read.
+        """
+        self.flush()
+        self._memmap = None
+        if self._file is not None:
+            fid = getattr(self._file, "fid", None)
+            if fid is not None:
+                fid.close()
+            # SpectralPython keeps its own memory map of BSQ, BIL and BIP files
+            if getattr(self._file, "_memmap", None) is not None:
+                self._file._memmap = None
 
 
 def spy_merge_images_by_specter(
@@ -123,8 +270,8 @@ def spy_merge_images_by_specter(
         "Whether to automatically extract metadata images.",
     ] = True,
 ) -> SpectralImage[Any]:
-    image_original_np = validate_image_to_numpy(image_original)
-    image_to_merge_np = validate_image_to_numpy(image_to_merge)
+    image_original_np = validate_image_to_numpy(image_original, copy=False)
+    image_to_merge_np = validate_image_to_numpy(image_to_merge, copy=False)
 
     metadata = {
         "lines": image_original_np.shape[0],
@@ -181,14 +328,31 @@ def rasterio_save_image(
         bool, "If the file exists and set to True, it will be overwritten; otherwise an exception will be raised."
     ] = True,
     dtype: Annotated[type[ImageDataType], "The numpy data type with which to store the image."] = np.float32,
-    **kwargs: Annotated[dict[str, Any], "Additional keyword arguments for rioxarray."],
+    tiled: Annotated[bool, "If True, store the image in square internal tiles instead of strips."] = False,
+    blocksize: Annotated[int, "Size of the internal tiles in pixels; must be a multiple of 16."] = 256,
+    compress: Annotated[str | None, "Compression codec, e.g. 'deflate', 'zstd' or 'lzw'."] = None,
+    predictor: Annotated[
+        int | None, "Compression predictor: 2 (horizontal differencing, integers) or 3 (floating point)."
+    ] = None,
+    num_threads: Annotated[int | str | None, "Number of encoding threads, or 'ALL_CPUS'."] = None,
+    overviews: Annotated[Sequence[int] | None, "Decimation factors of the internal overviews, e.g. (2, 4, 8)."] = None,
+    cog: Annotated[
+        bool,
+        "If True, write a Cloud-Optimized GeoTIFF: tiled, compressed (deflate by default) and with overviews.",
+    ] = False,
+    **kwargs: Annotated[Any, "Additional creation options for rasterio."],
 ) -> None:
-    """Save an image using rioxarray."""
-    image_np = validate_image_to_numpy(image)
+    """Save an image with rasterio, writing it window by window."""
     if isinstance(save_path, str):
         save_path = Path(save_path)
     if metadata is None:
         metadata = {}
+    if predictor not in (None, 1, 2, 3):
+        raise InvalidInputError(input_value={"predictor": predictor}, message="Predictor must be 1, 2 or 3.")
+    if (tiled or cog) and (blocksize <= 0 or blocksize % 16):
+        raise InvalidInputError(
+            input_value={"blocksize": blocksize}, message="Tile blocksize must be a positive multiple of 16."
+        )
 
     os.makedirs(save_path.parent, exist_ok=True)
 
@@ -198,25 +362,98 @@ def rasterio_save_image(
             message=f"File {save_path} already exists and overwrite=False.",
         )
 
-    wavelengths = metadata.get("wavelength", [])
-    if not wavelengths:
-        wavelengths = np.arange(image_np.shape[2])
-
-    xarray = xr.DataArray(
-        data=image_np.transpose(2, 0, 1).astype(dtype),
-        dims=["band", "y", "x"],
-        coords={
-            "y": np.arange(image_np.shape[0]),
-            "x": np.arange(image_np.shape[1]),
-            "band": wavelengths,
-        },
-        attrs=metadata,
-    )
-
-    xarray.rio.to_raster(save_path, **kwargs)
+    # Spectral images are read strip by strip; other inputs are already in memory
+    if isinstance(image, SpectralImage):
+        height, width, bands = image.shape
+    else:
+        image_np = validate_image_to_numpy(image, copy=False)
+        height, width, bands = image_np.shape
+
+    if cog:
+        tiled = True
+        compress = compress or "deflate"
+        if predictor is None:
+            predictor = 3 if np.issubdtype(dtype, np.floating) else 2
+        if overviews is None:
+            overviews = _overview_factors(height, width, blocksize)
+
+    profile: dict[str, Any] = {
+        "driver": "GTiff",
+        "height": height,
+        "width": width,
+        "count": bands,
+        "dtype": np.dtype(dtype).name,
+        # pixel centers at integer coordinates, as written by rioxarray for the default coordinates
+        "transform": Affine(1.0, 0.0, -0.5, 0.0, 1.0, -0.5),
+    }
+    if tiled:
+        profile.update(tiled=True, blockxsize=blocksize, blockysize=blocksize)
+    if compress is not None:
+        profile["compress"] = compress
+    if predictor is not None:
+        profile["predictor"] = predictor
+    if num_threads is not None:
+        profile["num_threads"] = num_threads
+    profile.update(kwargs)
+
+    # tiled strips cover whole rows of tiles
+    strip_rows = _strip_rows(width, bands, dtype)
+    if tiled:
+        strip_rows = max(strip_rows // blocksize, 1) * blocksize
+
+    tags = {key: value for key, value in metadata.items() if key not in _SKIPPED_RASTER_TAGS}
+    target_path = save_path.with_name(f".{save_path.name}.tmp") if cog else save_path
+    try:
+        with rasterio.open(target_path, "w", **profile) as dst:
+            dst.update_tags(**tags)
+            if isinstance(image, SpectralImage):
+                strips: Iterable[tuple[int, NDArray[Any]]] = (
+                    (rows.start, strip) for (rows, _), strip in image.iter_tiles((strip_rows, width))
+                )
+            else:
+                strips = ((row, image_np[row : row + strip_rows]) for row in range(0, height, strip_rows))
+            for row, strip in strips:
+                dst.write(
+                    np.moveaxis(strip, 2, 0).astype(dtype),
+                    window=Window(0, row, width, strip.shape[0]),
+                )
+            if overviews:
+                dst.build_overviews(list(overviews), Resampling.average)
+                dst.update_tags(ns="rio_overview", resampling="average")
+
+        if cog:
+            rasterio.shutil.copy(
+                target_path,
+                save_path,
+                driver="COG",
+                blocksize=blocksize,
+                compress=compress,
+                predictor="FLOATING_POINT" if predictor == 3 else "STANDARD" if predictor == 2 else "NO",
+                num_threads=num_threads if num_threads is not None else "ALL_CPUS",
+                overview_resampling="AVERAGE",
+            )
+    finally:
+        if cog and target_path.exists():
+            target_path.unlink()
     logger.info(f"Image saved with rasterio as: {save_path}")
 
 
+def _strip_rows(width: int, bands: int, dtype: Any) -> int:
+    """Get the number of image rows that fit into the write chunk byte budget."""
+    row_bytes = max(width * bands * np.dtype(dtype).itemsize, 1)
+    return max(_WRITE_CHUNK_BYTES // row_bytes, 1)
+
+
+def _overview_factors(height: int, width: int, blocksize: int) -> list[int]:
+    """Get power-of-two overview factors until the overview fits into a single tile."""
+    factors = []
+    factor = 2
+    while max(height, width) / (factor // 2) > blocksize:
+        factors.append(factor)
+        factor *= 2
+    return factors
+
+
 def rasterio_create_image(
     image: Annotated[ImageType, "The image to use."],
     save_path: Annotated[str | Path, "File name with path."],
@@ -226,10 +463,9 @@ def rasterio_create_image(
         bool, "If the file exists and set to True, it will be overwritten; otherwise an exception will be raised."
     ] = True,
     dtype: Annotated[type[ImageDataType], "The numpy data type with which to store the image."] = np.float32,
-    **kwargs: Annotated[dict[str, Any], "Additional keyword arguments for rioxarray."],
+    **kwargs: Annotated[Any, "Additional keyword arguments for rasterio_save_image."],
 ) -> SpectralImage[Any]:
-    """Create and save an image using rioxarray, then return a SpectralImage object."""
-    image_np = validate_image_to_numpy(image)
+    """Create and save an image with rasterio, streaming spectral images window by window, then return a SpectralImage object."""
     if isinstance(save_path, str):
         save_path = Path(save_path)
 
@@ -238,7 +474,7 @@ def rasterio_create_image(
 
     # Save the image first
     rasterio_save_image(
-        image=image_np,
+        image=image,
         save_path=save_path,
         metadata=metadata,
         overwrite=overwrite,
@@ -249,11 +485,50 @@ def rasterio_create_image(
     return SpectralImage(RasterioLibImage.open(save_path))
 
 
+def chunked_save_image(
+    image: Annotated[ImageType, "The image to convert, e.g. an ENVI or GeoTIFF SpectralImage."],
+    save_path: Annotated[str | Path, "Path of the cube directory."],
+    *,
+    chunks: Annotated[tuple[int, int, int], "The (rows, cols, bands) size of a chunk."] = DEFAULT_CUBE_CHUNKS,
+    store: Annotated[ChunkStoreType, "'zarr', 'zlib' (built-in store) or 'auto' (Zarr if zarr is installed)."] = "auto",
+    overwrite: Annotated[
+        bool, "If the cube exists and set to True, it will be overwritten; otherwise an exception will be raised."
+    ] = True,
+    dtype: Annotated[type[ImageDataType], "The numpy data type with which to store the image."] = np.float32,
+    compression_level: Annotated[int, "The zlib compression level (0-9) of the built-in store."] = 6,
+    max_workers: Annotated[int | None, "Maximum number of threads encoding chunks in parallel."] = None,
+) -> None:
+    """Save an image as a chunked, compressed cube, reading spectral images one row of chunks at a time."""
+    source = image.image if isinstance(image, SpectralImage) else validate_image_to_numpy(image, copy=False)
+    ChunkedCubeImage.create(
+        save_path,
+        source,
+        chunks=chunks,
+        store=store,
+        dtype=dtype,
+        compression_level=compression_level,
+        overwrite=overwrite,
+        max_workers=max_workers,
+    )
+
+
+def chunked_create_image(
+    image: Annotated[ImageType, "The image to convert, e.g. an ENVI or GeoTIFF SpectralImage."],
+    save_path: Annotated[str | Path, "Path of the cube directory."],
+    *,
+    max_workers: Annotated[int | None, "Maximum number of threads encoding and decoding chunks in parallel."] = None,
+    **kwargs: Annotated[Any, "Additional keyword arguments for chunked_save_image."],
+) -> SpectralImage[Any]:
+    """Save an image as a chunked, compressed cube, then return a SpectralImage object."""
+    chunked_save_image(image, save_path, max_workers=max_workers, **kwargs)
+    return SpectralImage.chunked_open(save_path, max_workers=max_workers)
+
+
 def convert_radiance_image_to_reflectance(
     image: ImageType,
     panel_correction: NDArray[np.floating[Any]],
 ) -> NDArray[np.floating[Any]]:
-    image_np = validate_image_to_numpy(image)
+    image_np = validate_image_to_numpy(image, copy=False)
     return image_np * panel_correction
 
 
@@ -293,7 +568,7 @@ def calculate_correction_factor_from_panel(
         panel_radiance_mean = panel_signatures.signals.average_signal()
 
     else:
-        image_np = validate_image_to_numpy(image)
+        image_np = validate_image_to_numpy(image, copy=False)
         temp_mean = image_np.mean(axis=(0, 1))
         if not isinstance(temp_mean, np.ndarray):
             raise InvalidInputError(
@@ -313,39 +588,49 @@ def blockfy_image(
     p: Annotated[int, "block row size"],
     q: Annotated[int, "block column size"],
 ) -> list[NDArray[np.floating[Any]]]:
-    image_np = validate_image_to_numpy(image)
-    # Calculate how many blocks can cover the entire image
-    bpr = (image_np.shape[0] - 1) // p + 1  # blocks per row
-    bpc = (image_np.shape[1] - 1) // q + 1  # blocks per column
-
-    # Pad array with NaNs so it can be divided by p row-wise and by q column-wise
-    image_pad = np.nan * np.ones([p * bpr, q * bpc, image_np.shape[2]])
-    image_pad[: image_np.shape[0], : image_np.shape[1], : image_np.shape[2]] = image_np
+    # Spectral images are read block by block; other inputs are copied once, so the blocks are writable
+    # views of the copy rather than of the caller's array
+    if isinstance(image, SpectralImage):
+        tiles = (tile for _, tile in image.iter_tiles((p, q)))
+    else:
+        image_np = validate_image_to_numpy(image)
+        tiles = (
+            image_np[row : row + p, column : column + q]
+            for row in range(0, image_np.shape[0], p)
+            for column in range(0, image_np.shape[1], q)
+        )
 
+    # Pad edge blocks so that all blocks have p rows and q columns: floating-point blocks with NaNs in
+    # their own data type, integer blocks as masked arrays with the padding masked
     image_slices = []
-    row_prev = 0
-
-    for row_block in range(bpc):
-        row_prev = row_block * p
-        column_prev = 0
-
-        for column_block in range(bpr):
-            column_prev = column_block * q
-            block = image_pad[
-                row_prev : row_prev + p,
-                column_prev : column_prev + q,
-            ]
-
-            if block.shape == (p, q, image_np.shape[2]):
-                image_slices.append(block)
-
+    for tile in tiles:
+        if tile.shape[:2] == (p, q):
+            image_slices.append(tile)
+            continue
+        if np.issubdtype(tile.dtype, np.floating):
+            block = np.full((p, q, tile.shape[2]), np.nan, dtype=tile.dtype)
+        else:
+            block = np.ma.masked_all((p, q, tile.shape[2]), dtype=tile.dtype)
+        block[: tile.shape[0], : tile.shape[1]] = tile
+        image_slices.append(block)
     return image_slices
 
 
 def calculate_image_background_percentage(image: ImageType) -> float:
-    image_np = validate_image_to_numpy(image)
+    if isinstance(image, SpectralImage):
+        # Reuse a stored validity mask if there is one; otherwise count the background strip by strip,
+        # without building or writing a mask
+        mask = image.stored_valid_mask()
+        if mask is not None:
+            return mask.background_percentage
+        height, width, bands = image.shape
+        strip_rows = _strip_rows(width, bands, image.dtype)
+        valid = sum(int(pixel_valid_mask(tile).sum()) for _, tile in image.iter_tiles((strip_rows, width)))
+        size = height * width
+        return (size - valid) / size * 100 if size else 0.0
+    image_np = validate_image_to_numpy(image, copy=False)
     # Check where any of bands include nan values (axis=2) to get positions of background
-    mask_nan = np.any(np.isnan(image_np), axis=2)
+    mask_nan = ~pixel_valid_mask(image_np)
     # Calculate percentage of background
-    percentage = np.sum(mask_nan) / mask_nan.size * 100
+    percentage = float(np.sum(mask_nan) / mask_nan.size * 100)
     return percentage
@@ -28,7 +28,7 @@ __all__ = [
 
 
 def pixels_select_click(image: ImageType) -> Pixels:
-    image_display = validate_image_to_numpy_3channels(image)
+    image_display = validate_image_to_numpy_3channels(image, copy=False)
 
     coordinates = []
     fig, ax = plt.subplots(1, 1)
@@ -73,7 +73,7 @@ def pixels_select_click(image: ImageType) -> Pixels:
 
 
 def pixels_select_lasso(image: ImageType, selector_props: dict[str, Any] | None = None) -> list[Pixels]:
-    image_display = validate_image_to_numpy_3channels(image)
+    image_display = validate_image_to_numpy_3channels(image, copy=False)
 
     x, y = np.meshgrid(np.arange(image_display.shape[1]), np.arange(image_display.shape[0]))
     pixes_all_stack = np.vstack((x.flatten(), y.flatten())).T
@@ -136,7 +136,7 @@ def display_image_with_areas(
     if not isinstance(areas, list):
         areas = [areas]
 
-    image_display = validate_image_to_numpy_3channels(image)
+    image_display = validate_image_to_numpy_3channels(image, copy=False)
     fig, ax = plt.subplots()
     ax.imshow(image_display)
 
@@ -175,7 +175,7 @@ def display_multiple_images_with_areas(
         if not isinstance(selected_areas, list):
             selected_areas = [selected_areas]
 
-        image_display = validate_image_to_numpy_3channels(image)
+        image_display = validate_image_to_numpy_3channels(image, copy=False)
         ax.imshow(image_display)
 
         for pixels in selected_areas:
@@ -243,8 +243,8 @@ def test_tabular_dataset_data_getitem():
     assert isinstance(sliced_data, TabularDatasetData)
 
     # Check signatures (pixels and signals)
-    expected_pixels_df = pd.DataFrame(data["pixels"]).iloc[1:3]
-    expected_signals_df = pd.DataFrame(data["signals"]).iloc[1:3]
+    expected_pixels_df = pd.DataFrame(data["pixels"]).iloc[1:3].astype("int32")
+    expected_signals_df = pd.DataFrame(data["signals"]).astype("float32").iloc[1:3]
     expected_metadata_df = pd.DataFrame(data["metadata"]).iloc[1:3]
 
     pd.testing.assert_frame_equal(sliced_data.signatures.pixels.df, expected_pixels_df)
@@ -434,8 +434,8 @@ def test_tabular_dataset_data_to_dataframe():
     df = tabular_dataset_data.to_dataframe()
     expected_df = pd.concat(
         [
-            pd.DataFrame(data["pixels"]).astype(int),
-            pd.DataFrame(data["signals"]),
+            pd.DataFrame(data["pixels"]).astype("int32"),
+            pd.DataFrame(data["signals"]).astype("float32"),
             pd.DataFrame(data["metadata"]),
             pd.DataFrame({"value": [1, 2, 3], "label": ["a", "b", "c"]}),
         ],
@@ -498,8 +498,8 @@ def test_tabular_dataset_data_reset_index():
     assert isinstance(reset_data, TabularDatasetData)
 
     # Create expected Signatures for comparison
-    expected_pixels_df = pd.DataFrame(data["pixels"]).iloc[1:2].astype(int).reset_index(drop=True)
-    expected_signals_df = pd.DataFrame(data["signals"]).iloc[1:2].reset_index(drop=True)
+    expected_pixels_df = pd.DataFrame(data["pixels"]).iloc[1:2].astype("int32").reset_index(drop=True)
+    expected_signals_df = pd.DataFrame(data["signals"]).astype("float32").iloc[1:2].reset_index(drop=True)
 
     # Test signatures
     pd.testing.assert_frame_equal(reset_data.signatures.pixels.df, expected_pixels_df)
@@ -570,3 +570,47 @@ def test_tabular_dataset_data_copy():
     assert copied_no_target is not original_no_target
     assert copied_no_target.signatures is not original_no_target.signatures
     assert copied_no_target.metadata is not original_no_target.metadata
+
+
+def _dataset_data(xs: list[int], target: ClassificationTarget | RegressionTarget | None) -> TabularDatasetData:
+    pixels = Pixels(pd.DataFrame({"x": xs, "y": [0] * len(xs)}))
+    signals = Signals(pd.DataFrame({"band": [float(x) for x in xs]}))
+    metadata = pd.DataFrame({"meta": xs})
+    return TabularDatasetData(signatures=Signatures(pixels, signals), metadata=metadata, target=target)
+
+
+def test_tabular_dataset_data_concat_regression():
+    first = _dataset_data([1, 2], RegressionTarget(value=pd.Series([0.1, 0.2]), name="y"))
+    second = _dataset_data([3], RegressionTarget(value=pd.Series([0.3]), name="y"))
+
+    concatenated, source_ids = TabularDatasetData.concat([first, second], return_source_ids=True)
+
+    assert len(concatenated) == 3
+    assert list(source_ids) == [0, 0, 1]
+    assert list(concatenated.metadata["meta"]) == [1, 2, 3]
+    assert list(concatenated.signatures.pixels.x_array) == [1, 2, 3]
+    assert isinstance(concatenated.target, RegressionTarget)
+    assert list(concatenated.target.value) == [0.1, 0.2, 0.3]
+    assert concatenated.target.name == "y"
+
+
+def test_tabular_dataset_data_concat_classification():
+    encoding = pd.Series(["a", "b"])
+    first = _dataset_data([1], ClassificationTarget(label=pd.Series(["a"]), value=pd.Series([0]), encoding=encoding))
+    second = _dataset_data([2], ClassificationTarget(label=pd.Series(["b"]), value=pd.Series([1]), encoding=encoding))
+
+    concatenated = TabularDatasetData.concat([first, second])
+
+    assert isinstance(concatenated.target, ClassificationTarget)
+    assert list(concatenated.target.label) == ["a", "b"]
+    assert list(concatenated.target.value) == [0, 1]
+    assert concatenated.target.value.index.equals(pd.RangeIndex(2))
+
+
+def test_tabular_dataset_data_concat_invalid_targets():
+    first = _dataset_data([1], RegressionTarget(value=pd.Series([0.1])))
+    second = _dataset_data([2], None)
+    with pytest.raises(InvalidInputError):
+        TabularDatasetData.concat([first, second])
+    with pytest.raises(InvalidInputError):
+        TabularDatasetData.concat([])
@@ -1,6 +1,11 @@
+import numpy as np
+import pandas as pd
+import spectral as sp
+
 from siapy.datasets.schemas import TabularDatasetData
 from siapy.datasets.tabular import TabularDataEntity, TabularDataset
 from siapy.entities import Shape, SpectralImage, SpectralImageSet
+from siapy.entities.images.validity import valid_mask_path
 
 
 def test_tabular_len(spectral_tabular_dataset):
@@ -60,3 +65,75 @@ def test_tabular_rasterio(configs):
     dataset.process_image_data()
     data = dataset.generate_dataset_data()
     assert isinstance(data, TabularDatasetData)
+
+
+def test_tabular_generate_dataset_drops_nan_pixels():
+    array = np.random.default_rng(0).random((10, 10, 3))
+    array[2:4, :] = np.nan
+    array[6, 5, 1] = np.nan
+    image = SpectralImage.from_numpy(array)
+    image.geometric_shapes.shapes = [Shape.from_rectangle(0, 0, 9, 9, label="plot")]
+    dataset = TabularDataset(image)
+    dataset.process_image_data()
+
+    data = dataset.generate_dataset_data(mean_signatures=False)
+
+    signatures = dataset[0].signatures.to_dataframe()
+    expected = signatures.dropna()
+    assert len(expected) < len(signatures)
+    np.testing.assert_array_equal(data.signatures.signals.to_numpy(), expected.iloc[:, 2:].to_numpy())
+    np.testing.assert_array_equal(data.signatures.pixels.df.to_numpy(), expected.iloc[:, :2].to_numpy())
+
+
+def test_tabular_generate_dataset_mean_signatures_and_metadata():
+    array = np.random.default_rng(0).random((10, 10, 3)).astype(np.float32)
+    image = SpectralImage.from_numpy(array)
+    image.geometric_shapes.shapes = [
+        Shape.from_rectangle(0, 0, 3, 3, label="first"),
+        Shape.from_rectangle(5, 5, 9, 9, label="second"),
+    ]
+    dataset = TabularDataset(image)
+    dataset.process_image_data()
+
+    data = dataset.generate_dataset_data(mean_signatures=True)
+    full = dataset.generate_dataset_data(mean_signatures=False)
+
+    assert len(data) == 2
+    assert list(data.metadata["shape_label"]) == ["first", "second"]
+    for idx in range(2):
+        expected = dataset[idx].signatures.to_dataframe().mean()
+        np.testing.assert_allclose(data.signatures.signals.to_numpy()[idx], expected.iloc[2:], rtol=1e-6)
+        np.testing.assert_allclose(data.signatures.pixels.to_numpy()[idx], expected.iloc[:2])
+    assert len(full) == len(full.metadata) == sum(len(entity.signatures) for entity in dataset)
+    assert full.metadata.index.equals(pd.RangeIndex(len(full)))
+    assert list(full.metadata["shape_label"].unique()) == ["first", "second"]
+
+
+def test_tabular_generate_dataset_does_not_build_valid_mask(tmp_path, mocker):
+    array = np.random.default_rng(0).random((10, 10, 3)).astype(np.float32)
+    array[2:4, :] = np.nan
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, metadata={"wavelength": [450.0, 550.0, 650.0]})
+    image = SpectralImage.spy_open(header_path=header_path)
+    image.geometric_shapes.shapes = [
+        Shape.from_rectangle(0, 0, 9, 9, label="plot"),
+        Shape.from_rectangle(0, 0, 4, 4, label="corner"),
+    ]
+    dataset = TabularDataset(image)
+    dataset.process_image_data()
+    spy_valid_mask = mocker.spy(SpectralImage, "valid_mask")
+    spy_stored_valid_mask = mocker.spy(SpectralImage, "stored_valid_mask")
+
+    data = dataset.generate_dataset_data(mean_signatures=False)
+
+    spy_valid_mask.assert_not_called()
+    assert spy_stored_valid_mask.call_count == 1
+    assert not valid_mask_path(image.filepath).exists()
+    assert len(data) == 95
+    assert not np.isnan(data.signatures.signals.to_numpy()).any()
+
+    # a stored mask gives the same selection
+    image.valid_mask()
+    assert valid_mask_path(image.filepath).exists()
+    with_mask = dataset.generate_dataset_data(mean_signatures=False)
+    np.testing.assert_array_equal(with_mask.signatures.signals.to_numpy(), data.signatures.signals.to_numpy())
@@ -0,0 +1,151 @@
+import os
+
+import numpy as np
+import pytest
+import spectral as sp
+
+from siapy.core.exceptions import InvalidInputError
+from siapy.entities import SpectralImage
+from siapy.entities.images.cache import (
+    ArrayCache,
+    array_cache_key,
+    disable_array_cache,
+    enable_array_cache,
+    get_array_cache,
+)
+
+
+@pytest.fixture
+def array_cache():
+    cache = enable_array_cache(max_bytes=10 * 1024**2)
+    cache.clear()
+    yield cache
+    disable_array_cache()
+
+
+@pytest.fixture
+def header_path(tmp_path):
+    array = np.random.default_rng(0).random((20, 15, 6)).astype(np.float32)
+    array[3, 4, 2] = np.nan
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array)
+    return header_path
+
+
+def test_array_cache_lru_eviction():
+    cache = ArrayCache(max_bytes=200)
+    cache.put(("a",), np.zeros(10))
+    cache.put(("b",), np.zeros(10))
+    assert cache.get(("a",)) is not None
+    cache.put(("c",), np.zeros(10))
+
+    assert ("b",) not in cache
+    assert ("a",) in cache and ("c",) in cache
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (1, 0, 1, 2)
+    assert stats.current_bytes == 160
+    assert cache.get(("b",)) is None
+    assert cache.stats().hit_rate == 0.5
+
+
+def test_array_cache_stores_read_only():
+    cache = ArrayCache(max_bytes=100)
+    stored = cache.put(("a",), np.zeros(5))
+    assert not stored.flags.writeable
+    too_large = cache.put(("b",), np.zeros(50))
+    assert ("b",) not in cache
+    assert too_large.shape == (50,)
+    with pytest.raises(InvalidInputError):
+        ArrayCache(max_bytes=0)
+
+
+def test_array_cache_key(header_path, tmp_path):
+    key = array_cache_key(header_path, [1, 2], (slice(0, 5), slice(None)), (20, 15))
+    assert key[3] == (1, 2)
+    assert key[4] == ((0, 5, 1), (0, 15, 1))
+    assert array_cache_key(tmp_path / "missing.img") is None
+    assert array_cache_key(tmp_path) is None
+    with pytest.raises(InvalidInputError):
+        array_cache_key(header_path, window=(slice(0, 5), slice(None)))
+
+
+def test_cache_disabled_by_default():
+    disable_array_cache()
+    assert get_array_cache() is None
+
+
+def test_spectral_image_cache_shared_across_instances(array_cache, header_path, mocker):
+    first = SpectralImage.spy_open(header_path=header_path)
+    second = SpectralImage.spy_open(header_path=header_path)
+    expected = first.image.to_numpy()
+
+    assert np.array_equal(first.to_numpy(), expected, equal_nan=True)
+    spy = mocker.spy(second.image, "to_numpy")
+    result = second.to_numpy()
+
+    assert np.array_equal(result, expected, equal_nan=True)
+    assert result.flags.writeable
+    assert not second.to_numpy(copy=False).flags.writeable
+    assert second.to_numpy(nan_value=0.0)[3, 4, 2] == 0.0
+    spy.assert_not_called()
+    stats = array_cache.stats()
+    assert (stats.misses, stats.hits) == (1, 3)
+
+
+def test_spectral_image_cache_keys_bands_and_windows(array_cache, header_path):
+    image = SpectralImage.spy_open(header_path=header_path)
+    expected = image.image.to_numpy()
+
+    assert np.array_equal(image.to_numpy(bands=[4, 1]), expected[:, :, [4, 1]])
+    assert np.array_equal(image.read_window(slice(2, 8), slice(0, 5)), expected[2:8, 0:5], equal_nan=True)
+    assert np.array_equal(image.read_window(slice(2, 8), slice(None, 5)), expected[2:8, 0:5], equal_nan=True)
+    # to_signatures reuses a cached bounding window but does not cache one itself
+    signatures = image.to_signatures([(1, 2), (4, 7)])
+    subarray = image.to_subarray([(1, 2), (4, 7)])
+    cached_signatures = image.to_signatures([(4, 7), (1, 2)])
+
+    assert np.array_equal(signatures.signals.to_numpy(), expected[[2, 7], [1, 4]])
+    assert np.array_equal(cached_signatures.signals.to_numpy(), expected[[7, 2], [4, 1]])
+    assert np.array_equal(subarray[0, 0], expected[2, 1])
+    stats = array_cache.stats()
+    assert (stats.misses, stats.hits, stats.entries) == (4, 2, 3)
+
+
+def test_spectral_image_cache_invalidated_on_rewrite(array_cache, header_path):
+    image = SpectralImage.spy_open(header_path=header_path)
+    image.to_numpy()
+    stat = image.filepath.stat()
+    sp.envi.save_image(header_path, np.ones((20, 15, 6), dtype=np.float32), force=True)
+    os.utime(image.filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reopened = SpectralImage.spy_open(header_path=header_path)
+
+    assert np.array_equal(reopened.to_numpy(), np.ones((20, 15, 6)))
+    assert array_cache.invalidate(image.filepath) == 2
+
+
+def test_mock_image_not_cached(array_cache):
+    image = SpectralImage.from_numpy(np.zeros((4, 4, 2)))
+    image.to_numpy()
+    assert array_cache.stats().entries == 0
+
+
+def test_spectral_image_cache_keeps_nan_handling(header_path):
+    image = SpectralImage.spy_open(header_path=header_path)
+    uncached = image.to_numpy(nan_value=0.0)
+    uncached_bands = image.to_numpy(nan_value=0.0, bands=[2, 5])
+
+    enable_array_cache(max_bytes=10 * 1024**2)
+    try:
+        image.to_numpy()
+        image.to_numpy(bands=[2, 5])
+        cached = image.to_numpy(nan_value=0.0)
+        cached_bands = image.to_numpy(nan_value=0.0, bands=[2, 5])
+        assert get_array_cache().stats().hits == 2
+    finally:
+        disable_array_cache()
+
+    # the whole pixel is blanked, as in the uncached ENVI read
+    assert np.array_equal(uncached[3, 4], np.zeros(6))
+    assert np.array_equal(cached, uncached)
+    assert np.array_equal(cached_bands, uncached_bands)
+    assert np.isnan(image.to_numpy()[3, 4, 2])
@@ -0,0 +1,107 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+import spectral as sp
+
+from siapy.core.exceptions import InvalidInputError
+from siapy.entities.images import LazyImage, RasterioLibImage, SpectralLibImage
+from siapy.entities.images.catalog import (
+    CATALOG_COLUMNS,
+    catalog_entry,
+    catalog_entry_is_stale,
+    lazy_image_from_entry,
+    read_catalog,
+    wavelengths_signature,
+    write_catalog,
+)
+from siapy.entities.images.mock import MockImage
+from siapy.utils.images import rasterio_save_image
+
+
+@pytest.fixture
+def envi_image(tmp_path):
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(
+        header_path,
+        np.ones((4, 5, 3), dtype=np.uint16),
+        interleave="bil",
+        metadata={
+            "description": "ID=cam0",
+            "wavelength": [450.0, 550.0, 650.0],
+            "map info": ["UTM", 1, 1, 1000.0, 2000.0, 0.5, 0.5, 33, "North"],
+        },
+    )
+    return SpectralLibImage.open(header_path=header_path)
+
+
+def test_catalog_entry(envi_image):
+    entry = catalog_entry(envi_image)
+
+    assert set(entry) == set(CATALOG_COLUMNS)
+    assert entry["backend"] == "spectral"
+    assert (entry["rows"], entry["cols"], entry["bands"]) == (4, 5, 3)
+    assert np.dtype(entry["dtype"]) == np.uint16
+    assert entry["interleave"] == "bil"
+    assert entry["camera_id"] == "cam0"
+    assert entry["wavelengths_hash"] == wavelengths_signature([450, 550, 650])
+    assert entry["footprint"] == [1000.0, 1998.0, 1002.5, 2000.0]
+    with pytest.raises(InvalidInputError):
+        catalog_entry(MockImage(np.zeros((2, 2, 1))))
+
+
+def test_catalog_entry_raster(tmp_path):
+    filepath = tmp_path / "raster.tif"
+    rasterio_save_image(np.zeros((3, 2, 2), dtype=np.float32), filepath)
+
+    entry = catalog_entry(RasterioLibImage.open(filepath))
+
+    assert entry["backend"] == "rasterio"
+    assert entry["header_path"] is None
+    assert (entry["rows"], entry["cols"], entry["bands"]) == (3, 2, 2)
+
+
+def test_write_and_read_catalog(tmp_path, envi_image):
+    entry = catalog_entry(envi_image)
+
+    path = write_catalog([entry], tmp_path / "catalog" / "images.parquet")
+    (loaded,) = read_catalog(path)
+
+    assert loaded["filepath"] == entry["filepath"]
+    assert loaded["header_mtime_ns"] == entry["header_mtime_ns"]
+    assert list(loaded["wavelengths"]) == [450.0, 550.0, 650.0]
+    assert not catalog_entry_is_stale(loaded)
+
+
+def test_read_catalog_invalid(tmp_path):
+    path = tmp_path / "other.parquet"
+    pd.DataFrame({"filepath": ["image.img"]}).to_parquet(path)
+
+    with pytest.raises(InvalidInputError):
+        read_catalog(path)
+
+
+def test_catalog_entry_is_stale(envi_image):
+    entry = catalog_entry(envi_image)
+    stat = envi_image.filepath.stat()
+
+    os.utime(envi_image.filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert catalog_entry_is_stale(entry)
+    assert catalog_entry_is_stale({**entry, "filepath": "missing.img"})
+
+
+def test_lazy_image_from_entry(envi_image):
+    image = lazy_image_from_entry(catalog_entry(envi_image))
+
+    assert isinstance(image, LazyImage)
+    assert image.shape == (4, 5, 3)
+    assert image.bands == 3
+    assert image.dtype == np.uint16
+    assert image.wavelengths == [450.0, 550.0, 650.0]
+    assert image.camera_id == "cam0"
+    assert image.filepath == envi_image.filepath.absolute()
+    assert not image.loaded
+    np.testing.assert_array_equal(image.to_numpy(), envi_image.to_numpy())
+    assert image.loaded
@@ -0,0 +1,176 @@
+import numpy as np
+import pytest
+import spectral as sp
+from PIL import Image
+
+from siapy.core.exceptions import InvalidFilepathError, InvalidInputError
+from siapy.entities import SpectralImage
+from siapy.entities.images import chunked
+from siapy.entities.images.chunked import ChunkedCubeImage
+from siapy.entities.images.mock import MockImage
+from siapy.entities.images.spectral_lib import SpectralLibImage
+
+STORES = ["zlib", pytest.param("zarr", marks=pytest.mark.skipif(chunked.zarr is None, reason="zarr not installed"))]
+
+
+@pytest.fixture
+def array():
+    array = np.random.default_rng(0).random((45, 37, 11)).astype(np.float32)
+    array[:8, :8] = np.nan
+    return array
+
+
+@pytest.fixture(params=STORES)
+def cube(request, tmp_path, array):
+    return ChunkedCubeImage.create(tmp_path / "image.cube", array, chunks=(16, 10, 4), store=request.param)
+
+
+def test_create_and_open(cube, array):
+    opened = ChunkedCubeImage.open(cube.filepath)
+
+    assert opened.store_format == cube.store_format
+    assert opened.shape == (45, 37, 11)
+    assert opened.bands == 11
+    assert opened.chunks == (16, 10, 4)
+    assert opened.dtype == np.float32
+    assert opened.default_bands == [0, 1, 2]
+    assert opened.wavelengths == list(map(float, range(11)))
+    assert opened.camera_id == ""
+    assert opened.stored_bytes > 0
+    np.testing.assert_array_equal(opened.to_numpy(), array)
+    np.testing.assert_array_equal(opened.to_numpy(nan_value=0.0), np.nan_to_num(array))
+
+
+@pytest.mark.parametrize("max_workers", [1, None])
+@pytest.mark.parametrize(
+    ("rows", "cols", "bands"),
+    [
+        (slice(3, 40), slice(5, 30), None),
+        (slice(None, None, 4), slice(None, None, 3), [0, 5, 10]),
+        (slice(40, 2, -3), slice(None), [7, 2, 2]),
+        (slice(20, 20), slice(None), None),
+    ],
+)
+def test_read_window(cube, array, rows, cols, bands, max_workers):
+    cube = ChunkedCubeImage.open(cube.filepath, max_workers=max_workers)
+    expected = array[rows, cols] if bands is None else array[rows, cols][:, :, bands]
+
+    np.testing.assert_array_equal(cube.read_window(rows, cols, bands), expected)
+
+
+def test_read_window_decodes_touched_chunks(cube, mocker):
+    read_chunk = mocker.spy(cube._store, "read_chunk")
+
+    cube.read_window(slice(0, 10), slice(12, 18), bands=[5])
+
+    read_chunk.assert_called_once_with((0, 1, 1))
+
+
+def test_read_pixels(cube, array, mocker):
+    rng = np.random.default_rng(1)
+    rows = rng.integers(0, 45, 50)
+    cols = rng.integers(0, 37, 50)
+    read_chunk = mocker.spy(cube._store, "read_chunk")
+
+    np.testing.assert_array_equal(cube.read_pixels(rows, cols, bands=[1, 9]), array[rows, cols][:, [1, 9]])
+    assert read_chunk.call_count <= 3 * 4 * 2
+    with pytest.raises(InvalidInputError):
+        cube.read_pixels([0, 45], [0, 0])
+
+
+def test_to_xarray_is_lazy(cube, array, mocker):
+    read_chunk = mocker.spy(cube._store, "read_chunk")
+
+    xarray = cube.to_xarray()
+
+    read_chunk.assert_not_called()
+    assert xarray.dims == ("y", "x", "band")
+    assert xarray.data.chunks[0] == (16, 16, 13)
+    np.testing.assert_array_equal(xarray.values, array)
+
+
+def test_to_display(cube):
+    assert isinstance(cube.to_display(), Image.Image)
+
+
+def test_create_from_envi(tmp_path):
+    array = np.random.default_rng(0).random((20, 25, 6)).astype(np.float32)
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(
+        header_path,
+        array,
+        metadata={"wavelength": [500, 510, 520, 530, 540, 550], "default bands": [4, 2, 0], "description": "ID = cam"},
+    )
+    source = SpectralLibImage.open(header_path=header_path)
+
+    cube = ChunkedCubeImage.create(tmp_path / "image.cube", source, chunks=(8, 8, 8), store="zlib", dtype=np.float64)
+
+    assert cube.wavelengths == [500.0, 510.0, 520.0, 530.0, 540.0, 550.0]
+    assert cube.default_bands == [4, 2, 0]
+    assert cube.camera_id == "cam"
+    assert cube.metadata["description"] == "ID = cam"
+    assert cube.dtype == np.float64
+    np.testing.assert_array_equal(cube.to_numpy(), array)
+
+
+def test_zlib_store_skips_empty_chunks(tmp_path):
+    array = np.full((20, 20, 2), np.nan, dtype=np.float32)
+    array[:10, :10] = 1.0
+
+    cube = ChunkedCubeImage.create(tmp_path / "image.cube", array, chunks=(10, 10, 2), store="zlib")
+
+    assert [path.name for path in (tmp_path / "image.cube" / "c").iterdir()] == ["0.0.0"]
+    np.testing.assert_array_equal(cube.to_numpy(), array)
+
+
+def test_zlib_store_integer_data(tmp_path):
+    array = np.arange(6 * 5 * 3, dtype=np.uint16).reshape(6, 5, 3)
+
+    cube = ChunkedCubeImage.create(tmp_path / "image.cube", MockImage(array), store="zlib", dtype=np.uint16)
+
+    assert cube.chunks == (6, 5, 3)
+    np.testing.assert_array_equal(cube.to_numpy(), array)
+
+
+def test_create_invalid(tmp_path, array):
+    path = tmp_path / "image.cube"
+    with pytest.raises(InvalidInputError):
+        ChunkedCubeImage.create(path, array, chunks=(0, 4, 4))
+    with pytest.raises(InvalidInputError):
+        ChunkedCubeImage.create(path, array, store="hdf5")
+    with pytest.raises(InvalidInputError):
+        ChunkedCubeImage.create(path, array[0])
+
+    ChunkedCubeImage.create(path, array, store="zlib")
+    with pytest.raises(InvalidInputError):
+        ChunkedCubeImage.create(path, array, store="zlib", overwrite=False)
+
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "keep.txt").write_text("not a cube")
+    with pytest.raises(InvalidInputError):
+        ChunkedCubeImage.create(other, array)
+    assert (other / "keep.txt").exists()
+
+
+def test_open_invalid(tmp_path):
+    with pytest.raises(InvalidFilepathError):
+        ChunkedCubeImage.open(tmp_path / "missing.cube")
+    with pytest.raises(InvalidInputError):
+        ChunkedCubeImage.open(tmp_path)
+
+
+def test_zarr_requested_without_zarr(tmp_path, array, mocker):
+    mocker.patch.object(chunked, "zarr", None)
+
+    with pytest.raises(InvalidInputError):
+        ChunkedCubeImage.create(tmp_path / "image.cube", array, store="zarr")
+    cube = ChunkedCubeImage.create(tmp_path / "image.cube", array)
+    assert cube.store_format == "zlib"
+
+
+def test_spectral_image_chunked_open(cube, array):
+    image = SpectralImage.chunked_open(cube.filepath, max_workers=2)
+
+    assert isinstance(image.image, ChunkedCubeImage)
+    np.testing.assert_array_equal(image.to_numpy(), array)
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from siapy.core.exceptions import InvalidInputError
+from siapy.entities.images.gather import gather_pixels, plan_pixel_gather
+from siapy.entities.images.mock import MockImage
+
+SHAPE = (30, 20, 6)
+ITEMSIZE = 4
+# Chunk budget covering three full image lines
+SMALL_CHUNK = SHAPE[1] * SHAPE[2] * ITEMSIZE * 3
+
+
+@pytest.fixture(scope="module")
+def array():
+    return np.random.default_rng(0).random(SHAPE).astype(np.float32)
+
+
+def test_plan_pixel_gather_sorts_and_deduplicates():
+    rows = np.array([7, 2, 7, 0, 2])
+    cols = np.array([1, 5, 1, 9, 3])
+
+    gather = plan_pixel_gather(rows, cols, shape=SHAPE, itemsize=ITEMSIZE)
+
+    assert list(zip(gather.rows, gather.cols)) == [(0, 9), (2, 3), (2, 5), (7, 1)]
+    assert np.array_equal(gather.rows[gather.inverse], rows)
+    assert np.array_equal(gather.cols[gather.inverse], cols)
+
+
+def test_plan_pixel_gather_strips():
+    rows = np.array([0, 1, 1, 2, 3, 4, 8, 9, 29])
+    cols = np.zeros_like(rows)
+
+    gather = plan_pixel_gather(rows, cols, shape=SHAPE, itemsize=ITEMSIZE, chunk_bytes=SMALL_CHUNK)
+
+    # strips break at skipped lines and after three lines
+    strip_rows = [gather.rows[strip].tolist() for strip in gather.strips]
+    assert strip_rows == [[0, 1, 2], [3, 4], [8, 9], [29]]
+
+
+def test_plan_pixel_gather_empty():
+    gather = plan_pixel_gather([], [], shape=SHAPE, itemsize=ITEMSIZE)
+
+    assert gather.strips == ()
+    assert gather.scatter(np.empty((0, 6))).shape == (0, 6)
+
+
+def test_plan_pixel_gather_invalid():
+    with pytest.raises(InvalidInputError):
+        plan_pixel_gather([0, 1], [0], shape=SHAPE, itemsize=ITEMSIZE)
+    with pytest.raises(InvalidInputError):
+        plan_pixel_gather([30], [0], shape=SHAPE, itemsize=ITEMSIZE)
+    with pytest.raises(InvalidInputError):
+        plan_pixel_gather([0], [-1], shape=SHAPE, itemsize=ITEMSIZE)
+
+
+def test_gather_pixels(array, mocker):
+    image = MockImage.open(array)
+    spy = mocker.spy(image, "read_window")
+    rng = np.random.default_rng(1)
+    rows = rng.integers(0, 10, 200)
+    cols = rng.integers(0, SHAPE[1], 200)
+    rows[:5] = 25
+
+    spectra = gather_pixels(image, rows, cols, chunk_bytes=SMALL_CHUNK)
+
+    np.testing.assert_array_equal(spectra, array[rows, cols])
+    assert spectra.dtype == array.dtype
+    # lines 10-24 and 26-29 are never read
+    read_rows = {row for call in spy.call_args_list for row in range(*call.args[0].indices(SHAPE[0]))}
+    assert read_rows == set(range(10)) | {25}
+    np.testing.assert_array_equal(gather_pixels(image, rows, cols, bands=[4, 0]), array[rows, cols][:, [4, 0]])
+
+
+def test_gather_pixels_empty(array):
+    image = MockImage.open(array)
+
+    assert gather_pixels(image, [], []).shape == (0, SHAPE[2])
+    assert gather_pixels(image, [], [], bands=[1]).shape == (0, 1)
@@ -0,0 +1,163 @@
+import threading
+
+import numpy as np
+import pytest
+import spectral as sp
+import xarray as xr
+
+from siapy.core.exceptions import InvalidInputError
+from siapy.entities import SpectralImage, SpectralImageSet
+from siapy.entities.images import handles
+from siapy.entities.images.handles import (
+    DEFAULT_MAX_OPEN_FILES,
+    HandlePool,
+    disable_handle_pool,
+    enable_handle_pool,
+    get_handle_pool,
+    pooled_handle,
+)
+
+
+class FakeFile:
+    def __init__(self):
+        self.closed = False
+        self.reopened = 0
+
+    def close(self):
+        self.closed = True
+
+    def reopen(self):
+        self.closed = False
+        self.reopened += 1
+
+
+@pytest.fixture
+def handle_pool():
+    file_cache_maxsize = xr.get_options()["file_cache_maxsize"]
+    pool = enable_handle_pool(max_open=3)
+    yield pool
+    disable_handle_pool()
+    xr.set_options(file_cache_maxsize=file_cache_maxsize)
+
+
+@pytest.fixture
+def header_paths(tmp_path):
+    header_paths = []
+    for idx in range(6):
+        header_path = tmp_path / f"image_{idx}.hdr"
+        sp.envi.save_image(
+            header_path, np.full((4, 3, 3), idx + 1, dtype=np.float32), metadata={"default bands": [0, 1, 2]}
+        )
+        header_paths.append(header_path)
+    return header_paths
+
+
+def test_handle_pool_lru_eviction():
+    pool = HandlePool(max_open=2)
+    files = [FakeFile() for _ in range(3)]
+
+    pool.add(files[0])
+    pool.add(files[1])
+    pool.acquire(files[0])
+    pool.release(files[0])
+    pool.add(files[2])
+
+    assert [file.closed for file in files] == [False, True, False]
+    pool.acquire(files[1])
+    pool.release(files[1])
+    assert files[1].reopened == 1
+    assert files[0].closed
+    stats = pool.stats()
+    assert (stats.open_handles, stats.hits, stats.reopens, stats.evictions) == (2, 1, 1, 2)
+    with pytest.raises(InvalidInputError):
+        HandlePool(max_open=0)
+
+
+def test_handle_pool_keeps_pinned_handles_open():
+    pool = HandlePool(max_open=1)
+    files = [FakeFile() for _ in range(2)]
+
+    pool.acquire(files[0])
+    pool.add(files[1])
+
+    assert not files[0].closed
+    assert files[1].closed
+    assert pool.stats().pinned == 1
+    pool.acquire(files[1])
+    assert not files[1].closed
+    assert len(pool) == 2
+    pool.release(files[0])
+    pool.release(files[1])
+    assert files[0].closed
+    assert len(pool) == 1
+
+
+def test_handle_pool_forgets_collected_images():
+    pool = HandlePool(max_open=2)
+    pool.add(FakeFile())
+
+    assert len(pool) == 0
+    assert pool.close_all() == 0
+
+
+def test_enable_and_disable_handle_pool(handle_pool):
+    assert get_handle_pool() is handle_pool
+    assert enable_handle_pool(max_open=3) is handle_pool
+    assert xr.get_options()["file_cache_maxsize"] == 3
+
+    disable_handle_pool()
+    file = FakeFile()
+    file.close()
+    with pooled_handle(file):
+        assert not file.closed
+    assert get_handle_pool() is None
+
+
+def test_spectral_lib_images_reopen_after_eviction(handle_pool, header_paths):
+    image_set = SpectralImageSet.spy_open(header_paths=header_paths)
+
+    assert sum(not image.image.closed for image in image_set) == 3
+    for idx, image in enumerate(image_set):
+        np.testing.assert_array_equal(image.to_numpy(), np.full((4, 3, 3), idx + 1, dtype=np.float32))
+        assert image.read_window(slice(1, 2), slice(0, 2)).shape == (1, 2, 3)
+    assert image_set[0].image.closed
+    assert image_set[0].to_display() is not None
+    stats = handle_pool.stats()
+    assert stats.open_handles == 3
+    assert stats.reopens >= 6
+    assert stats.evictions >= 6
+
+
+def test_spectral_lib_concurrent_reads(handle_pool, header_paths):
+    images = [SpectralImage.spy_open(header_path=header_path) for header_path in header_paths]
+    errors = []
+
+    def read(image, idx):
+        try:
+            for _ in range(20):
+                assert image.to_numpy()[0, 0, 0] == idx + 1
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=read, args=(image, idx)) for idx, image in enumerate(images)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert handles.get_handle_pool().stats().pinned == 0
+
+
+def test_enable_handle_pool_default_limit(handle_pool):
+    disable_handle_pool()
+    assert enable_handle_pool().max_open == DEFAULT_MAX_OPEN_FILES
+
+
+def test_spectral_lib_file_reopens_after_eviction(handle_pool, header_paths):
+    images = [SpectralImage.spy_open(header_path=header_path) for header_path in header_paths]
+
+    assert images[0].image.closed
+    assert images[0].image.file.read_band(0)[0, 0] == 1
+    assert not images[0].image.closed
+    assert handle_pool.stats().open_handles == 3
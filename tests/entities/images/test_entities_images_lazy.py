@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+import pytest
+import spectral as sp
+
+from siapy.core.exceptions import InvalidFilepathError
+from siapy.entities import SpectralImage
+from siapy.entities.images import LazyImage
+from siapy.entities.images.mock import MockImage
+from siapy.entities.images.spectral_lib import SpectralLibImage
+
+
+@pytest.fixture
+def header_path(tmp_path):
+    array = np.random.default_rng(0).random((12, 9, 4)).astype(np.float32)
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, metadata={"wavelength": [500, 600, 700, 800]})
+    return header_path
+
+
+def test_lazy_image_opens_on_first_use(header_path, mocker):
+    opener = mocker.Mock(side_effect=partial(SpectralLibImage.open, header_path=header_path))
+    image = LazyImage.open(opener, filepath=header_path.with_suffix(".img"))
+
+    assert image.filepath == header_path.with_suffix(".img")
+    assert not image.loaded
+    opener.assert_not_called()
+
+    assert image.shape == (12, 9, 4)
+    assert image.wavelengths == [500.0, 600.0, 700.0, 800.0]
+    assert image.loaded
+    np.testing.assert_array_equal(
+        image.read_window(slice(2, 5), slice(1, 3), [1]), image.image.to_numpy()[2:5, 1:3, [1]]
+    )
+    assert image.as_memmap().shape == (12, 9, 4)
+    opener.assert_called_once()
+
+
+def test_lazy_image_filepath_from_backend(header_path):
+    image = LazyImage(partial(SpectralLibImage.open, header_path=header_path))
+
+    assert image.filepath == header_path.with_suffix(".img")
+    assert image.loaded
+
+
+def test_lazy_image_concurrent_first_use(mocker):
+    opener = mocker.Mock(return_value=MockImage(np.zeros((3, 4, 2), dtype=np.float32)))
+    image = LazyImage(opener)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        shapes = list(executor.map(lambda _: image.shape, range(32)))
+
+    assert shapes == [(3, 4, 2)] * 32
+    opener.assert_called_once()
+
+
+def test_lazy_image_open_error_is_retried(tmp_path):
+    header_path = tmp_path / "missing.hdr"
+    image = SpectralImage(LazyImage(partial(SpectralLibImage.open, header_path=header_path)))
+
+    with pytest.raises(InvalidFilepathError):
+        image.to_numpy()
+    assert not image.image.loaded
+    with pytest.raises(InvalidFilepathError):
+        _ = image.shape
@@ -4,6 +4,7 @@ from PIL import Image
 
 from siapy.core.exceptions import InvalidInputError
 from siapy.core.types import XarrayType
+from siapy.entities.images.interfaces import ImageBase
 from siapy.entities.images.mock import MockImage
 
 
@@ -110,3 +111,56 @@ def test_to_xarray():
     np.testing.assert_array_equal(result.coords["band"].values, mock_img.wavelengths)
     np.testing.assert_array_equal(result.coords["x"].values, np.arange(mock_img.shape[1]))
     np.testing.assert_array_equal(result.coords["y"].values, np.arange(mock_img.shape[0]))
+
+
+def test_read_window():
+    test_array = np.random.rand(50, 60, 4).astype(np.float32)
+    mock_img = MockImage(array=test_array)
+
+    region = mock_img.read_window(slice(5, 15), slice(10, 30))
+    assert region.shape == (10, 20, 4)
+    assert np.array_equal(region, test_array[5:15, 10:30])
+
+    region_bands = mock_img.read_window(slice(5, 15), slice(10, 30), bands=[3, 0])
+    assert np.array_equal(region_bands, test_array[5:15, 10:30][:, :, [3, 0]])
+
+
+def test_to_numpy_copy_false():
+    test_array = np.random.rand(50, 60, 3).astype(np.float32)
+    mock_img = MockImage(array=test_array)
+
+    view = mock_img.to_numpy(copy=False)
+    assert np.shares_memory(view, mock_img._array)
+    assert not view.flags.writeable
+    assert not np.shares_memory(mock_img.to_numpy(), mock_img._array)
+
+
+def test_to_numpy_bands():
+    test_array = np.random.rand(50, 60, 4).astype(np.float32)
+    test_array[1, 1, 2] = np.nan
+    mock_img = MockImage(array=test_array)
+
+    assert np.array_equal(mock_img.to_numpy(bands=[2, 0]), test_array[:, :, [2, 0]], equal_nan=True)
+    assert mock_img.to_numpy(nan_value=-1.0, bands=[2])[1, 1, 0] == -1.0
+    assert np.isnan(test_array[1, 1, 2])
+
+
+def test_render_display_matches_to_display():
+    array = np.random.default_rng(0).random((10, 10, 2)).astype(np.float32)
+    mock = MockImage.open(array)
+
+    assert mock.display_bands == [0, 0, 0]
+    rendered = mock.render_display(array[:, :, mock.display_bands])
+    assert np.array_equal(np.array(rendered), np.array(mock.to_display()))
+
+
+def test_image_base_default_dtype_reads_once(mocker):
+    class DefaultDtypeImage(MockImage):
+        dtype = ImageBase.dtype
+
+    image = DefaultDtypeImage(np.ones((4, 3, 2), dtype=np.uint16))
+    read_window = mocker.spy(image, "read_window")
+
+    assert image.dtype == np.uint16
+    assert image.dtype == np.uint16
+    read_window.assert_called_once_with(slice(0, 1), slice(0, 1), [0])
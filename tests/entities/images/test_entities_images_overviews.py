@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+import pytest
+import spectral as sp
+
+from siapy.core.exceptions import InvalidInputError
+from siapy.entities.images.mock import MockImage
+from siapy.entities.images.overviews import (
+    build_overviews,
+    load_overviews,
+    overviews_path,
+    save_overviews,
+)
+from siapy.entities.images.spectral_lib import SpectralLibImage
+
+
+@pytest.fixture
+def envi_image(tmp_path):
+    array = np.random.default_rng(0).random((40, 30, 5)).astype(np.float32)
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, metadata={"default bands": [3, 1, 0]})
+    return SpectralLibImage.open(header_path=header_path), array
+
+
+def test_build_overviews():
+    array = np.random.default_rng(0).random((40, 30, 5)).astype(np.float32)
+    image = MockImage.open(array)
+
+    overviews = build_overviews(image, factors=(2, 4, 8, 3))
+
+    assert overviews.shape == (40, 30)
+    assert overviews.bands == (0, 1, 2)
+    assert sorted(overviews.levels) == [2, 3, 4, 8]
+    for factor, level in overviews.levels.items():
+        np.testing.assert_array_equal(level, array[::factor, ::factor, :3])
+    assert overviews.select(15) == 2
+    assert overviews.select(5) == 8
+    assert overviews.select(100) is None
+    with pytest.raises(InvalidInputError):
+        build_overviews(image, factors=(1, 2))
+
+
+def test_save_and_load_overviews(envi_image):
+    image, array = envi_image
+
+    overviews = build_overviews(image)
+    path = save_overviews(overviews, image)
+    loaded = load_overviews(image)
+
+    assert path == image.filepath.with_name(image.filepath.name + ".overviews.npz")
+    assert loaded.bands == (3, 1, 0)
+    assert loaded.shape == (40, 30)
+    np.testing.assert_array_equal(loaded.levels[4], array[::4, ::4, [3, 1, 0]])
+
+
+def test_load_overviews_stale(envi_image):
+    image, _ = envi_image
+    save_overviews(build_overviews(image), image)
+    stat = image.filepath.stat()
+
+    os.utime(image.filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert load_overviews(image) is None
+
+
+def test_overviews_cache_dir(envi_image, tmp_path):
+    image, _ = envi_image
+    cache_dir = tmp_path / "cache"
+
+    path = save_overviews(build_overviews(image), image, cache_dir)
+
+    assert path == overviews_path(image.filepath, cache_dir)
+    assert path.parent == cache_dir
+    assert load_overviews(image, cache_dir) is not None
+    assert load_overviews(image) is None
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from siapy.core.exceptions import InvalidInputError
+from siapy.entities.images.planner import (
+    execute_read_plan,
+    plan_bands_read,
+    plan_pixels_read,
+    plan_tile_read,
+)
+
+SHAPE = (30, 20, 6)
+ITEMSIZE = 4
+# Chunk budget covering three full image lines
+SMALL_CHUNK = SHAPE[1] * SHAPE[2] * ITEMSIZE * 3
+
+
+@pytest.fixture(scope="module")
+def array():
+    return np.random.default_rng(0).random(SHAPE).astype(np.float32)
+
+
+def _layout_view(array, interleave):
+    """Build a (rows, cols, bands) view whose memory layout matches the interleave."""
+    if interleave == "bsq":
+        return np.ascontiguousarray(array.transpose(2, 0, 1)).transpose(1, 2, 0)
+    if interleave == "bil":
+        return np.ascontiguousarray(array.transpose(0, 2, 1)).transpose(0, 2, 1)
+    return np.ascontiguousarray(array)
+
+
+@pytest.mark.parametrize("interleave", ["bsq", "bil", "bip"])
+@pytest.mark.parametrize("chunk_bytes", [SMALL_CHUNK, 2**20])
+def test_pixels_plan(array, interleave, chunk_bytes):
+    rng = np.random.default_rng(1)
+    rows = rng.integers(0, SHAPE[0], 100)
+    cols = rng.integers(0, SHAPE[1], 100)
+    plan = plan_pixels_read(
+        rows, cols, [4, 1, 2], shape=SHAPE, interleave=interleave, itemsize=ITEMSIZE, chunk_bytes=chunk_bytes
+    )
+
+    sorted_linear = (rows * SHAPE[1] + cols)[plan.order]
+    assert np.all(np.diff(sorted_linear) >= 0)
+    assert plan.outer_axis == ("band" if interleave == "bsq" else "row")
+    result = execute_read_plan(_layout_view(array, interleave), plan)
+    assert np.array_equal(result, array[rows, cols][:, [4, 1, 2]])
+
+
+def test_pixels_plan_chunks_cover_bounded_rows():
+    rows = np.array([29, 0, 1, 2, 3, 10, 11, 28])
+    cols = np.zeros_like(rows)
+    plan = plan_pixels_read(
+        rows, cols, range(6), shape=SHAPE, interleave="bil", itemsize=ITEMSIZE, chunk_bytes=SMALL_CHUNK
+    )
+    chunk_rows = [rows[plan.order][chunk].tolist() for chunk in plan.chunks]
+    assert chunk_rows == [[0, 1, 2], [3], [10, 11], [28, 29]]
+
+
+@pytest.mark.parametrize("interleave", ["bsq", "bil", "bip"])
+@pytest.mark.parametrize("chunk_bytes", [SMALL_CHUNK, 2**20])
+@pytest.mark.parametrize(
+    ("rows", "cols"),
+    [
+        (slice(None), slice(None)),
+        (slice(2, 25, 3), slice(1, None, 2)),
+        (slice(7, 8), slice(0, 3)),
+        (slice(None, None, -1), slice(None, None, -2)),
+        (slice(25, 2, -4), slice(3, 10)),
+        (slice(4, 4, -1), slice(None)),
+    ],
+)
+def test_tile_plan(array, interleave, chunk_bytes, rows, cols):
+    plan = plan_tile_read(
+        rows, cols, [0, 5], shape=SHAPE, interleave=interleave, itemsize=ITEMSIZE, chunk_bytes=chunk_bytes
+    )
+    result = execute_read_plan(_layout_view(array, interleave), plan)
+    assert np.array_equal(result, array[rows, cols][:, :, [0, 5]])
+
+
+@pytest.mark.parametrize("interleave", ["bsq", "bil", "bip"])
+def test_bands_plan(array, interleave):
+    plan = plan_bands_read([3, 1], shape=SHAPE, interleave=interleave, itemsize=ITEMSIZE, chunk_bytes=SMALL_CHUNK)
+    assert plan.access == "bands"
+    assert len(plan.chunks) == (2 if interleave == "bsq" else 10)
+    assert np.array_equal(execute_read_plan(_layout_view(array, interleave), plan), array[:, :, [3, 1]])
+
+
+def test_describe():
+    plan = plan_pixels_read([1, 2], [3, 4], range(6), shape=SHAPE, interleave="bsq", itemsize=ITEMSIZE)
+    assert plan.describe() == "pixels read on bsq file: 2 pixels x 6 bands, band-outer in 6 chunks"
+    plan = plan_tile_read(slice(0, 10), slice(None), [0], shape=SHAPE, interleave="bip", itemsize=ITEMSIZE)
+    assert plan.describe() == "tile read on bip file: rows [0:10], cols [:] x 1 bands, row-outer in 1 chunks"
+
+
+def test_invalid_inputs():
+    with pytest.raises(InvalidInputError):
+        plan_pixels_read([1, 2], [3], [0], shape=SHAPE, interleave="bsq", itemsize=ITEMSIZE)
+    with pytest.raises(InvalidInputError):
+        plan_bands_read([0], shape=SHAPE, interleave="xyz", itemsize=ITEMSIZE)  # type: ignore[arg-type]
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import dask.array as da
 import numpy as np
 import pytest
 from PIL import Image
@@ -7,6 +8,7 @@ from PIL import Image
 from siapy.core.exceptions import InvalidFilepathError
 from siapy.core.types import XarrayType
 from siapy.entities.images.rasterio_lib import RasterioLibImage
+from siapy.utils.images import rasterio_save_image
 
 
 def test_open_valid(configs):
@@ -82,3 +84,47 @@ def test_to_numpy_with_nan_handling(configs):
 def test_to_xarray(configs):
     raster = RasterioLibImage.open(configs.image_micasense_merged)
     assert isinstance(raster.to_xarray(), XarrayType)
+
+
+def test_read_window(tmp_path):
+    array = np.random.default_rng(0).random((20, 15, 4)).astype(np.float32)
+    filepath = tmp_path / "image.tif"
+    rasterio_save_image(array, filepath)
+    raster = RasterioLibImage.open(filepath)
+
+    np.testing.assert_array_equal(raster.read_window(slice(2, 9), slice(3, 12)), array[2:9, 3:12])
+    np.testing.assert_array_equal(
+        raster.read_window(slice(None, None, 4), slice(1, None, 3), bands=[1, 3]), array[::4, 1::3][:, :, [1, 3]]
+    )
+
+
+def test_to_numpy_bands(tmp_path):
+    array = np.random.default_rng(0).random((20, 15, 4)).astype(np.float32)
+    filepath = tmp_path / "image.tif"
+    rasterio_save_image(array, filepath)
+    raster = RasterioLibImage.open(filepath)
+
+    np.testing.assert_array_equal(raster.to_numpy(bands=[3, 0]), array[:, :, [3, 0]])
+
+
+def test_open_chunks(tmp_path):
+    array = np.random.default_rng(0).random((20, 15, 4)).astype(np.float32)
+    filepath = tmp_path / "image.tif"
+    rasterio_save_image(array, filepath)
+    raster = RasterioLibImage.open(filepath, chunks={"y": 8})
+
+    assert isinstance(raster.to_xarray().data, da.Array)
+    assert raster.to_xarray().chunks[1] == (8, 8, 4)
+    np.testing.assert_array_equal(raster.to_numpy(), array)
+    np.testing.assert_array_equal(raster.read_window(slice(5, 10), slice(2, 4)), array[5:10, 2:4])
+
+
+def test_render_display_matches_to_display(tmp_path):
+    array = np.random.default_rng(0).random((20, 15, 4)).astype(np.float32)
+    filepath = tmp_path / "image.tif"
+    rasterio_save_image(array, filepath)
+    raster = RasterioLibImage.open(filepath)
+
+    assert raster.display_bands == [0, 1, 2]
+    rendered = raster.render_display(raster.read_window(slice(None), slice(None), raster.display_bands))
+    assert np.array_equal(np.array(rendered), np.array(raster.to_display()))
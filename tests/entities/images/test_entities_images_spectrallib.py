@@ -1,11 +1,13 @@
 from pathlib import Path
 
+import dask.array as da
 import numpy as np
 import pytest
 import spectral as sp
 from PIL import Image
 
 from siapy.core.exceptions import InvalidFilepathError, InvalidInputError
+from siapy.entities.images import spectral_lib
 from siapy.entities.images.spectral_lib import SpectralLibImage, _parse_description
 
 
@@ -183,3 +185,174 @@ def test_parse_description_invalid_format_raises_value_error():
     description = "This is not a valid format"
     with pytest.raises(InvalidInputError):
         _parse_description(description)
+
+
+@pytest.mark.parametrize("interleave", ["bsq", "bil", "bip"])
+def test_read_window(tmp_path, interleave):
+    array = np.random.default_rng(0).random((20, 15, 6)).astype(np.float32)
+    header_path = tmp_path / f"image_{interleave}.hdr"
+    sp.envi.save_image(header_path, array, interleave=interleave)
+    image = SpectralLibImage.open(header_path=header_path)
+
+    assert np.array_equal(image.read_window(slice(2, 9), slice(3, 12)), array[2:9, 3:12])
+    assert np.array_equal(image.read_window(slice(2, 9), slice(3, 12), bands=[1, 4]), array[2:9, 3:12][:, :, [1, 4]])
+    assert np.array_equal(
+        image.read_window(slice(None, None, 4), slice(1, None, 3), bands=[0]), array[::4, 1::3][:, :, [0]]
+    )
+
+
+def test_to_numpy_copy_false_returns_read_only_memmap(tmp_path):
+    array = np.random.default_rng(0).random((20, 15, 6)).astype(np.float32)
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, interleave="bil")
+    image = SpectralLibImage.open(header_path=header_path)
+
+    view = image.to_numpy(copy=False)
+    assert isinstance(view, np.memmap)
+    assert not view.flags.writeable
+    assert view is image.as_memmap()
+    assert np.array_equal(view, array)
+
+    copied = image.to_numpy()
+    assert not isinstance(copied, np.memmap)
+    assert copied.flags.writeable
+    assert np.array_equal(copied, array)
+
+
+@pytest.mark.parametrize("interleave", ["bsq", "bil", "bip"])
+def test_reads_fall_back_when_file_cannot_be_memory_mapped(tmp_path, mocker, interleave):
+    array = np.random.default_rng(0).random((20, 15, 6)).astype(np.float32)
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, interleave=interleave)
+    image = SpectralLibImage.open(header_path=header_path)
+    open_memmap = mocker.patch.object(image.file, "_open_memmap", return_value=None)
+
+    assert np.array_equal(image.to_numpy(), array)
+    assert np.array_equal(image.to_numpy(bands=[4, 1]), array[:, :, [4, 1]])
+    assert np.array_equal(image.read_window(slice(2, 9), slice(3, 12)), array[2:9, 3:12])
+    with pytest.raises(InvalidInputError, match="cannot be memory mapped"):
+        image.as_memmap()
+    assert open_memmap.call_count == 1
+
+
+def test_to_numpy_nan_value_applied_per_chunk(tmp_path, mocker):
+    array = np.random.default_rng(0).random((20, 15, 6)).astype(np.float32)
+    array[3, 4, 2] = np.nan
+    array[17, 1, :] = np.nan
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array)
+    image = SpectralLibImage.open(header_path=header_path)
+    mocker.patch("siapy.entities.images.spectral_lib._CHUNK_BYTES", 15 * 6 * 4 * 4)
+
+    result = image.to_numpy(nan_value=-1.0, copy=False)
+
+    expected = array.copy()
+    expected[3, 4, :] = -1.0
+    expected[17, 1, :] = -1.0
+    assert not isinstance(result, np.memmap)
+    assert np.array_equal(result, expected)
+    assert np.isnan(image.as_memmap()[3, 4, 2])
+
+
+@pytest.mark.parametrize("interleave", ["bsq", "bil", "bip"])
+def test_to_numpy_bands(tmp_path, interleave):
+    array = np.random.default_rng(0).random((20, 15, 6)).astype(np.float32)
+    array[2, 3, 4] = np.nan
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, interleave=interleave)
+    image = SpectralLibImage.open(header_path=header_path)
+
+    assert np.array_equal(image.to_numpy(bands=[4, 1]), array[:, :, [4, 1]], equal_nan=True)
+    result = image.to_numpy(nan_value=0.0, bands=[1, 4])
+    assert np.array_equal(result[2, 3], [0.0, 0.0])
+
+
+@pytest.mark.parametrize("interleave", ["bsq", "bil", "bip"])
+def test_read_pixels(tmp_path, interleave):
+    array = np.random.default_rng(0).random((20, 15, 6)).astype(np.float32)
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, interleave=interleave)
+    image = SpectralLibImage.open(header_path=header_path)
+    rows = np.array([19, 0, 5, 5, 12, 0])
+    cols = np.array([3, 14, 0, 7, 7, 14])
+
+    assert image.interleave == interleave
+    assert np.array_equal(image.read_pixels(rows, cols), array[rows, cols])
+    assert np.array_equal(image.read_pixels(rows, cols, bands=[5, 0]), array[rows, cols][:, [5, 0]])
+
+
+def test_plan_read(tmp_path):
+    array = np.zeros((20, 15, 6), dtype=np.float32)
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, interleave="bsq")
+    image = SpectralLibImage.open(header_path=header_path)
+
+    plan = image.plan_read("pixels", rows=[3, 1], cols=[2, 2], bands=[0, 1])
+    assert plan.outer_axis == "band"
+    assert plan.order.tolist() == [1, 0]
+    assert image.plan_read("tile", rows=slice(0, 5), cols=slice(0, 5)).bands == tuple(range(6))
+    assert image.plan_read("bands", bands=[2]).access == "bands"
+    with pytest.raises(InvalidInputError):
+        image.plan_read("pixels")
+
+
+def test_to_xarray_chunks(tmp_path):
+    array = np.random.default_rng(0).random((20, 15, 6)).astype(np.float32)
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, interleave="bsq", metadata={"wavelength": list(range(400, 406))})
+    image = SpectralLibImage.open(header_path=header_path, chunks={"y": 8})
+
+    xarray = image.to_xarray()
+
+    assert image.chunks == {"y": 8}
+    assert isinstance(xarray.data, da.Array)
+    assert xarray.data.chunks == ((8, 8, 4), (15,), (6,))
+    assert np.allclose(xarray.mean(dim=["y", "x"]).values, array.mean(axis=(0, 1)))
+    assert np.array_equal(xarray.values, array)
+    with pytest.raises(InvalidInputError):
+        SpectralLibImage.open(header_path=header_path, chunks={"z": 8}).to_xarray()
+
+
+def test_to_xarray_eager_by_default(tmp_path):
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, np.zeros((4, 3, 2), dtype=np.float32), metadata={"wavelength": [400, 500]})
+    image = SpectralLibImage.open(header_path=header_path)
+
+    assert image.chunks is None
+    assert isinstance(image.to_xarray().data, np.ndarray)
+
+
+def test_parsed_metadata_is_cached(tmp_path, mocker):
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(
+        header_path,
+        np.zeros((4, 3, 3), dtype=np.float32),
+        metadata={"wavelength": [700, 500, 600], "description": "ID = cam\nExposure = 10"},
+    )
+    image = SpectralLibImage.open(header_path=header_path)
+    parse = mocker.spy(spectral_lib, "_parse_description")
+
+    assert image.camera_id == "cam"
+    assert image.description == {"ID": "cam", "Exposure": 10}
+    image.description["ID"] = "changed"
+    assert image.camera_id == "cam"
+    assert parse.call_count == 1
+
+    wavelengths = image.wavelengths_array
+    assert wavelengths is image.wavelengths_array
+    assert wavelengths.dtype == np.float64
+    assert not wavelengths.flags.writeable
+    assert image.wavelengths == [700.0, 500.0, 600.0]
+    np.testing.assert_array_equal(image.nearest_bands([480, 560, 549, 1000]), [1, 2, 1, 0])
+
+    reopened = SpectralLibImage.open(header_path=header_path)
+    assert reopened.wavelengths_array is not wavelengths
+
+
+def test_description_missing(tmp_path):
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, np.zeros((4, 3, 2), dtype=np.float32), metadata={"wavelength": [400, 500]})
+    image = SpectralLibImage.open(header_path=header_path)
+
+    assert image.description == {}
+    assert image.camera_id == ""
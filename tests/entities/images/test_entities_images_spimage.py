@@ -2,11 +2,15 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+import spectral as sp
 import xarray as xr
 from PIL import Image
 
-from siapy.core.exceptions import InvalidFilepathError
+from siapy.core.exceptions import InvalidFilepathError, InvalidInputError
 from siapy.entities import Pixels, SpectralImage
+from siapy.entities.images import spimage as spimage_module
+from siapy.entities.images.interfaces import nearest_band_indices
+from siapy.utils.images import rasterio_save_image
 from siapy.utils.plots import pixels_select_lasso
 
 
@@ -230,3 +234,296 @@ def test_average_intensity(spectral_images):
     assert isinstance(mean_axis_tuple, np.ndarray)
     assert mean_axis_tuple.shape == (spectral_image_vnir.to_numpy().shape[2],)
     assert np.allclose(mean_axis_tuple, np.nanmean(spectral_image_vnir.to_numpy(), axis=(0, 1)))
+
+
+def test_read_window():
+    array = np.random.default_rng(0).random((30, 20, 4), dtype=np.float32)
+    spectral_image = SpectralImage.from_numpy(array)
+    assert np.array_equal(spectral_image.read_window(slice(3, 8), slice(2, 10), bands=[1]), array[3:8, 2:10][:, :, [1]])
+
+
+def test_to_signatures_reads_only_needed_lines(mocker):
+    array = np.random.default_rng(0).random((30, 20, 4), dtype=np.float32)
+    spectral_image = SpectralImage.from_numpy(array)
+    spy_read_window = mocker.spy(spectral_image.image, "read_window")
+    spy_to_numpy = mocker.spy(spectral_image.image, "to_numpy")
+
+    iterable = [(1, 2), (3, 4), (5, 6), (3, 4), (9, 3)]
+    signatures = spectral_image.to_signatures(iterable)
+
+    assert spy_read_window.call_args_list == [
+        mocker.call(slice(2, 5), slice(1, 10), None),
+        mocker.call(slice(6, 7), slice(5, 6), None),
+    ]
+    spy_to_numpy.assert_not_called()
+    assert np.array_equal(signatures.signals.to_numpy(), array[[2, 4, 6, 4, 3], [1, 3, 5, 3, 9]])
+    assert np.array_equal(signatures.pixels.to_numpy(), np.array(iterable))
+
+
+def test_to_signatures_keeps_dtype_and_wavelengths():
+    array = np.random.default_rng(0).random((6, 5, 3), dtype=np.float32)
+    spectral_image = SpectralImage.from_numpy(array)
+
+    signals = spectral_image.to_signatures([(1, 2), (3, 4)]).signals
+
+    assert signals.dtype == np.float32
+    assert signals.to_numpy().flags.c_contiguous
+    np.testing.assert_array_equal(signals.wavelengths, spectral_image.wavelengths_array)
+
+
+def test_to_subarray_reads_bounding_window(mocker):
+    array = np.random.default_rng(0).random((30, 20, 4), dtype=np.float32)
+    spectral_image = SpectralImage.from_numpy(array)
+    spy_to_numpy = mocker.spy(spectral_image.image, "to_numpy")
+
+    subarray = spectral_image.to_subarray([(1, 2), (3, 4), (2, 4)])
+
+    spy_to_numpy.assert_not_called()
+    expected_subarray = np.full((3, 3, 4), np.nan)
+    expected_subarray[0, 0, :] = array[2, 1, :]
+    expected_subarray[2, 2, :] = array[4, 3, :]
+    expected_subarray[2, 1, :] = array[4, 2, :]
+    assert np.array_equal(subarray, expected_subarray, equal_nan=True)
+
+
+def test_to_signatures_out_of_bounds():
+    spectral_image = SpectralImage.from_numpy(np.zeros((10, 10, 2), dtype=np.float32))
+    with pytest.raises(InvalidInputError):
+        spectral_image.to_signatures([(1, 2), (10, 3)])
+    with pytest.raises(InvalidInputError):
+        spectral_image.to_subarray([(-1, 2)])
+
+
+def test_array_interface_copy_semantics():
+    array = np.random.default_rng(0).random((30, 20, 4), dtype=np.float32)
+    spectral_image = SpectralImage.from_numpy(array)
+
+    view = spectral_image.__array__(copy=None)
+    assert not view.flags.writeable
+    copied = spectral_image.__array__(copy=True)
+    assert copied.flags.writeable
+    assert not np.shares_memory(view, copied)
+
+
+def test_to_numpy_band_selection(mocker):
+    array = np.random.default_rng(0).random((10, 12, 6), dtype=np.float32)
+    spectral_image = SpectralImage.from_numpy(array)
+    spy_to_numpy = mocker.spy(spectral_image.image, "to_numpy")
+
+    assert np.array_equal(spectral_image.to_numpy(bands=[5, 1]), array[:, :, [5, 1]])
+    spy_to_numpy.assert_called_with(None, copy=True, bands=[5, 1])
+
+    # mock wavelengths are band numbers 0..5
+    assert np.array_equal(spectral_image.to_numpy(wavelength_range=(1.5, 4)), array[:, :, [2, 3, 4]])
+
+    exclude_mask = np.array([True, False, False, True, False, False])
+    assert np.array_equal(spectral_image.to_numpy(exclude=exclude_mask), array[:, :, [1, 2, 4, 5]])
+    assert np.array_equal(
+        spectral_image.to_numpy(wavelength_range=(1, 5), exclude=[3, 5]),
+        array[:, :, [1, 2, 4]],
+    )
+
+    spectral_image.to_numpy(exclude=np.zeros(6, dtype=bool))
+    spy_to_numpy.assert_called_with(None, copy=True, bands=None)
+
+
+def test_to_numpy_band_selection_invalid():
+    spectral_image = SpectralImage.from_numpy(np.zeros((4, 4, 3), dtype=np.float32))
+    with pytest.raises(InvalidInputError):
+        spectral_image.to_numpy(bands=[3])
+    with pytest.raises(InvalidInputError):
+        spectral_image.to_numpy(wavelength_range=(10, 20))
+    with pytest.raises(InvalidInputError):
+        spectral_image.to_numpy(exclude=[True, False])
+
+
+def test_open_chunks(tmp_path):
+    array = np.random.default_rng(0).random((10, 8, 3)).astype(np.float32)
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, metadata={"wavelength": [400, 500, 600]})
+    filepath = tmp_path / "image.tif"
+    rasterio_save_image(array, filepath)
+
+    spy_image = SpectralImage.spy_open(header_path=header_path, chunks=4)
+    rasterio_image = SpectralImage.rasterio_open(filepath, chunks=4)
+
+    assert spy_image.to_xarray().chunks == ((4, 4, 2), (4, 4), (3,))
+    assert rasterio_image.to_xarray().chunks == ((3,), (4, 4, 2), (4, 4))
+
+
+def test_band_statistics(mocker):
+    array = np.random.default_rng(0).random((25, 10, 4)).astype(np.float32)
+    array[3, 4, 1] = np.nan
+    image = SpectralImage.from_numpy(array)
+    spy = mocker.spy(image.image, "read_window")
+
+    stats = image.band_statistics(exclude=[0], tile_shape=(10, 4))
+
+    assert spy.call_count == 9
+    flat = array.reshape(-1, 4)[:, 1:].astype(np.float64)
+    assert stats.bands == 3
+    assert stats.nan_count.tolist() == [1, 0, 0]
+    np.testing.assert_allclose(stats.mean, np.nanmean(flat, axis=0))
+    np.testing.assert_allclose(stats.variance, np.nanvar(flat, axis=0))
+    with pytest.raises(InvalidInputError):
+        image.band_statistics(tile_shape=(0, 4))
+
+
+def test_to_display_max_size(tmp_path, mocker):
+    array = np.random.default_rng(0).random((80, 40, 4)).astype(np.float32)
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array, metadata={"default bands": [2, 1, 0]})
+    image = SpectralImage.spy_open(header_path=header_path)
+
+    thumbnail = image.to_display(max_size=20)
+
+    assert thumbnail.size == (10, 20)
+    assert Path(str(image.filepath) + ".overviews.npz").is_file()
+    build = mocker.spy(spimage_module, "build_overviews")
+    reopened = SpectralImage.spy_open(header_path=header_path)
+    assert reopened.to_display(max_size=30).size == (15, 30)
+    assert reopened.to_display(max_size=100).size == (40, 80)
+    build.assert_not_called()
+
+
+def test_to_display_max_size_in_memory():
+    image = SpectralImage.from_numpy(np.random.default_rng(0).random((64, 64, 3)))
+
+    assert image.to_display(max_size=16).size == (16, 16)
+    assert image.overviews().levels[4].shape == (16, 16, 3)
+
+
+def test_iter_tiles(mocker):
+    array = np.random.default_rng(0).random((10, 7, 3)).astype(np.float32)
+    image = SpectralImage.from_numpy(array)
+    spy = mocker.spy(image.image, "read_window")
+
+    tiles = image.iter_tiles((4, 5), bands=[2, 0])
+
+    assert spy.call_count == 0
+    tiles = list(tiles)
+    assert spy.call_count == 6
+    assert [window for window, _ in tiles][:3] == [
+        (slice(0, 4), slice(0, 5)),
+        (slice(0, 4), slice(5, 7)),
+        (slice(4, 8), slice(0, 5)),
+    ]
+    for (rows, cols), tile in tiles:
+        np.testing.assert_array_equal(tile, array[rows, cols][:, :, [2, 0]])
+
+
+def test_iter_tiles_overlap_and_drop_partial():
+    image = SpectralImage.from_numpy(np.zeros((10, 6, 1)))
+
+    windows = [window for window, _ in image.iter_tiles(4, overlap=(1, 2))]
+    full_windows = [window for window, _ in image.iter_tiles(4, drop_partial=True)]
+
+    assert [rows for rows, _ in windows[::2]] == [slice(0, 4), slice(3, 7), slice(6, 10)]
+    assert [cols for _, cols in windows[:2]] == [slice(0, 4), slice(2, 6)]
+    assert full_windows == [(slice(0, 4), slice(0, 4)), (slice(4, 8), slice(0, 4))]
+
+
+def test_valid_mask(tmp_path, mocker):
+    array = np.random.default_rng(0).random((30, 20, 3)).astype(np.float32)
+    array[:10] = np.nan
+    array[15, 4, 1] = np.nan
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array)
+    image = SpectralImage.spy_open(header_path=header_path)
+
+    mask = image.valid_mask()
+
+    np.testing.assert_array_equal(mask.to_numpy(), ~np.isnan(array).any(axis=2))
+    assert image.valid_mask() is mask
+    assert image.with_dtype_policy("float64").valid_mask() is mask
+    assert Path(str(image.filepath) + ".valid.npz").is_file()
+    build = mocker.spy(spimage_module, "build_valid_mask")
+    reopened = SpectralImage.spy_open(header_path=header_path)
+    np.testing.assert_array_equal(reopened.valid_mask().packed, mask.packed)
+    build.assert_not_called()
+    reopened.valid_mask(rebuild=True)
+    build.assert_called_once()
+
+
+def test_iter_tiles_skip_empty(mocker):
+    array = np.random.default_rng(0).random((12, 8, 2))
+    array[:8, :4] = np.nan
+    image = SpectralImage.from_numpy(array)
+    read_window = mocker.spy(image.image, "read_window")
+
+    windows = [window for window, _ in image.iter_tiles(4, skip_empty=True)]
+
+    assert windows == [
+        (slice(0, 4), slice(4, 8)),
+        (slice(4, 8), slice(4, 8)),
+        (slice(8, 12), slice(0, 4)),
+        (slice(8, 12), slice(4, 8)),
+    ]
+    # one strip read to build the mask, then only the non-empty tiles
+    assert read_window.call_count == 1 + 4
+
+
+@pytest.mark.parametrize("tile_shape, overlap", [(0, 0), ((4, 4), 4), ((4, 4), -1), ((4, 4, 4), 0)])
+def test_iter_tiles_invalid(tile_shape, overlap):
+    image = SpectralImage.from_numpy(np.zeros((10, 6, 1)))
+    with pytest.raises(InvalidInputError):
+        image.iter_tiles(tile_shape, overlap=overlap)
+
+
+def test_nearest_bands():
+    image = SpectralImage.from_numpy(np.zeros((2, 2, 5), dtype=np.float32))
+
+    assert not image.wavelengths_array.flags.writeable
+    np.testing.assert_array_equal(image.nearest_bands([-3, 0.5, 1.6, 2.4, 10]), [0, 0, 2, 2, 4])
+    assert image.nearest_bands(3.2) == 3
+    np.testing.assert_array_equal(image.to_numpy(wavelength_range=(1, 2)).shape, (2, 2, 2))
+
+
+def test_nearest_band_indices():
+    np.testing.assert_array_equal(nearest_band_indices(np.array([500.0]), [100, 900]), [0, 0])
+    np.testing.assert_array_equal(nearest_band_indices(np.array([900.0, 400.0, 650.0]), [[420, 800]]), [[1, 0]])
+    with pytest.raises(InvalidInputError):
+        nearest_band_indices(np.array([]), 500)
+
+
+def test_dtype_policy_native_keeps_integer_data():
+    array = np.random.default_rng(0).integers(0, 4096, (12, 10, 3)).astype(np.uint16)
+    spectral_image = SpectralImage.from_numpy(array)
+
+    assert spectral_image.dtype_policy == "native"
+    assert spectral_image.dtype == np.uint16
+    assert spectral_image.to_numpy().dtype == np.uint16
+    assert spectral_image.read_window(slice(0, 4), slice(0, 4)).dtype == np.uint16
+    assert all(tile.dtype == np.uint16 for _, tile in spectral_image.iter_tiles(5))
+
+    subarray = spectral_image.to_subarray([(1, 2), (3, 4)])
+    assert isinstance(subarray, np.ma.MaskedArray)
+    assert subarray.dtype == np.uint16
+    np.testing.assert_array_equal(
+        subarray.mask[:, :, 0], [[False, True, True], [True, True, True], [True, True, False]]
+    )
+    np.testing.assert_array_equal(subarray[2, 2], array[4, 3])
+
+
+@pytest.mark.parametrize("dtype_policy", ["float32", "float64"])
+def test_dtype_policy_float(dtype_policy):
+    array = np.random.default_rng(0).integers(0, 4096, (12, 10, 3)).astype(np.uint16)
+    spectral_image = SpectralImage.from_numpy(array, dtype_policy=dtype_policy)
+
+    assert spectral_image.dtype == np.dtype(dtype_policy)
+    assert spectral_image.to_numpy().dtype == dtype_policy
+    assert spectral_image.read_window(slice(0, 4), slice(0, 4)).dtype == dtype_policy
+    assert spectral_image.to_signatures([(1, 2)]).signals.to_numpy().dtype == dtype_policy
+    subarray = spectral_image.to_subarray([(1, 2), (3, 4)])
+    assert subarray.dtype == dtype_policy
+    assert np.isnan(subarray[0, 1]).all()
+    np.testing.assert_array_equal(spectral_image.to_numpy(), array)
+
+
+def test_dtype_policy_float32_image_is_not_upcast():
+    spectral_image = SpectralImage.from_numpy(np.ones((4, 4, 2), dtype=np.float32))
+
+    assert spectral_image.to_subarray([(0, 0), (2, 2)]).dtype == np.float32
+    assert spectral_image.with_dtype_policy("float64").to_numpy().dtype == np.float64
+    with pytest.raises(InvalidInputError):
+        SpectralImage.from_numpy(np.ones((4, 4, 2)), dtype_policy="int8")
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from siapy.core.exceptions import InvalidInputError
+from siapy.entities.images.statistics import BandStatistics
+
+
+def test_from_array_float_with_nan():
+    array = np.random.default_rng(0).random((10, 8, 3)).astype(np.float32)
+    array[2, 3, 0] = np.nan
+    array[:, :, 2] = np.nan
+
+    stats = BandStatistics.from_array(array)
+
+    flat = array.reshape(-1, 3).astype(np.float64)
+    assert stats.count.tolist() == [79, 80, 0]
+    assert stats.nan_count.tolist() == [1, 0, 80]
+    np.testing.assert_allclose(stats.mean[:2], np.nanmean(flat[:, :2], axis=0))
+    np.testing.assert_allclose(stats.variance[:2], np.nanvar(flat[:, :2], axis=0))
+    np.testing.assert_allclose(stats.min[:2], np.nanmin(flat[:, :2], axis=0))
+    np.testing.assert_allclose(stats.max[:2], np.nanmax(flat[:, :2], axis=0))
+    assert np.isnan(stats.mean[2]) and np.isnan(stats.variance[2]) and np.isnan(stats.min[2])
+
+
+def test_from_array_integer():
+    array = np.arange(24, dtype=np.uint16).reshape(4, 2, 3)
+
+    stats = BandStatistics.from_array(array)
+
+    assert stats.count.tolist() == [8, 8, 8]
+    np.testing.assert_allclose(stats.variance, array.reshape(-1, 3).var(axis=0))
+    assert stats.min.tolist() == [0, 1, 2]
+    assert stats.max.tolist() == [21, 22, 23]
+
+
+def test_merge_matches_single_pass():
+    array = np.random.default_rng(1).normal(1000.0, 5.0, (30, 6, 4))
+    array[array > 1008] = np.nan
+
+    merged = BandStatistics.empty(4)
+    for start in range(0, 30, 7):
+        merged = merged.update(array[start : start + 7])
+    single = BandStatistics.from_array(array)
+
+    np.testing.assert_array_equal(merged.count, single.count)
+    np.testing.assert_array_equal(merged.nan_count, single.nan_count)
+    np.testing.assert_allclose(merged.mean, single.mean)
+    np.testing.assert_allclose(merged.variance, single.variance)
+    np.testing.assert_allclose(merged.std, np.sqrt(single.variance))
+    np.testing.assert_array_equal(merged.min, single.min)
+    np.testing.assert_array_equal(merged.max, single.max)
+
+
+def test_merge_band_mismatch():
+    with pytest.raises(InvalidInputError):
+        BandStatistics.empty(3).merge(BandStatistics.empty(4))
@@ -0,0 +1,135 @@
+import os
+
+import numpy as np
+import pytest
+import spectral as sp
+
+from siapy.core.exceptions import InvalidInputError
+from siapy.entities.images.mock import MockImage
+from siapy.entities.images.spectral_lib import SpectralLibImage
+from siapy.entities.images.validity import (
+    ValidMask,
+    build_valid_mask,
+    load_valid_mask,
+    pixel_valid_mask,
+    save_valid_mask,
+    valid_mask_path,
+)
+
+
+@pytest.fixture
+def array():
+    array = np.random.default_rng(0).random((21, 13, 4)).astype(np.float32)
+    array[:5, :6] = np.nan
+    array[10, 11, 2] = np.nan
+    return array
+
+
+@pytest.fixture
+def envi_image(tmp_path, array):
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array)
+    return SpectralLibImage.open(header_path=header_path)
+
+
+def test_valid_mask(array):
+    expected = ~np.isnan(array).any(axis=2)
+
+    mask = ValidMask.from_array(expected)
+
+    assert mask.shape == (21, 13)
+    assert mask.nbytes == 21 * 2
+    assert mask.count == expected.sum()
+    assert mask.valid_fraction == pytest.approx(expected.mean())
+    assert mask.background_percentage == pytest.approx((1 - expected.mean()) * 100)
+    np.testing.assert_array_equal(mask.to_numpy(), expected)
+    np.testing.assert_array_equal(mask.window(slice(3, 12), slice(4, None, 3)), expected[3:12, 4::3])
+    assert not mask.any(slice(0, 5), slice(0, 6))
+    assert mask.any(slice(0, 6), slice(0, 6))
+    rows, cols = np.nonzero(np.ones((21, 13)))
+    np.testing.assert_array_equal(mask.at(rows, cols), expected[rows, cols])
+    with pytest.raises(InvalidInputError):
+        ValidMask.from_array(expected[0])
+
+
+def test_pixel_valid_mask(array):
+    np.testing.assert_array_equal(pixel_valid_mask(array), ~np.isnan(array).any(axis=2))
+    assert pixel_valid_mask(np.zeros((3, 2, 4), dtype=np.uint16)).all()
+
+    masked = np.ma.masked_all((3, 2, 4), dtype=np.uint16)
+    masked[:2] = 1
+    np.testing.assert_array_equal(pixel_valid_mask(masked), [[True, True], [True, True], [False, False]])
+
+
+@pytest.mark.parametrize("strip_rows", [1, 4, 100])
+def test_build_valid_mask(array, strip_rows):
+    mask = build_valid_mask(MockImage(array), strip_rows)
+
+    np.testing.assert_array_equal(mask.to_numpy(), ~np.isnan(array).any(axis=2))
+    with pytest.raises(InvalidInputError):
+        build_valid_mask(MockImage(array), 0)
+
+
+def test_build_valid_mask_integer_image(mocker):
+    image = MockImage(np.ones((5, 9, 2), dtype=np.uint16))
+    read_window = mocker.spy(image, "read_window")
+
+    mask = build_valid_mask(image, 2)
+
+    read_window.assert_not_called()
+    assert mask.count == 45
+
+
+def test_save_and_load_valid_mask(envi_image, array):
+    mask = build_valid_mask(envi_image, 8)
+
+    path = save_valid_mask(mask, envi_image)
+    loaded = load_valid_mask(envi_image)
+
+    assert path == envi_image.filepath.with_name(envi_image.filepath.name + ".valid.npz")
+    assert loaded.shape == (21, 13)
+    np.testing.assert_array_equal(loaded.to_numpy(), ~np.isnan(array).any(axis=2))
+
+
+def test_load_valid_mask_stale(envi_image):
+    save_valid_mask(build_valid_mask(envi_image, 8), envi_image)
+    stat = envi_image.filepath.stat()
+
+    os.utime(envi_image.filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert load_valid_mask(envi_image) is None
+
+
+def test_valid_mask_cache_dir(envi_image, tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    path = save_valid_mask(build_valid_mask(envi_image, 8), envi_image, cache_dir)
+
+    assert path == valid_mask_path(envi_image.filepath, cache_dir)
+    assert path.parent == cache_dir
+    assert load_valid_mask(envi_image, cache_dir) is not None
+    assert load_valid_mask(envi_image) is None
+
+
+def test_spectral_lib_remove_nan_uses_stored_mask(tmp_path, envi_image, array, mocker):
+    expected = np.where(np.isnan(array).any(axis=2, keepdims=True), 0.0, array)
+    save_valid_mask(build_valid_mask(envi_image, 8), envi_image)
+    image = SpectralLibImage.open(header_path=tmp_path / "image.hdr")
+    remove_nan = mocker.spy(SpectralLibImage, "_remove_nan")
+
+    np.testing.assert_array_equal(image.to_numpy(nan_value=0.0), expected)
+
+    assert remove_nan.call_count > 0
+    assert all(call.args[3] is not None for call in remove_nan.call_args_list)
+
+
+def test_spectral_lib_band_subset_remove_nan(tmp_path, envi_image, array):
+    # pixel (10, 11) is NaN only in band 2, which is not selected
+    assert envi_image.to_numpy(nan_value=0.0, bands=[0, 1])[10, 11].tolist() == array[10, 11, :2].tolist()
+
+    save_valid_mask(build_valid_mask(envi_image, 8), envi_image)
+    image = SpectralLibImage.open(header_path=tmp_path / "image.hdr")
+
+    np.testing.assert_array_equal(
+        image.to_numpy(nan_value=0.0, bands=[0, 1]), image.to_numpy(nan_value=0.0)[:, :, [0, 1]]
+    )
@@ -1,8 +1,18 @@
+import os
+import pickle
+import threading
+import time
+
+import numpy as np
 import pytest
+import spectral as sp
 
-from siapy.core.exceptions import InvalidInputError
+from siapy.core.exceptions import InvalidFilepathError, InvalidInputError, ProcessingError
 from siapy.entities import SpectralImage, SpectralImageSet
+from siapy.entities.images import LazyImage
 from siapy.entities.images.rasterio_lib import RasterioLibImage
+from siapy.entities.images.spectral_lib import SpectralLibImage
+from siapy.utils.images import rasterio_save_image
 
 
 def test_spy_open_valid(configs):
@@ -120,3 +130,275 @@ def test_sort(configs):
     image_set = SpectralImageSet(unordered_set.copy())
     image_set.images.sort()
     assert image_set.images == ordered_set != unordered_set
+
+
+def test_band_statistics():
+    rng = np.random.default_rng(0)
+    arrays = [rng.random((6, 5, 3)), rng.random((4, 7, 3))]
+    image_set = SpectralImageSet([SpectralImage.from_numpy(array) for array in arrays])
+
+    stats = image_set.band_statistics(tile_shape=(2, 3))
+
+    flat = np.concatenate([array.reshape(-1, 3) for array in arrays])
+    assert stats.count.tolist() == [58, 58, 58]
+    np.testing.assert_allclose(stats.mean, flat.mean(axis=0))
+    np.testing.assert_allclose(stats.variance, flat.var(axis=0))
+    np.testing.assert_allclose(image_set.band_statistics(bands=[2]).max, flat[:, 2:].max(axis=0))
+
+
+def test_band_statistics_invalid():
+    with pytest.raises(InvalidInputError):
+        SpectralImageSet().band_statistics()
+    image_set = SpectralImageSet(
+        [SpectralImage.from_numpy(np.zeros((2, 2, 3))), SpectralImage.from_numpy(np.zeros((2, 2, 4)))]
+    )
+    with pytest.raises(InvalidInputError):
+        image_set.band_statistics()
+
+
+@pytest.fixture
+def header_paths(tmp_path):
+    rng = np.random.default_rng(0)
+    header_paths = []
+    for idx in range(5):
+        header_path = tmp_path / f"image_{idx}.hdr"
+        sp.envi.save_image(
+            header_path, rng.random((4, 3, 2)).astype(np.float32), metadata={"description": f"ID=cam{idx}"}
+        )
+        header_paths.append(header_path)
+    return header_paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_spy_open_max_workers(header_paths, max_workers):
+    image_set = SpectralImageSet.spy_open(header_paths=header_paths, max_workers=max_workers)
+
+    assert [image.camera_id for image in image_set] == ["cam0", "cam1", "cam2", "cam3", "cam4"]
+    assert image_set.open_errors == {}
+
+
+def test_spy_open_aggregates_errors(header_paths, tmp_path):
+    broken = tmp_path / "broken.hdr"
+    broken.write_text("not an ENVI header")
+    missing = tmp_path / "missing.hdr"
+    paths = [header_paths[0], broken, header_paths[1], missing]
+
+    with pytest.raises(ProcessingError, match="Failed to open 2 of 4 images"):
+        SpectralImageSet.spy_open(header_paths=paths, max_workers=2)
+
+    image_set = SpectralImageSet.spy_open(header_paths=paths, max_workers=2, on_error="skip")
+    assert [image.camera_id for image in image_set] == ["cam0", "cam1"]
+    assert list(image_set.open_errors) == [broken, missing]
+    assert isinstance(image_set.open_errors[missing], InvalidFilepathError)
+    with pytest.raises(InvalidInputError):
+        SpectralImageSet.spy_open(header_paths=paths, on_error="ignore")
+    with pytest.raises(InvalidInputError):
+        SpectralImageSet.spy_open(header_paths=paths, max_workers=0)
+
+
+def test_spy_open_lazy(header_paths, mocker):
+    open_spy = mocker.spy(SpectralLibImage, "open")
+    image_paths = [path.with_suffix(".img") for path in header_paths]
+
+    image_set = SpectralImageSet.spy_open(header_paths=header_paths, image_paths=image_paths, lazy=True)
+
+    assert len(image_set) == 5
+    assert [image.filepath for image in image_set] == image_paths
+    open_spy.assert_not_called()
+    assert image_set[3].camera_id == "cam3"
+    assert open_spy.call_count == 1
+    assert [image.image.loaded for image in image_set] == [False, False, False, True, False]
+
+
+def test_rasterio_open_lazy(tmp_path):
+    filepath = tmp_path / "image.tif"
+    rasterio_save_image(np.ones((4, 3, 2), dtype=np.float32), filepath)
+
+    missing = tmp_path / "missing.tif"
+
+    with pytest.raises(InvalidFilepathError):
+        SpectralImageSet.rasterio_open(filepaths=[filepath, missing], lazy=True)
+    image_set = SpectralImageSet.rasterio_open(filepaths=[filepath, missing], lazy=True, on_error="skip")
+
+    assert len(image_set) == 1
+    assert list(image_set.open_errors) == [missing]
+    assert isinstance(image_set[0].image, LazyImage)
+    assert image_set[0].shape == (4, 3, 2)
+    assert isinstance(image_set[0].image.image, RasterioLibImage)
+    with pytest.raises(InvalidInputError):
+        SpectralImageSet.rasterio_open(filepaths=[filepath], lazy=True, max_workers=0)
+
+
+def test_spy_open_lazy_derives_image_paths(header_paths, tmp_path, mocker):
+    open_spy = mocker.spy(SpectralLibImage, "open")
+    missing = tmp_path / "missing.hdr"
+
+    image_set = SpectralImageSet.spy_open(
+        header_paths=[*header_paths, missing], lazy=True, max_workers=2, on_error="skip"
+    )
+
+    assert [image.filepath for image in image_set] == [path.with_suffix(".img") for path in header_paths]
+    image_set.sort(reverse=True)
+    assert image_set[0].filepath == header_paths[-1].with_suffix(".img")
+    assert isinstance(image_set.open_errors[missing], InvalidFilepathError)
+    open_spy.assert_not_called()
+    assert image_set[0].filepath == image_set[0].image.image.filepath
+
+
+def test_spy_open_single_error_keeps_its_type(header_paths, tmp_path, mocker):
+    with pytest.raises(InvalidFilepathError):
+        SpectralImageSet.spy_open(header_paths=[header_paths[0], tmp_path / "missing.hdr"])
+
+    def open_image(*, header_path, image_path):
+        if header_path == header_paths[1]:
+            raise OSError("read error")
+        return SpectralImage(SpectralLibImage.open(header_path=header_path, image_path=image_path))
+
+    mocker.patch.object(SpectralImage, "spy_open", side_effect=open_image)
+    with pytest.raises(OSError, match="read error"):
+        SpectralImageSet.spy_open(header_paths=header_paths)
+    image_set = SpectralImageSet.spy_open(header_paths=header_paths, on_error="skip")
+    assert len(image_set) == 4
+    assert isinstance(image_set.open_errors[header_paths[1]], OSError)
+
+
+@pytest.fixture
+def camera_image_set(tmp_path):
+    images = []
+    for idx, (camera, bands) in enumerate([("vnir", 3), ("swir", 2), ("vnir", 3), ("swir", 4), ("vnir", 2)]):
+        header_path = tmp_path / camera / f"{camera}_{idx}.hdr"
+        header_path.parent.mkdir(exist_ok=True)
+        sp.envi.save_image(
+            header_path,
+            np.zeros((4, 3, bands), dtype=np.float32),
+            metadata={"description": f"ID={camera}", "wavelength": [500 + 10 * band for band in range(bands)]},
+        )
+        images.append(SpectralImage.spy_open(header_path=header_path))
+    return SpectralImageSet(list(images)), images
+
+
+def test_query(camera_image_set):
+    image_set, images = camera_image_set
+
+    assert sorted(image_set.cameras_id) == ["swir", "vnir"]
+    assert image_set.images_by_camera_id("vnir") == [images[0], images[2], images[4]]
+    assert image_set.query(camera_id="vnir", bands=3).images == [images[0], images[2]]
+    assert image_set.query(shape=[4, 3, 2]).images == [images[1], images[4]]
+    assert image_set.query(wavelengths=[500, 510]).images == [images[1], images[4]]
+    assert image_set.query(path_glob="swir/*.img").images == [images[1], images[3]]
+    assert image_set.query(stem="vnir_2").images == [images[2]]
+    assert image_set.query(camera_id="nir").images == []
+    assert image_set.query().images == images
+    assert len(image_set) == 5
+
+
+def test_query_indexes_follow_mutations(camera_image_set, mocker):
+    image_set, images = camera_image_set
+    image_set.query(camera_id="vnir")
+    camera_id = mocker.MagicMock(side_effect=SpectralImage.camera_id.fget)
+    mocker.patch.object(SpectralImage, "camera_id", property(camera_id))
+
+    assert len(image_set.query(camera_id="vnir")) == 3
+    image_set.append(images[0])
+    assert len(image_set.query(camera_id="vnir")) == 4
+    assert camera_id.call_count == 1
+    image_set.images.pop()
+    assert len(image_set.query(camera_id="vnir")) == 3
+    image_set.sort(key=lambda image: image.filepath.stem, reverse=True)
+    assert image_set.images_by_camera_id("vnir") == [images[4], images[2], images[0]]
+    image_set.images[0] = images[1]
+    assert image_set.images_by_camera_id("vnir") == [images[2], images[0]]
+    assert image_set.query(camera_id="swir").images == [images[1], images[3], images[1]]
+    image_set.images.reverse()
+    assert image_set.images_by_camera_id("vnir") == [images[0], images[2]]
+    image_set.images[1:3] = []
+    del image_set.images[0]
+    image_set.images.extend([images[2]])
+    assert image_set.images_by_camera_id("vnir") == [images[2], images[2]]
+    calls = camera_id.call_count
+    image_set.images_by_camera_id("swir")
+    image_set.query(camera_id="vnir")
+    assert camera_id.call_count == calls
+
+
+def _image_sum(image):
+    return float(image.to_numpy().sum())
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_map(header_paths, executor):
+    image_set = SpectralImageSet.spy_open(header_paths=header_paths)
+    expected = [float(image.to_numpy().sum()) for image in image_set]
+
+    assert image_set.map(_image_sum, executor=executor) == expected
+    assert image_set.map(_image_sum, executor=executor, reduce=max) == max(expected)
+
+
+def test_map_memory_budget(header_paths, mocker):
+    mocker.patch("siapy.entities.imagesets.get_number_cpus", return_value=4)
+    image_set = SpectralImageSet.spy_open(header_paths=header_paths)
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def func(image):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return image.camera_id
+
+    image_bytes = 4 * 3 * 2 * 4
+    assert image_set.map(func, max_inflight_bytes=2 * image_bytes) == [f"cam{idx}" for idx in range(5)]
+    assert peak[0] == 2
+    peak[0] = 0
+    assert image_set.map(func, max_inflight_bytes=1) == [f"cam{idx}" for idx in range(5)]
+    assert peak[0] == 1
+
+
+def test_map_invalid(header_paths):
+    image_set = SpectralImageSet.spy_open(header_paths=header_paths)
+
+    with pytest.raises(InvalidInputError):
+        image_set.map(_image_sum, executor="cluster")
+    with pytest.raises(InvalidInputError):
+        image_set.map(_image_sum, max_inflight_bytes=0)
+    with pytest.raises(InvalidInputError):
+        SpectralImageSet().map(_image_sum, reduce=max)
+    assert SpectralImageSet().map(_image_sum) == []
+
+
+def test_images_pickle_for_worker_processes(header_paths):
+    images = [
+        SpectralImage.spy_open(header_path=header_paths[0]),
+        SpectralImageSet.spy_open(header_paths=header_paths[:1], lazy=True)[0],
+    ]
+
+    for image in images:
+        copy = pickle.loads(pickle.dumps(image))
+        np.testing.assert_array_equal(copy.to_numpy(), image.to_numpy())
+        assert copy.filepath == image.filepath
+
+
+def test_build_catalog_and_from_catalog(header_paths, tmp_path, mocker):
+    image_set = SpectralImageSet.spy_open(header_paths=header_paths)
+    catalog_path = image_set.build_catalog(tmp_path / "catalog.parquet")
+    stat = image_set[2].filepath.stat()
+    os.utime(image_set[2].filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    header_paths[4].unlink()
+    spy_open = mocker.spy(SpectralLibImage, "open")
+
+    with pytest.raises(InvalidFilepathError):
+        SpectralImageSet.from_catalog(catalog_path)
+    cataloged = SpectralImageSet.from_catalog(catalog_path, on_error="skip")
+
+    assert [image.camera_id for image in cataloged] == ["cam0", "cam1", "cam2", "cam3"]
+    assert [image.shape for image in cataloged] == [(4, 3, 2)] * 4
+    assert isinstance(cataloged[0].image, LazyImage)
+    assert not cataloged[0].image.loaded
+    assert isinstance(cataloged[2].image, SpectralLibImage)
+    assert list(cataloged.open_errors) == [header_paths[4].absolute()]
+    assert spy_open.call_count == 4
+    np.testing.assert_array_equal(cataloged[1].to_numpy(), image_set[1].to_numpy())
@@ -1,4 +1,5 @@
 import os
+import pickle
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -86,13 +87,15 @@ def test_equality():
 def test_from_iterable():
     pixels = Pixels.from_iterable(iterable)
     assert isinstance(pixels, Pixels)
-    assert pixels.df.equals(pd.DataFrame(iterable, columns=[Pixels.coords.X, Pixels.coords.Y]))
+    assert pixels.dtype == np.int32
+    assert pixels.df.equals(pd.DataFrame(iterable, columns=[Pixels.coords.X, Pixels.coords.Y]).astype(np.int32))
 
 
 def test_df():
     df = pd.DataFrame(iterable, columns=["x", "y"])
     pixels = Pixels(df)
-    assert pixels.df.equals(df)
+    assert pixels.dtype == np.int32
+    assert pixels.df.equals(df.astype(np.int32))
 
 
 def test_df_homogenious():
@@ -103,21 +106,21 @@ def test_df_homogenious():
         pd.DataFrame(
             iterable_homo,
             columns=[Pixels.coords.X, Pixels.coords.Y, Pixels.coords.H],
-        )
+        ).astype({Pixels.coords.X: np.int32, Pixels.coords.Y: np.int32})
     )
 
 
 def test_u():
     df = pd.DataFrame(iterable, columns=[Pixels.coords.X, Pixels.coords.Y])
     pixels = Pixels(df)
-    expected_x = pd.Series([1, 3, 5], name=Pixels.coords.X)
+    expected_x = pd.Series([1, 3, 5], name=Pixels.coords.X, dtype=np.int32)
     assert pixels.x().equals(expected_x)
 
 
 def test_v():
     df = pd.DataFrame(iterable, columns=[Pixels.coords.X, Pixels.coords.Y])
     pixels = Pixels(df)
-    expected_y = pd.Series([2, 4, 6], name=Pixels.coords.Y)
+    expected_y = pd.Series([2, 4, 6], name=Pixels.coords.Y, dtype=np.int32)
     assert pixels.y().equals(expected_y)
 
 
@@ -245,7 +248,7 @@ def test_validate_pixel_input():
     valid_df = pd.DataFrame(iterable, columns=[HomogeneousCoordinate.X, HomogeneousCoordinate.Y])
     result_df_pixels = validate_pixel_input(valid_df)
     assert isinstance(result_df_pixels, Pixels)
-    assert result_df_pixels.df.equals(valid_df)
+    assert result_df_pixels.df.equals(valid_df.astype(np.int32))
 
     # Test with valid numpy array
     valid_array = np.array(iterable)
@@ -282,3 +285,86 @@ def test_validate_pixel_input():
     assert "Invalid column names" in str(exc_info.value)
 
     # TODO: test for iterable incorrect
+
+
+def test_from_numpy_fast_path(mocker):
+    data_frame = mocker.spy(pd, "DataFrame")
+
+    pixels = Pixels.from_numpy(np.array(iterable, dtype=np.int64))
+
+    data_frame.assert_not_called()
+    assert pixels.dtype == np.int32
+    assert len(pixels) == 3
+    np.testing.assert_array_equal(pixels.x_array, [1, 3, 5])
+    np.testing.assert_array_equal(pixels.y_array, [2, 4, 6])
+    assert pixels.x_array.flags.c_contiguous
+    assert Pixels.from_numpy(np.array([[2**40, 1]])).dtype == np.int64
+    assert Pixels.from_numpy(np.array([[1.5, 2.5]])).dtype == np.float64
+    with pytest.raises(InvalidInputError):
+        Pixels.from_numpy(np.empty((0, 2), dtype=np.int32))
+    with pytest.raises(InvalidInputError):
+        Pixels.from_numpy(np.zeros((3, 3)))
+
+
+def test_df_is_lazy_view():
+    pixels = Pixels.from_numpy(np.array(iterable))
+    assert not hasattr(pixels, "__dict__")
+    assert pixels._df is None
+
+    df = pixels.df
+    df.loc[0, "x"] = 10
+
+    assert pixels.df is df
+    assert pixels.get_coordinate(0) == PixelCoordinate(x=10, y=2)
+
+
+def test_df_edits_are_taken_over():
+    pixels = Pixels.from_iterable(iterable)
+
+    pixels.df["x"] = [7, 8, 9]
+    assert pixels.x_array.tolist() == [7, 8, 9]
+    assert pixels.to_numpy().tolist() == [[7, 2], [8, 4], [9, 6]]
+    assert pixels.dtype == np.int32
+
+    pixels.df.drop(index=1, inplace=True)
+    assert len(pixels) == 2
+    assert pixels.y_array.tolist() == [2, 6]
+    assert pixels.x().index.tolist() == [0, 2]
+
+    pixels.df.index = [5, 6]
+    assert pixels[1].df.index.tolist() == [6]
+    assert pixels == Pixels(pd.DataFrame({"x": [7, 9], "y": [2, 6]}, index=[5, 6]))
+
+
+def test_integer_coordinates_stored_as_int32():
+    df = pd.DataFrame(iterable, columns=["x", "y"], dtype=np.int64)
+
+    assert Pixels(df).dtype == np.int32
+    assert Pixels.from_iterable(iterable).dtype == np.int32
+    assert Pixels.from_iterable([(1.5, 2.0)]).dtype == np.float64
+    assert Pixels(pd.DataFrame({"x": [2**40], "y": [0]})).dtype == np.int64
+    assert Pixels(df).x_array.flags.c_contiguous
+
+
+def test_dataframe_input_keeps_index_and_column_order():
+    df = pd.DataFrame({"y": [2, 4, 6], "x": [1, 3, 5]}, index=[7, 8, 9])
+
+    pixels = Pixels(df)
+
+    assert list(pixels.df.columns) == ["x", "y"]
+    assert pixels.df.index.tolist() == [7, 8, 9]
+    assert pixels[1].df.index.tolist() == [8]
+    assert pixels[[0, 2]].x().tolist() == [1, 5]
+    assert pixels == Pixels(df[["x", "y"]])
+    assert pixels != Pixels(df.reset_index(drop=True))
+
+
+def test_pickle():
+    pixels = Pixels(pd.DataFrame(iterable, columns=["x", "y"], index=[3, 4, 5]))
+
+    assert pickle.loads(pickle.dumps(pixels)) == pixels
+
+
+def test_from_iterable_empty():
+    with pytest.raises(InvalidInputError, match="empty"):
+        Pixels.from_iterable([])
@@ -1,4 +1,5 @@
 import os
+import pickle
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -128,6 +129,81 @@ def test_validate_signal_input():
         validate_signal_input(BadIterable())
 
 
+def test_signals_from_numpy(mocker):
+    array = np.arange(12, dtype=np.float32).reshape(4, 3)
+    data_frame = mocker.spy(pd, "DataFrame")
+
+    signals = Signals.from_numpy(array, wavelengths=[500, 600, 700])
+
+    data_frame.assert_not_called()
+    assert signals.dtype == np.float32
+    assert np.shares_memory(signals.to_numpy(), array)
+    np.testing.assert_array_equal(signals.average_signal(), array.mean(axis=0))
+    assert signals[1:3].wavelengths.tolist() == [500.0, 600.0, 700.0]
+    assert Signals.from_numpy(array[0]).to_numpy().shape == (1, 3)
+    with pytest.raises(InvalidInputError):
+        Signals.from_numpy(array, wavelengths=[500, 600])
+    with pytest.raises(InvalidInputError):
+        Signals.from_numpy(np.zeros((2, 2, 2)))
+
+
+def test_signals_df_is_lazy_view():
+    signals = Signals.from_numpy(np.zeros((2, 3)))
+    assert not hasattr(signals, "__dict__")
+
+    signals.df.loc[1, 2] = 5.0
+
+    assert signals.to_numpy()[1, 2] == 5.0
+    assert np.shares_memory(signals.df.to_numpy(), signals.to_numpy())
+
+
+def test_signals_equality_and_pickle():
+    signals = Signals(pd.DataFrame([[1.0, np.nan], [3.0, 4.0]], index=[5, 6], columns=["a", "b"]), [1.0, 2.0])
+
+    assert signals == pickle.loads(pickle.dumps(signals))
+    assert signals.wavelengths.tolist() == [1.0, 2.0]
+    assert signals[0].df.equals(pd.DataFrame([[1.0, np.nan]], index=[5], columns=["a", "b"], dtype="float32"))
+    assert signals != Signals(signals.df.reset_index(drop=True))
+    assert signals != "not signals"
+
+
+def test_signals_store_floats_as_float32():
+    array = np.arange(6, dtype=np.float64).reshape(2, 3)
+
+    assert Signals.from_numpy(array).dtype == np.float32
+    assert Signals(pd.DataFrame(array)).dtype == np.float32
+    assert Signals.from_numpy(array, float_dtype=None).dtype == np.float64
+    assert Signals.from_numpy(array, float_dtype=np.float64).dtype == np.float64
+    assert Signals.from_numpy(array.astype(np.uint16)).dtype == np.uint16
+
+    pixels = Pixels.from_iterable([(0, 0), (1, 1)])
+    cube = np.zeros((2, 2, 3), dtype=np.float64)
+    assert Signatures.from_array_and_pixels(cube, pixels).signals.dtype == np.float32
+    assert Signatures.from_array_and_pixels(cube, pixels, float_dtype=None).signals.dtype == np.float64
+
+
+def test_signals_df_edits_are_taken_over():
+    signals = Signals.from_numpy(np.arange(6, dtype=np.float32).reshape(3, 2), [1.0, 2.0])
+
+    signals.df[0] = np.array([7.0, 8.0, 9.0], dtype=np.float32)
+    assert signals.to_numpy()[:, 0].tolist() == [7.0, 8.0, 9.0]
+    assert signals.dtype == np.float32
+
+    signals.df.drop(index=1, inplace=True)
+    assert len(signals) == 2
+    assert signals.to_numpy().tolist() == [[7.0, 1.0], [9.0, 5.0]]
+    assert signals.wavelengths.tolist() == [1.0, 2.0]
+
+    signals.df.index = [5, 6]
+    signals.df.columns = ["a", "b"]
+    assert signals[1].df.index.tolist() == [6]
+    assert signals == Signals(pd.DataFrame([[7.0, 1.0], [9.0, 5.0]], index=[5, 6], columns=["a", "b"]))
+
+    signals.df["c"] = [0.0, 0.0]
+    assert signals.to_numpy().shape == (2, 3)
+    assert signals.wavelengths is None
+
+
 def test_signals_array_interface():
     """Test the NumPy array interface (__array__ method) for Signals."""
     signals_data = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]
@@ -184,21 +260,21 @@ def test_signatures_getitem():
     single_sig = signatures[1]
     assert isinstance(single_sig, Signatures)
     assert len(single_sig) == 1
-    assert single_sig.pixels.df.equals(pd.DataFrame({"x": [1], "y": [1]}, index=[1]))
+    assert single_sig.pixels.df.equals(pd.DataFrame({"x": [1], "y": [1]}, index=[1]).astype(np.int32))
     assert single_sig.signals.df.equals(pd.DataFrame([[3, 4]], index=[1]))
 
     # Slice access
     sliced_sig = signatures[1:3]
     assert isinstance(sliced_sig, Signatures)
     assert len(sliced_sig) == 2
-    assert sliced_sig.pixels.df.equals(pd.DataFrame({"x": [1, 2], "y": [1, 2]}, index=[1, 2]))
+    assert sliced_sig.pixels.df.equals(pd.DataFrame({"x": [1, 2], "y": [1, 2]}, index=[1, 2]).astype(np.int32))
     assert sliced_sig.signals.df.equals(pd.DataFrame([[3, 4], [5, 6]], index=[1, 2]))
 
     # List access
     list_sig = signatures[[0, 3]]
     assert isinstance(list_sig, Signatures)
     assert len(list_sig) == 2
-    assert list_sig.pixels.df.equals(pd.DataFrame({"x": [0, 3], "y": [0, 3]}, index=[0, 3]))
+    assert list_sig.pixels.df.equals(pd.DataFrame({"x": [0, 3], "y": [0, 3]}, index=[0, 3]).astype(np.int32))
     assert list_sig.signals.df.equals(pd.DataFrame([[1, 2], [7, 8]], index=[0, 3]))
 
 
@@ -264,7 +340,7 @@ def test_signatures_from_dict():
 
     assert isinstance(signatures, Signatures)
     assert len(signatures) == 3
-    assert signatures.pixels.df.equals(pd.DataFrame({"x": [0, 1, 2], "y": [3, 4, 5]}))
+    assert signatures.pixels.df.equals(pd.DataFrame({"x": [0, 1, 2], "y": [3, 4, 5]}, dtype=np.int32))
     assert signatures.signals.df.equals(pd.DataFrame({"0": [10, 20, 30], "1": [40, 50, 60]}))
 
 
@@ -312,7 +388,7 @@ def test_signatures_from_signals_and_pixels():
     # Test with DataFrames
     signatures = Signatures.from_signals_and_pixels(signals_df, pixels_df)
     assert isinstance(signatures, Signatures)
-    assert signatures.pixels.df.equals(pixels_df)
+    assert signatures.pixels.df.equals(pixels_df.astype(np.int32))
     assert signatures.signals.df.equals(signals_df)
 
     # Test with numpy arrays
@@ -340,7 +416,7 @@ def test_signatures_from_signals_and_pixels():
 def test_signatures_from_dataframe():
     df = pd.DataFrame({"x": [0, 1], "y": [0, 1], "0": [1, 2], "1": [3, 4]})
     signatures = Signatures.from_dataframe(df)
-    expected_pixels_df = pd.DataFrame({"x": [0, 1], "y": [0, 1]})
+    expected_pixels_df = pd.DataFrame({"x": [0, 1], "y": [0, 1]}, dtype=np.int32)
     expected_signals_df = pd.DataFrame({"0": [1, 2], "1": [3, 4]})
 
     assert signatures.pixels.df.equals(expected_pixels_df)
@@ -400,7 +476,7 @@ def test_to_dataframe():
     pixels = Pixels(pixels_df)
     signals = Signals(signals_df)
     signatures = Signatures(pixels, signals)
-    assert signatures.to_dataframe().equals(pd.concat([pixels_df, signals_df], axis=1))
+    assert signatures.to_dataframe().equals(pd.concat([pixels_df.astype(np.int32), signals_df], axis=1))
 
 
 def test_to_numpy():
@@ -487,3 +563,57 @@ def test_signatures_copy():
     assert original.signals.df.loc[0, "A"] == 10  # Original should be unchanged
     assert copied.pixels.df.loc[0, "x"] == 999  # Copy should be changed
     assert copied.signals.df.loc[0, "A"] == 888  # Copy should be changed
+
+
+def test_signatures_concat():
+    first = Signatures.from_array_and_pixels(
+        np.arange(12, dtype=np.float32).reshape(2, 2, 3), Pixels.from_iterable([(0, 0), (1, 1)])
+    )
+    second = Signatures.from_array_and_pixels(
+        np.arange(12, 24, dtype=np.float32).reshape(2, 2, 3), Pixels.from_iterable([(0, 1)])
+    )
+    first.signals._wavelengths = second.signals._wavelengths = np.array([400.0, 500.0, 600.0])
+
+    concatenated, source_ids = Signatures.concat([first, second[[]], second], return_source_ids=True)
+
+    assert len(concatenated) == 3
+    assert concatenated.signals.dtype == np.float32
+    np.testing.assert_array_equal(
+        concatenated.signals.to_numpy(), np.vstack([first.signals.to_numpy(), second.signals.to_numpy()])
+    )
+    np.testing.assert_array_equal(concatenated.pixels.to_numpy(), [[0, 0], [1, 1], [0, 1]])
+    np.testing.assert_array_equal(source_ids, [0, 0, 2])
+    assert source_ids.dtype == np.int32
+    np.testing.assert_array_equal(concatenated.signals.wavelengths, [400.0, 500.0, 600.0])
+
+    # differing wavelengths are dropped
+    second.signals._wavelengths = np.array([1.0, 2.0, 3.0])
+    assert Signatures.concat([first, second]).signals.wavelengths is None
+
+
+def test_signatures_concat_differing_bands():
+    first = Signatures.from_signals_and_pixels(np.array([[1, 2]]), Pixels.from_iterable([(0, 0)]))
+    second = Signatures.from_signals_and_pixels(np.array([[3, 4, 5]]), Pixels.from_iterable([(1, 0)]))
+
+    concatenated = Signatures.concat([first, second])
+
+    expected = pd.concat([first.to_dataframe(), second.to_dataframe()], ignore_index=True)
+    pd.testing.assert_frame_equal(concatenated.to_dataframe(), expected, check_dtype=False)
+
+
+def test_signatures_concat_empty():
+    with pytest.raises(InvalidInputError):
+        Signatures.concat([])
+
+
+def test_signatures_mean():
+    signatures = Signatures.from_signals_and_pixels(
+        np.array([[1, 2], [3, 4]], dtype=np.uint16), Pixels.from_iterable([(0, 0), (1, 2)])
+    )
+
+    mean = signatures.mean()
+
+    np.testing.assert_array_equal(mean.pixels.to_numpy(), [[0.5, 1.0]])
+    np.testing.assert_array_equal(mean.signals.to_numpy(), [[2.0, 3.0]])
+    assert mean.signals.dtype == np.float32
+    assert np.isnan(signatures[[]].mean().signals.to_numpy()).all()
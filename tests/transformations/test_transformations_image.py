@@ -1,6 +1,9 @@
+import tracemalloc
+
 import numpy as np
 
 from siapy.transformations import image
+from siapy.utils.images import calculate_image_background_percentage
 
 
 def test_add_gaussian_noise(spectral_images):
@@ -44,3 +47,55 @@ def test_area_normalization(spectral_images):
     image_vnir = spectral_images.vnir
     normalized_image = image.area_normalization(image_vnir)
     assert normalized_image.shape == image_vnir.shape
+
+
+def test_transformations_keep_integer_dtype():
+    array = np.random.default_rng(0).integers(0, 4096, (20, 20, 3)).astype(np.uint16)
+
+    noisy = image.add_gaussian_noise(array, std=5.0)
+    rescaled = image.rescale(array, (10, 10))
+    rotated = image.random_rotation(array, 90)
+
+    assert noisy.dtype == np.uint16
+    assert rescaled.dtype == np.uint16
+    assert rotated.dtype == np.uint16
+    assert image.area_normalization(array).dtype == np.float32
+
+
+def test_transformations_keep_float32_dtype():
+    array = np.random.default_rng(0).random((20, 20, 3)).astype(np.float32)
+
+    assert image.add_gaussian_noise(array, std=0.1).dtype == np.float32
+    assert image.rescale(array, (10, 10)).dtype == np.float32
+    assert image.area_normalization(array).dtype == np.float32
+
+
+def test_transform_chain_peak_memory():
+    array = np.random.default_rng(0).random((400, 300, 10)).astype(np.float32)
+
+    tracemalloc.start()
+    try:
+        result = image.random_mirror(array)
+        result = image.random_crop(result, (350, 250))
+        result = image.random_mirror(result)
+        result = image.add_gaussian_noise(result, std=0.01)
+        background = calculate_image_background_percentage(result)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert background == 0
+    assert result.dtype == np.float32
+    # the only full-size allocation of the chain is the noisy result
+    assert peak < 2 * array.nbytes
+
+
+def test_random_crop_and_mirror_return_writable_copies():
+    array = np.random.default_rng(0).random((20, 15, 3)).astype(np.float32)
+    original = array.copy()
+
+    for result in (image.random_crop(array, (10, 8)), image.random_mirror(array)):
+        assert result.flags.writeable
+        assert not np.shares_memory(result, array)
+        result[:] = 0
+    np.testing.assert_array_equal(array, original)
@@ -6,6 +6,7 @@ from siapy.core.exceptions import (
     InvalidInputError,
     InvalidTypeError,
 )
+from siapy.entities import SpectralImage
 from siapy.utils.image_validators import (
     validate_image_size,
     validate_image_to_numpy,
@@ -77,3 +78,26 @@ def test_validate_image_size():
 
     with pytest.raises(InvalidInputError):
         validate_image_size((100, "150"))
+
+
+def test_validate_image_to_numpy_returns_read_only_view():
+    array = np.random.rand(10, 10, 5)
+
+    view = validate_image_to_numpy(array, copy=False)
+    copied = validate_image_to_numpy(array)
+
+    assert np.shares_memory(view, array)
+    assert not view.flags.writeable
+    assert array.flags.writeable
+    assert not np.shares_memory(copied, array)
+    assert copied.flags.writeable
+
+
+def test_validate_image_to_numpy_spectral_image_copy():
+    array = np.random.rand(10, 10, 5).astype(np.float32)
+    image = SpectralImage.from_numpy(array)
+
+    assert not validate_image_to_numpy(image, copy=False).flags.writeable
+    assert validate_image_to_numpy(image).flags.writeable
+    assert not validate_image_to_numpy_3channels(array[:, :, :3], copy=False).flags.writeable
+    assert validate_image_to_numpy_3channels(array[:, :, :3]).flags.writeable
@@ -5,18 +5,23 @@ from tempfile import TemporaryDirectory
 
 import numpy as np
 import pytest
+import rasterio
 import rioxarray  # noqa
 import spectral as sp
 
-from siapy.core.exceptions import InvalidInputError
+from siapy.core.exceptions import InvalidInputError, ProcessingError
 from siapy.entities import SpectralImage
-from siapy.entities.images import RasterioLibImage, SpectralLibImage
+from siapy.entities.images import ChunkedCubeImage, RasterioLibImage, SpectralLibImage
+from siapy.entities.images.validity import valid_mask_path
 from siapy.entities.shapes import Shape
 from siapy.utils.images import (
+    EnviWriter,
     blockfy_image,
     calculate_correction_factor,
     calculate_correction_factor_from_panel,
     calculate_image_background_percentage,
+    chunked_create_image,
+    chunked_save_image,
     convert_radiance_image_to_reflectance,
     rasterio_create_image,
     rasterio_save_image,
@@ -130,8 +135,8 @@ def test_merge_images_by_specter():
         def __init__(self, array: np.ndarray):
             self.array = array
 
-        def to_numpy(self) -> np.ndarray:
-            return self.array
+        def to_numpy(self, copy: bool = True) -> np.ndarray:
+            return self.array.copy() if copy else self.array
 
         @property
         def shape(self) -> tuple[int, int, int]:
@@ -323,6 +328,35 @@ def test_calculate_image_background_percentage_mixed_background():
     assert percentage == 100
 
 
+def test_calculate_image_background_percentage_spectral_image(mocker):
+    array = np.random.default_rng(0).random((40, 50, 3))
+    array[:10] = np.nan
+    image = SpectralImage.from_numpy(array)
+    to_numpy = mocker.spy(image.image, "to_numpy")
+
+    assert calculate_image_background_percentage(image) == pytest.approx(25.0)
+    assert calculate_image_background_percentage(image) == pytest.approx(25.0)
+    assert image.valid_mask().background_percentage == pytest.approx(25.0)
+    to_numpy.assert_not_called()
+
+
+def test_calculate_image_background_percentage_writes_no_mask(tmp_path, mocker):
+    array = np.random.default_rng(0).random((40, 50, 3)).astype(np.float32)
+    array[:10] = np.nan
+    header_path = tmp_path / "image.hdr"
+    sp.envi.save_image(header_path, array)
+    image = SpectralImage.spy_open(header_path=header_path)
+
+    assert calculate_image_background_percentage(image) == pytest.approx(25.0)
+    assert not valid_mask_path(image.filepath).exists()
+
+    image.valid_mask()
+    reopened = SpectralImage.spy_open(header_path=header_path)
+    read_window = mocker.spy(reopened.image, "read_window")
+    assert calculate_image_background_percentage(reopened) == pytest.approx(25.0)
+    read_window.assert_not_called()
+
+
 def test_blockfy_image():
     image = np.random.default_rng(0).random((100, 100, 3))
 
@@ -352,3 +386,192 @@ def test_blockfy_image():
         ]
     )
     np.testing.assert_array_almost_equal(reconstructed_image[: image.shape[0], : image.shape[1]], image)
+
+
+def test_blockfy_image_non_square():
+    image = np.random.default_rng(0).random((50, 30, 2))
+
+    blocks = blockfy_image(image, 20, 20)
+    spectral_blocks = blockfy_image(SpectralImage.from_numpy(image.astype(np.float32)), 20, 20)
+
+    assert len(blocks) == 6
+    assert all(block.shape == (20, 20, 2) for block in blocks)
+    np.testing.assert_array_equal(blocks[1][:, :10], image[:20, 20:])
+    assert np.isnan(blocks[5][10:]).all() and np.isnan(blocks[5][:, 10:]).all()
+    np.testing.assert_array_equal(blocks[5][:10, :10], image[40:, 20:])
+    assert len(spectral_blocks) == 6
+    for block, spectral_block in zip(blocks, spectral_blocks):
+        np.testing.assert_allclose(spectral_block, block, rtol=1e-6)
+
+
+def test_blockfy_image_blocks_are_writable():
+    image = np.random.default_rng(0).random((40, 40, 2)).astype(np.float32)
+    original = image.copy()
+
+    blocks = blockfy_image(image, 20, 20) + blockfy_image(SpectralImage.from_numpy(image), 20, 20)
+
+    for block in blocks:
+        assert block.flags.writeable
+        block[:] = 0
+    np.testing.assert_array_equal(image, original)
+
+
+def test_rasterio_save_image_tiled_compressed(tmp_path):
+    image = np.random.default_rng(0).random((100, 80, 3)).astype(np.float32)
+    save_path = tmp_path / "tiled.tif"
+
+    rasterio_save_image(
+        image, save_path, tiled=True, blocksize=32, compress="zstd", predictor=3, num_threads=2, overviews=(2, 4)
+    )
+
+    with rasterio.open(save_path) as src:
+        assert src.profile["tiled"]
+        assert (src.profile["blockxsize"], src.profile["blockysize"]) == (32, 32)
+        assert src.compression.value == "ZSTD"
+        assert src.overviews(1) == [2, 4]
+        np.testing.assert_array_equal(np.moveaxis(src.read(), 0, 2), image)
+
+
+def test_rasterio_save_image_cog(tmp_path):
+    image = np.random.default_rng(0).random((100, 80, 2)).astype(np.float32)
+    save_path = tmp_path / "cog.tif"
+
+    rasterio_save_image(image, save_path, cog=True, blocksize=32, metadata={"description": "cog"})
+
+    with rasterio.open(save_path) as src:
+        assert src.tags(ns="IMAGE_STRUCTURE")["LAYOUT"] == "COG"
+        assert src.compression.value == "DEFLATE"
+        assert src.overviews(1) == [2, 4]
+        assert src.tags()["description"] == "cog"
+        np.testing.assert_array_equal(np.moveaxis(src.read(), 0, 2), image)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cog.tif"]
+
+
+def test_rasterio_save_image_streams_spectral_image(tmp_path, mocker):
+    array = np.random.default_rng(0).random((40, 30, 3)).astype(np.float32)
+    image = SpectralImage.from_numpy(array)
+    mocker.patch("siapy.utils.images._WRITE_CHUNK_BYTES", 30 * 3 * 4 * 16)
+    to_numpy = mocker.spy(image, "to_numpy")
+    save_path = tmp_path / "streamed.tif"
+
+    rasterio_save_image(image, save_path, tiled=True, blocksize=16)
+
+    to_numpy.assert_not_called()
+    loaded = SpectralImage.rasterio_open(save_path)
+    np.testing.assert_array_equal(loaded.to_numpy(), array)
+
+
+def test_rasterio_create_image_streams_spectral_image(tmp_path, mocker):
+    array = np.random.default_rng(0).random((40, 30, 3)).astype(np.float32)
+    image = SpectralImage.from_numpy(array)
+    mocker.patch("siapy.utils.images._WRITE_CHUNK_BYTES", 30 * 3 * 4 * 16)
+    to_numpy = mocker.spy(image, "to_numpy")
+    read_window = mocker.spy(image.image, "read_window")
+
+    created = rasterio_create_image(image, tmp_path / "created.tif")
+
+    to_numpy.assert_not_called()
+    assert read_window.call_count == 3
+    np.testing.assert_array_equal(created.to_numpy(), array)
+
+
+@pytest.mark.parametrize("kwargs", [{"predictor": 4}, {"tiled": True, "blocksize": 20}])
+def test_rasterio_save_image_invalid_options(tmp_path, kwargs):
+    with pytest.raises(InvalidInputError):
+        rasterio_save_image(np.zeros((4, 4, 1)), tmp_path / "invalid.tif", **kwargs)
+
+
+@pytest.mark.parametrize("interleave", ["bip", "bil", "bsq"])
+def test_envi_writer_write_window(tmp_path, interleave):
+    array = np.random.default_rng(0).random((20, 15, 4)).astype(np.float32)
+    header_path = tmp_path / "written.hdr"
+
+    with EnviWriter(header_path, array.shape, metadata={"wavelength": [1, 2, 3, 4]}, interleave=interleave) as writer:
+        writer.write_window((slice(0, 10), slice(None)), array[:10])
+        writer.write_window((slice(10, 20), slice(0, 15)), array[10:, :, [0, 2]], bands=[0, 2])
+        writer.write_window((slice(10, 20), slice(0, 15)), array[10:, :, [1, 3]], bands=[1, 3])
+
+    loaded = SpectralImage.spy_open(header_path=header_path)
+    assert loaded.metadata["interleave"] == interleave
+    assert loaded.wavelengths == [1, 2, 3, 4]
+    np.testing.assert_array_equal(loaded.to_numpy(), array)
+
+
+def test_envi_writer_invalid(tmp_path):
+    writer = EnviWriter(tmp_path / "written.hdr", (4, 4, 2))
+    with pytest.raises(ProcessingError):
+        writer.write_window((slice(None), slice(None)), np.zeros((4, 4, 2)))
+    with writer, pytest.raises(InvalidInputError):
+        writer.write_window((slice(0, 2), slice(None)), np.zeros((4, 4, 2)))
+    with pytest.raises(InvalidInputError):
+        EnviWriter(tmp_path / "written.hdr", (4, 4, 2), overwrite=False).open()
+
+
+def test_spy_create_image_streams_spectral_image(tmp_path, mocker):
+    array = np.random.default_rng(0).random((30, 10, 3)).astype(np.float32)
+    image = SpectralImage.from_numpy(array)
+    mocker.patch("siapy.utils.images._WRITE_CHUNK_BYTES", 10 * 3 * 4 * 8)
+    to_numpy = mocker.spy(image, "to_numpy")
+    read_window = mocker.spy(image.image, "read_window")
+
+    created = spy_create_image(image, tmp_path / "created.hdr")
+
+    to_numpy.assert_not_called()
+    assert read_window.call_count == 4
+    np.testing.assert_array_equal(created.to_numpy(), array)
+
+
+def test_envi_writer_write_tiles(tmp_path):
+    array = np.random.default_rng(0).random((9, 7, 2)).astype(np.float32)
+    source = SpectralImage.from_numpy(array)
+
+    with EnviWriter(tmp_path / "tiles.hdr", source.shape, dtype=np.float64) as writer:
+        writer.write_tiles((window, tile * 2) for window, tile in source.iter_tiles(4))
+
+    loaded = SpectralImage.spy_open(header_path=tmp_path / "tiles.hdr")
+    np.testing.assert_array_equal(loaded.image.to_numpy(), array.astype(np.float64) * 2)
+
+
+def test_envi_writer_close_releases_file_handle(tmp_path):
+    array = np.random.default_rng(0).random((6, 5, 2)).astype(np.float32)
+
+    with EnviWriter(tmp_path / "closed.hdr", array.shape) as writer:
+        writer.write_window((slice(None), slice(None)), array)
+
+    assert writer.file.fid.closed
+    created = spy_create_image(array, tmp_path / "created.hdr")
+    assert created.image.closed
+    np.testing.assert_array_equal(created.to_numpy(), array)
+
+
+def test_chunked_create_image_from_geotiff(tmp_path):
+    array = np.random.default_rng(0).random((30, 20, 3)).astype(np.float32)
+    rasterio_save_image(array, tmp_path / "image.tif")
+    source = SpectralImage.rasterio_open(tmp_path / "image.tif")
+
+    created = chunked_create_image(source, tmp_path / "image.cube", chunks=(16, 16, 2), store="zlib")
+
+    assert isinstance(created.image, ChunkedCubeImage)
+    assert created.wavelengths == [1.0, 2.0, 3.0]
+    np.testing.assert_array_equal(created.to_numpy(), array)
+
+
+def test_chunked_save_image_array(tmp_path):
+    array = np.random.default_rng(0).random((10, 12, 4))
+
+    chunked_save_image(array, tmp_path / "image.cube", store="zlib")
+
+    loaded = SpectralImage.chunked_open(tmp_path / "image.cube")
+    assert loaded.image.dtype == np.float32
+    np.testing.assert_allclose(loaded.to_numpy(), array, rtol=1e-6)
+
+
+def test_blockfy_image_keeps_dtype():
+    float_blocks = blockfy_image(np.ones((30, 30, 2), dtype=np.float32), 20, 20)
+    integer_blocks = blockfy_image(SpectralImage.from_numpy(np.ones((30, 30, 2), dtype=np.uint16)), 20, 20)
+
+    assert all(block.dtype == np.float32 for block in float_blocks)
+    assert np.isnan(float_blocks[3][10:]).all()
+    assert all(block.dtype == np.uint16 for block in integer_blocks)
+    assert isinstance(integer_blocks[3], np.ma.MaskedArray)
+    assert integer_blocks[3].mask[10:].all() and not integer_blocks[3].mask[:10, :10].any()